@@ -0,0 +1,114 @@
+import math
+import time
+
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from cutils import TyreCrawler
+from cutils.response import Response
+
+from .metrics import Metrics
+from .fixtures import PAGE_SIZE
+
+# Define results path for each page kind
+PATHS = {
+    'html': '/search',
+    'json': '/api/search',
+    'js': '/inline/search',
+}
+
+
+# Define sample tyre crawler for the supplier stand-in (records metrics of every stage)
+class BenchmarkCrawler(TyreCrawler):
+    RETRIES = 3
+    BACKOFF = 0.01
+
+    def __init__(self, netloc: str, mode: str = 'html', metrics: Optional[Metrics] = None, images: bool = False) -> None:
+
+        # Validate options
+        if mode not in PATHS:
+            raise ValueError(f'Mode must be one of {tuple(PATHS)}: mode={mode}')
+
+        # Initialize superclass
+        super().__init__('benchmark', 'benchmark', netloc, 'http')
+
+        # Set options
+        self.mode = mode
+        self.metrics = Metrics() if metrics is None else metrics
+        self.fetch_images = images
+
+    def _fetch(self, term: str, quantity: int) -> Iterator[Dict[str, Any]]:
+
+        # Fetch pages until enough products were found
+        remaining = quantity
+        for page in range(math.ceil(quantity / PAGE_SIZE)):
+            response = self.get(f'{self.domain}{PATHS[self.mode]}', params={'term': term, 'page': page})
+            if response.status_code != 200:
+                continue
+
+            # Decode rows
+            with self.metrics.stage('decode'):
+                rows = self.rows(response)
+            if len(rows) == 0:
+                break
+
+            # Normalize rows
+            with self.metrics.stage('parse'):
+                records = self.normalize_records(rows[:remaining])
+                for record in records:
+                    record['image'], record['name'] = self.parse_image(record['image'])
+
+            # Yield products (with their images if requested)
+            for record in records:
+                if self.fetch_images and record['image'] is not None:
+                    record['image'], _ = self.fetch_image(record['image'])
+                self.metrics.count('products')
+                yield record
+            remaining -= len(records)
+            if remaining <= 0:
+                break
+
+    def _login(self) -> bool:
+
+        # Retrieve login form
+        response = self.get(f'{self.domain}/login')
+        if response.status_code != 200:
+            return False
+
+        # Fill and submit login form
+        with self.metrics.stage('decode'):
+            payload = self.fill(response.html, {'token': None, 'username': self.username, 'password': self.password, 'language': None})
+        response = self.post(f'{self.domain}/login', data=payload)
+        return response.status_code == 200
+
+    def request(self, method: Union[str, bytes], url: Union[str, bytes], *args: Any, **kwargs: Any) -> Response:
+
+        # Measure request latency and cpu time
+        started = time.perf_counter()
+        with self.metrics.stage('request'):
+            response = super().request(method, url, *args, **kwargs)
+        self.metrics.latency(time.perf_counter() - started)
+
+        # Count requests and failures
+        self.metrics.count('requests')
+        if response.status_code != 200:
+            self.metrics.count(f'status_{response.status_code}')
+        return response
+
+    def rows(self, response: Response) -> List[Dict[str, Any]]:
+
+        # Decode json api
+        if self.mode == 'json':
+            return response.json['products']
+
+        # Decode inline JavaScript payload
+        elif self.mode == 'js':
+            return response.literals('products', fallback=False).get('products', list())
+
+        # Decode html results table
+        rows = list[Dict[str, Any]]()
+        for row in response.html.select('#results tr.product'):
+            record = {cell['class'][0]: cell.get_text() for cell in row.find_all('td')}
+            image = row.find('img')
+            record['image'] = None if image is None else image.get('src')
+            rows.append(record)
+        return rows
@@ -0,0 +1,98 @@
+import json
+import zlib
+import struct
+import random
+
+from html import escape
+from typing import Any, Dict, List
+
+# Define products served per page
+PAGE_SIZE = 20
+
+# Define distinct images served (products share them, as suppliers do)
+IMAGES = 8
+
+# Define raw values as suppliers render them (normalized by the parse_* helpers)
+BRANDS = ('MICHELIN', 'Continental (EU)', '  bridgestone ', 'Pirelli', 'GOOD YEAR', 'Hankook (KR)')
+WIDTHS = ('185', '195', '205', '215', '225')
+PROFILES = ('45', '50', '55', '60', '65')
+RIMS = ('15', '16', '17', '18')
+STOCKS = ('> 4', '12', '+20', '< 2', '3 unidades', 'Sem stock')
+DELIVERIES = ('Amanhã', 'Depois de amanhã de manhã', 'Sexta-feira', '3 de Novembro', 'Hoje de tarde', 'Início de Dezembro')
+PRICES = ('85,50 €', '1.120,00€', '64,9 €', '99 €', '€ 73,25')
+LETTERS = ('A', 'B', 'C', 'E')
+
+
+def product(term: str, index: int) -> Dict[str, Any]:
+
+    # Generate product deterministically (same term and index, same product)
+    generator = random.Random(f'{term}:{index}')
+    width, profile, rim = generator.choice(WIDTHS), generator.choice(PROFILES), generator.choice(RIMS)
+    return {
+        'description': f'  {width}/{profile} R{rim}  {generator.randint(80, 99)}V  {term.upper()} ',
+        'brand': generator.choice(BRANDS),
+        'price': generator.choice(PRICES),
+        'stock': generator.choice(STOCKS),
+        'delivery': generator.choice(DELIVERIES),
+        'noise': generator.choice(('A', 'B', 'C', '1', '2')),
+        'decibels': f'{generator.randint(66, 74)} dB',
+        'grip': f'Classe {generator.choice(LETTERS)}',
+        'consumption': generator.choice(LETTERS),
+        'image': f'/images/{index % IMAGES}.png',
+    }
+
+
+def products(term: str, page: int, total: int) -> List[Dict[str, Any]]:
+
+    # Retrieve page of products (empty past the last page)
+    start = page * PAGE_SIZE
+    return [product(term, index) for index in range(start, min(start + PAGE_SIZE, total))]
+
+
+def render_html(rows: List[Dict[str, Any]]) -> bytes:
+
+    # Render results table (with the chrome supplier pages usually carry)
+    cells = ''.join(
+        '<tr class="product">' + ''.join(f'<td class="{field}">{escape(str(value))}</td>' for field, value in row.items() if field != 'image')
+        + f'<td class="image"><img src="{escape(row["image"])}"></td></tr>' for row in rows)
+    navigation = ''.join(f'<li><a href="/category/{index}">Category {index}</a></li>' for index in range(50))
+    return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>Results</title><script src="/static/app.js"></script></head>'
+            f'<body><nav><ul>{navigation}</ul></nav><main><table id="results"><tbody>{cells}</tbody></table></main>'
+            f'<footer>{"<p>Terms and conditions.</p>" * 20}</footer></body></html>').encode()
+
+
+def render_js(rows: List[Dict[str, Any]]) -> bytes:
+
+    # Render page with an inline JavaScript payload (unquoted keys, single quotes, trailing commas)
+    items = ',\n'.join('{' + ', '.join(f'{field}: {json.dumps(value)}' for field, value in row.items()) + ',}' for row in rows)
+    script = f"window.dataLayer = [];\nvar config = {{currency: 'EUR', page: {len(rows)},}};\nvar products = [\n{items}\n];"
+    return f'<!DOCTYPE html><html><head><meta charset="utf-8"><script>{script}</script></head><body><div id="app"></div></body></html>'.encode()
+
+
+def render_json(rows: List[Dict[str, Any]]) -> bytes:
+
+    # Render JSON API response
+    return json.dumps({'count': len(rows), 'products': rows}).encode()
+
+
+def render_login(token: str) -> bytes:
+
+    # Render login form (with a hidden token the crawler has to fill in)
+    return (f'<!DOCTYPE html><html><head><meta charset="utf-8"></head><body><form id="login" method="POST" action="/login">'
+            f'<input type="hidden" name="token" value="{token}"><input name="username"><input name="password" type="password">'
+            f'<select name="language"><option value="pt" selected>PT</option><option value="en">EN</option></select>'
+            f'<button name="submit" value="1">Login</button></form></body></html>').encode()
+
+
+def render_png(index: int, size: int = 64) -> bytes:
+
+    # Render solid colour png (one colour per image)
+    generator = random.Random(index)
+    pixel = bytes(generator.randrange(256) for _ in range(3))
+    raw = b''.join(b'\x00' + pixel * size for _ in range(size))
+
+    # Build png chunks
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff)
+    header = struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(raw)) + chunk(b'IEND', b'')
@@ -0,0 +1,77 @@
+import sys
+import time
+import threading
+
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+def peak_rss() -> Optional[float]:
+
+    # Retrieve peak resident set size in megabytes (None where unsupported)
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+
+    # Retrieve nearest-rank percentile
+    if len(values) == 0:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+# Define thread-safe benchmark metrics (request latencies, counters and per-stage cpu time)
+class Metrics:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.latencies = list[float]()
+        self.counters = dict[str, int]()
+        self.cpu = dict[str, float]()
+        self.started = time.perf_counter()
+        self.process = time.process_time()
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def latency(self, seconds: float) -> None:
+        with self.lock:
+            self.latencies.append(seconds)
+
+    def report(self) -> Dict[str, Optional[float]]:
+
+        # Summarize metrics
+        elapsed = time.perf_counter() - self.started
+        with self.lock:
+            report = {
+                'elapsed_s': elapsed,
+                'requests': self.counters.get('requests', 0),
+                'products': self.counters.get('products', 0),
+                'requests_per_second': self.counters.get('requests', 0) / elapsed,
+                'products_per_second': self.counters.get('products', 0) / elapsed,
+                'p50_ms': None if len(self.latencies) == 0 else percentile(self.latencies, 0.5) * 1000,
+                'p99_ms': None if len(self.latencies) == 0 else percentile(self.latencies, 0.99) * 1000,
+                'peak_rss_mb': peak_rss(),
+                'cpu_total_s': time.process_time() - self.process,
+            }
+            for stage, seconds in sorted(self.cpu.items()):
+                report[f'cpu_{stage}_s'] = seconds
+        return report
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+
+        # Measure cpu time spent by this thread in the stage
+        started = time.thread_time()
+        try:
+            yield
+        finally:
+            elapsed = time.thread_time() - started
+            with self.lock:
+                self.cpu[name] = self.cpu.get(name, 0.0) + elapsed
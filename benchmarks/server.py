@@ -0,0 +1,199 @@
+import sys
+import zlib
+import time
+import random
+import secrets
+import argparse
+import threading
+
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from . import fixtures
+
+
+# Define local supplier stand-in (serves generated fixtures with configurable latency, errors and throttling)
+class StandIn:
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, throttle_rate: float = 0.0, products: int = 200, seed: int = 0) -> None:
+
+        # Validate options
+        for name, rate in (('Error rate', error_rate), ('Throttle rate', throttle_rate)):
+            if not 0 <= rate <= 1:
+                raise ValueError(f'{name} must be between 0 and 1')
+        if latency < 0 or jitter < 0:
+            raise ValueError('Latency and jitter must not be negative')
+
+        # Set options
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.products = products
+
+        # Initialize state
+        self.random = random.Random(seed)
+        self.sessions = set[str]()
+        self.tokens = set[str]()
+        self.lock = threading.Lock()
+        self.stats = dict(requests=0, errors=0, throttled=0)
+
+        # Render images once
+        self.images = [fixtures.render_png(index) for index in range(fixtures.IMAGES)]
+
+        # Create server
+        self.server = ThreadingHTTPServer((host, port), self.handler())
+        self.server.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def handler(self) -> type:
+        stand_in = self
+
+        # Define request handler bound to this stand-in
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                stand_in.serve(self, 'GET')
+
+            def do_POST(self) -> None:
+                stand_in.serve(self, 'POST')
+
+        return Handler
+
+    def serve(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+
+        # Read request
+        url = urlparse(handler.path)
+        query = parse_qs(url.query)
+        length = int(handler.headers.get('Content-Length') or 0)
+        body = handler.rfile.read(length) if length > 0 else b''
+
+        # Simulate latency
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter > 0 else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+        # Simulate failures
+        with self.lock:
+            self.stats['requests'] += 1
+            roll = self.random.random()
+            if roll < self.throttle_rate:
+                self.stats['throttled'] += 1
+                return self.send(handler, 429, b'', 'text/plain', {'Retry-After': '0'})
+            if roll < self.throttle_rate + self.error_rate:
+                self.stats['errors'] += 1
+                return self.send(handler, 503, b'Unavailable', 'text/plain')
+
+        # Serve login form and log in
+        if url.path == '/login':
+            if method == 'GET':
+                token = secrets.token_hex(8)
+                with self.lock:
+                    self.tokens.add(token)
+                return self.send(handler, 200, fixtures.render_login(token), 'text/html; charset=utf-8')
+            form = parse_qs(body.decode())
+            with self.lock:
+                valid = form.get('token', [''])[0] in self.tokens and 'username' in form and 'password' in form
+                session = secrets.token_hex(16)
+                if valid:
+                    self.sessions.add(session)
+            if not valid:
+                return self.send(handler, 403, b'Invalid login', 'text/plain')
+            return self.send(handler, 200, b'<html><body>Welcome</body></html>', 'text/html', {'Set-Cookie': f'session={session}; Path=/'})
+
+        # Serve images (public and cacheable)
+        if url.path.startswith('/images/'):
+            try:
+                image = self.images[int(url.path[len('/images/'):].split('.')[0])]
+            except (ValueError, IndexError):
+                return self.send(handler, 404, b'Not found', 'text/plain')
+            return self.send(handler, 200, image, 'image/png', {'ETag': f'"{zlib.crc32(image):08x}"', 'Cache-Control': 'max-age=3600'})
+
+        # Check session
+        cookies = handler.headers.get('Cookie') or ''
+        session = next((cookie.split('=', 1)[1] for cookie in cookies.split('; ') if cookie.startswith('session=')), None)
+        with self.lock:
+            authenticated = session in self.sessions
+        if not authenticated:
+            return self.send(handler, 403, b'Not logged in', 'text/plain')
+
+        # Serve results (html, json or inline JavaScript)
+        renderers = {
+            '/search': (fixtures.render_html, 'text/html; charset=utf-8'),
+            '/api/search': (fixtures.render_json, 'application/json'),
+            '/inline/search': (fixtures.render_js, 'text/html; charset=utf-8'),
+        }
+        if url.path not in renderers:
+            return self.send(handler, 404, b'Not found', 'text/plain')
+        render, content_type = renderers[url.path]
+        term = query.get('term', [''])[0]
+        page = int(query.get('page', ['0'])[0])
+        return self.send(handler, 200, render(fixtures.products(term, page, self.products)), content_type)
+
+    @staticmethod
+    def send(handler: BaseHTTPRequestHandler, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+        handler.send_response(status)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(body)))
+        for header, value in (headers or dict()).items():
+            handler.send_header(header, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def start(self) -> 'StandIn':
+
+        # Serve requests in a background thread
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    @property
+    def netloc(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f'{host}:{port}'
+
+    def __enter__(self) -> 'StandIn':
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description='Serve supplier fixtures locally')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='maximum random seconds added on top of latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='fraction of requests answered with 429')
+    parser.add_argument('--products', type=int, default=200, help='products available per term')
+    options = parser.parse_args(arguments)
+
+    # Serve until interrupted
+    stand_in = StandIn(port=options.port, latency=options.latency, jitter=options.jitter,
+                       error_rate=options.error_rate, throttle_rate=options.throttle_rate, products=options.products)
+    print(f'Serving on http://{stand_in.netloc}')
+    try:
+        stand_in.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stand_in.server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+from typing import Dict, List, Optional
+
+# Define statements timed in a fresh interpreter
+STATEMENTS = {
+    'package': 'import cutils',
+    'fetch_all': 'from cutils import fetch_all',
+    'normalization': 'from cutils.normalization import normalize_price',
+    'crawler': 'from cutils import Crawler',
+    'tyre_crawler': 'from cutils import TyreCrawler',
+}
+
+# Define dependencies that must only load on first use
+HEAVY = ('bs4', 'html5lib', 'dateparser', 'calmjs')
+
+# Define script run in each fresh interpreter (prints elapsed seconds and loaded heavy dependencies)
+SCRIPT = '''
+import sys, time, json
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps([elapsed, sorted({{name.split('.')[0] for name in sys.modules}} & set({heavy!r}))]))
+'''
+
+
+def measure(statement: str, repeat: int) -> Dict[str, object]:
+
+    # Time statement in fresh interpreters
+    timings, loaded = list[float](), list[str]()
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', SCRIPT.format(statement=statement, heavy=HEAVY)],
+                                check=True, capture_output=True, text=True).stdout
+        elapsed, loaded = json.loads(output.strip().splitlines()[-1])
+        timings.append(elapsed * 1000)
+
+    # Return median time (in milliseconds) and loaded heavy dependencies
+    return dict(median=statistics.median(timings), minimum=min(timings), heavy=loaded)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(
+        description='Measure cutils import time in fresh interpreters')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='interpreters launched per statement')
+    parser.add_argument('--max', type=float, default=None,
+                        help='fail if "import cutils" takes longer (in milliseconds)')
+    options = parser.parse_args(arguments)
+
+    # Measure statements
+    failed = False
+    for name, statement in STATEMENTS.items():
+        result = measure(statement, options.repeat)
+        print(f'{name:>14}: median={result["median"]:8.1f}ms min={result["minimum"]:8.1f}ms heavy={",".join(result["heavy"]) or "-"}')
+
+        # Check regressions (heavy dependencies loaded eagerly or slow package import)
+        if name in ('package', 'fetch_all', 'normalization') and len(result['heavy']) > 0:
+            failed = True
+        if name == 'package' and options.max is not None and result['median'] > options.max:
+            failed = True
+
+    # Return exit status
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
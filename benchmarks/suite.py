@@ -0,0 +1,153 @@
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+
+from typing import Any, Dict, List, Optional
+
+# Define crawler mode (and whether images are fetched) of each scenario
+SCENARIOS = {
+    'html': ('html', False),
+    'json': ('json', False),
+    'js': ('js', False),
+    'images': ('json', True),
+}
+
+# Define direction of each metric (1 if higher is better, -1 if lower is better)
+DIRECTIONS = {
+    'requests_per_second': 1,
+    'products_per_second': 1,
+    'p50_ms': -1,
+    'p99_ms': -1,
+    'peak_rss_mb': -1,
+    'cpu_total_s': -1,
+    'cpu_request_s': -1,
+    'cpu_decode_s': -1,
+    'cpu_parse_s': -1,
+}
+
+# Define smallest values compared (differences below are noise)
+FLOORS = {
+    'p50_ms': 1.0,
+    'p99_ms': 1.0,
+    'cpu_total_s': 0.05,
+    'cpu_request_s': 0.05,
+    'cpu_decode_s': 0.05,
+    'cpu_parse_s': 0.05,
+}
+
+
+def compare(baseline: Dict[str, Dict[str, Any]], results: Dict[str, Dict[str, Any]], tolerance: float) -> List[str]:
+
+    # Compare every scenario metric against the baseline
+    regressions = list[str]()
+    for scenario, report in results.items():
+        for metric, direction in DIRECTIONS.items():
+            before, after = baseline.get(scenario, dict()).get(metric), report.get(metric)
+            if before is None or after is None or max(before, after) < FLOORS.get(metric, 0):
+                continue
+
+            # Check if metric got worse than tolerated
+            if (direction > 0 and after < before * (1 - tolerance)) or (direction < 0 and after > before * (1 + tolerance)):
+                regressions.append(f'{scenario}.{metric}: {before:.3f} -> {after:.3f}')
+    return regressions
+
+
+def run(scenario: str, netloc: str, options: argparse.Namespace) -> Dict[str, Any]:
+
+    # Import lazily (the parent process only serves and compares)
+    from cutils import ImageStore, fetch_all
+    from .metrics import Metrics
+    from .crawler import BenchmarkCrawler
+
+    # Create crawlers sharing the scenario metrics
+    mode, images = SCENARIOS[scenario]
+    metrics = Metrics()
+    crawlers = [BenchmarkCrawler(netloc, mode, metrics, images) for _ in range(options.crawlers)]
+    for crawler in crawlers:
+        if options.parser is not None:
+            crawler.HTML_PARSER = options.parser
+
+    # Fetch every term with every crawler
+    queries = [(f'term{index}', options.products) for index in range(options.terms)]
+    with tempfile.TemporaryDirectory() as directory:
+        if images:
+            store = ImageStore(directory)
+            for crawler in crawlers:
+                crawler.images = store
+        for products in fetch_all(crawlers, *queries, workers=options.workers):
+            for _ in products:
+                pass
+
+    # Return report
+    report = metrics.report()
+    report.update({name: value for name, value in metrics.counters.items() if name.startswith('status_')})
+    return report
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description='Benchmark cutils against a local supplier stand-in')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='comma separated scenarios')
+    parser.add_argument('--crawlers', type=int, default=4, help='crawlers fetched concurrently')
+    parser.add_argument('--terms', type=int, default=3, help='terms fetched by each crawler')
+    parser.add_argument('--products', type=int, default=200, help='products fetched per term')
+    parser.add_argument('--workers', type=int, default=None, help='worker threads (one thread per job if omitted)')
+    parser.add_argument('--parser', default=None, help='html parser engine (crawler default if omitted)')
+    parser.add_argument('--latency', type=float, default=0.005, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.005, help='maximum random seconds added on top of latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 503')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='fraction of requests answered with 429')
+    parser.add_argument('--save', default=None, help='save results as baseline to this path')
+    parser.add_argument('--baseline', default=None, help='compare results against the baseline at this path')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='relative change tolerated before flagging a regression')
+    parser.add_argument('--child', default=None, help=argparse.SUPPRESS)
+    parser.add_argument('--netloc', default=None, help=argparse.SUPPRESS)
+    options = parser.parse_args(arguments)
+
+    # Run single scenario (in a fresh process, so peak memory and caches are per scenario)
+    if options.child is not None:
+        print(json.dumps(run(options.child, options.netloc, options)))
+        return 0
+
+    # Validate scenarios
+    scenarios = [scenario.strip() for scenario in options.scenarios.split(',') if scenario.strip()]
+    for scenario in scenarios:
+        if scenario not in SCENARIOS:
+            parser.error(f'unknown scenario {scenario} (one of {", ".join(SCENARIOS)})')
+
+    # Serve fixtures and run scenarios
+    from .server import StandIn
+    results = dict[str, Dict[str, Any]]()
+    with StandIn(latency=options.latency, jitter=options.jitter, error_rate=options.error_rate,
+                 throttle_rate=options.throttle_rate, products=options.products) as stand_in:
+        child = [arguments for arguments in (arguments if arguments is not None else sys.argv[1:])]
+        for scenario in scenarios:
+            output = subprocess.run([sys.executable, '-m', 'benchmarks.suite', *child, '--child', scenario, '--netloc', stand_in.netloc],
+                                    check=True, capture_output=True, text=True).stdout
+            results[scenario] = json.loads(output.strip().splitlines()[-1])
+            report = results[scenario]
+            print(f'{scenario:>8}: {report["requests_per_second"]:8.1f} req/s {report["products_per_second"]:9.1f} products/s '
+                  f'p50={report["p50_ms"] or 0:7.1f}ms p99={report["p99_ms"] or 0:7.1f}ms rss={report["peak_rss_mb"] or 0:6.1f}MB '
+                  f'cpu request={report.get("cpu_request_s", 0):.2f}s decode={report.get("cpu_decode_s", 0):.2f}s parse={report.get("cpu_parse_s", 0):.2f}s')
+
+    # Save baseline
+    if options.save is not None:
+        with open(options.save, 'w') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+
+    # Compare against baseline
+    if options.baseline is not None:
+        with open(options.baseline, 'r') as file:
+            regressions = compare(json.load(file), results, options.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        if len(regressions) > 0:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,73 @@
-from .crawler import Crawler
-from .fetch_all import fetch_all
-from .tyre_crawler import TyreCrawler
-from .abstract_crawler import AbstractCrawler
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+# Import light entry points eagerly (their names shadow their modules)
+from .fetch_all import fetch_all, iter_all
+
+# Define module of each public name (imported on first access, as some pull in slow dependencies)
+EXPORTS = {
+    'Crawler': 'crawler',
+    'TyreCrawler': 'tyre_crawler',
+    'AbstractCrawler': 'abstract_crawler',
+    'AsyncCrawler': 'async_crawler',
+    'async_fetch_all': 'async_fetch_all',
+    'AsyncTyreCrawler': 'async_tyre_crawler',
+    'Cache': 'cache',
+    'Form': 'form',
+    'FileSessionStore': 'file_session_store',
+    'MemorySessionStore': 'memory_session_store',
+    'SQLiteSessionStore': 'sqlite_session_store',
+    'ImageStore': 'image_store',
+    'TyreProduct': 'tyre_product',
+    'TyreProducts': 'tyre_products',
+    'CancellationToken': 'cancellation',
+    'Cancelled': 'cancellation',
+    'AbstractInstrument': 'abstract_instrument',
+    'Aggregator': 'aggregator',
+    'Histogram': 'histogram',
+    'SnapshotStore': 'snapshot_store',
+    'AbstractJobQueue': 'abstract_job_queue',
+    'SQLiteJobQueue': 'sqlite_job_queue',
+}
+
+__all__ = ['fetch_all', 'iter_all', *EXPORTS]
+
+if TYPE_CHECKING:
+    from .crawler import Crawler
+    from .tyre_crawler import TyreCrawler
+    from .abstract_crawler import AbstractCrawler
+    from .async_crawler import AsyncCrawler
+    from .async_fetch_all import async_fetch_all
+    from .async_tyre_crawler import AsyncTyreCrawler
+    from .cache import Cache
+    from .form import Form
+    from .file_session_store import FileSessionStore
+    from .memory_session_store import MemorySessionStore
+    from .sqlite_session_store import SQLiteSessionStore
+    from .image_store import ImageStore
+    from .tyre_product import TyreProduct
+    from .tyre_products import TyreProducts
+    from .cancellation import CancellationToken, Cancelled
+    from .abstract_instrument import AbstractInstrument
+    from .aggregator import Aggregator
+    from .histogram import Histogram
+    from .snapshot_store import SnapshotStore
+    from .abstract_job_queue import AbstractJobQueue
+    from .sqlite_job_queue import SQLiteJobQueue
+
+
+def __getattr__(name: str) -> Any:
+
+    # Check if name is exported
+    module = EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    # Import name (and keep it, so later accesses skip this hook)
+    value = getattr(import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *EXPORTS})
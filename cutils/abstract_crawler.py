@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterator, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 
 class AbstractCrawler(ABC):
@@ -11,6 +11,15 @@ class AbstractCrawler(ABC):
     def fetch(self, term: str, quantity: Optional[Union[int, str]] = None) -> Iterator[Dict[str, Any]]:
         pass
 
+    def fetch_many(self, terms: Iterable[Union[str, Tuple[str, Optional[Union[int, str]]]]], quantity: Optional[Union[int, str]] = None) -> Iterator[Dict[str, Any]]:
+
+        # Fetch each term in turn (terms may carry their own quantity)
+        for term in terms:
+            if isinstance(term, tuple):
+                yield from self.fetch(*term)
+            else:
+                yield from self.fetch(term, quantity)
+
     @abstractmethod
     def loads(self, state: bytes) -> None:
         pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractInstrument(ABC):
+    @abstractmethod
+    def count(self, crawler: str, name: str, value: int = 1) -> None:
+        pass
+
+    @abstractmethod
+    def timing(self, crawler: str, name: str, seconds: float) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+# Define claimed job type (job id, specification)
+Job = Tuple[int, bytes]
+
+# Define result row type (result id, job id, payload or None once the job is finished)
+Result = Tuple[int, int, Optional[bytes]]
+
+
+class AbstractJobQueue(ABC):
+    @abstractmethod
+    def cancel(self, run: str) -> None:
+        pass
+
+    @abstractmethod
+    def claim(self, worker: str, lease: float) -> Optional[Job]:
+        pass
+
+    @abstractmethod
+    def complete(self, job: int, worker: str, error: Optional[str] = None) -> None:
+        pass
+
+    @abstractmethod
+    def poll(self, run: str, after: int = 0, limit: int = 1000) -> List[Result]:
+        pass
+
+    @abstractmethod
+    def purge(self, run: str) -> None:
+        pass
+
+    @abstractmethod
+    def push(self, job: int, worker: str, payload: bytes, lease: float) -> bool:
+        pass
+
+    @abstractmethod
+    def submit(self, run: str, spec: bytes) -> int:
+        pass
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+# Define session key type (crawler class, netloc, username)
+SessionKey = Tuple[str, str, str]
+
+
+class AbstractSessionStore(ABC):
+    @abstractmethod
+    def delete(self, key: SessionKey) -> None:
+        pass
+
+    @abstractmethod
+    def get(self, key: SessionKey) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def put(self, key: SessionKey, state: bytes, expires: float) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
@@ -0,0 +1,91 @@
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .histogram import BOUNDS, Histogram, duration
+from .abstract_instrument import AbstractInstrument
+
+
+# Define in-process instrument (counters and timing histograms per crawler)
+class Aggregator(AbstractInstrument):
+    def __init__(self, bounds: Sequence[float] = BOUNDS) -> None:
+
+        # Set options
+        self.bounds = tuple(bounds)
+
+        # Initialize state
+        self.__lock = Lock()
+        self.__counters = dict[Tuple[str, str], int]()
+        self.__timings = dict[Tuple[str, str], Histogram]()
+
+    def count(self, crawler: str, name: str, value: int = 1) -> None:
+        with self.__lock:
+            key = crawler, name
+            self.__counters[key] = self.__counters.get(key, 0) + value
+
+    def counters(self, crawler: Optional[str] = None) -> Dict[str, int]:
+
+        # Retrieve counters of a crawler (or summed over every crawler)
+        counters = dict[str, int]()
+        with self.__lock:
+            for (owner, name), value in self.__counters.items():
+                if crawler is None or owner == crawler:
+                    counters[name] = counters.get(name, 0) + value
+        return dict(sorted(counters.items()))
+
+    @property
+    def crawlers(self) -> List[str]:
+        with self.__lock:
+            return sorted({crawler for crawler, _ in (*self.__counters, *self.__timings)})
+
+    def histogram(self, name: str, crawler: Optional[str] = None) -> Histogram:
+
+        # Retrieve copy of a timing histogram (merged over every crawler if none is given)
+        histogram = Histogram(self.bounds)
+        with self.__lock:
+            for (owner, timing), other in self.__timings.items():
+                if timing == name and (crawler is None or owner == crawler):
+                    histogram.merge(other)
+        return histogram
+
+    def report(self, histograms: bool = False) -> str:
+
+        # Render counters and timings of every crawler
+        lines = list[str]()
+        for crawler, summary in self.summary().items():
+            lines.append(crawler)
+            for name, value in summary['counters'].items():
+                lines.append(f'  {name:<36} {value}')
+            for name, timing in summary['timings'].items():
+                lines.append(f'  {name:<36} n={timing["count"]} mean={duration(timing["mean"])} '
+                             f'p50<={duration(timing["p50"])} p99<={duration(timing["p99"])} max={duration(timing["max"])}')
+                if histograms:
+                    lines.extend(f'    {line}' for line in self.histogram(name, crawler).render())
+        return '\n'.join(lines)
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__counters.clear()
+            self.__timings.clear()
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+
+        # Summarize counters and timings of every crawler
+        summary = dict[str, Dict[str, Any]]()
+        for crawler in self.crawlers:
+            with self.__lock:
+                names = sorted(name for owner, name in self.__timings if owner == crawler)
+            timings = dict[str, Dict[str, Any]]()
+            for name in names:
+                histogram = self.histogram(name, crawler)
+                timings[name] = dict(count=histogram.count, mean=histogram.mean, p50=histogram.percentile(0.5),
+                                     p99=histogram.percentile(0.99), max=histogram.maximum)
+            summary[crawler] = dict(counters=self.counters(crawler), timings=timings)
+        return summary
+
+    def timing(self, crawler: str, name: str, seconds: float) -> None:
+        with self.__lock:
+            key = crawler, name
+            histogram = self.__timings.get(key)
+            if histogram is None:
+                histogram = self.__timings[key] = Histogram(self.bounds)
+            histogram.add(seconds)
@@ -0,0 +1,106 @@
+import time
+import httpx
+import pickle
+import logging
+import requests
+
+from abc import ABC, abstractmethod
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional, Union
+
+from .data import Data
+from .response import Response
+from .base_crawler import BaseCrawler
+
+if TYPE_CHECKING:
+    from bs4 import SoupStrainer
+
+
+# Define base asynchronous crawler
+class AsyncCrawler(BaseCrawler, ABC):
+    def __init__(self, username: str, password: str, netloc: str, scheme: str = 'https') -> None:
+
+        # Initialize superclass
+        super().__init__(username, password, netloc, scheme)
+
+        # Create client (no timeout and redirects followed, as in requests)
+        self.client = httpx.AsyncClient(follow_redirects=True, timeout=None)
+
+        # Set default user-agent
+        self.client.headers.update({
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/78.0.3904.108 Safari/537.36'
+        })
+
+    @abstractmethod
+    def _fetch(self, term: str, quantity: int) -> AsyncIterator[Dict[str, Any]]:
+        pass
+
+    async def close(self) -> None:
+
+        # Close client
+        await self.client.aclose()
+
+    def dumps(self) -> bytes:
+
+        # Dump cookies (same format as Crawler.dumps)
+        cookies = requests.cookies.RequestsCookieJar()
+        for cookie in self.client.cookies.jar:
+            cookies.set_cookie(cookie)
+        return pickle.dumps(cookies)
+
+    async def fetch(self, term: str, quantity: Optional[Union[int, str]] = None) -> AsyncIterator[Dict[str, Any]]:
+        try:
+            term, quantity = self.validate(term, quantity)
+            logging.info(f'Fetching term={term}, quantity={quantity}')
+            async for product in self._fetch(term, quantity):
+                self._count('products')
+                yield product
+        except Exception as e:
+            logging.exception(e)
+            self._count('errors.fetch')
+
+    async def get(self, url: Union[str, bytes], params: Data = None, data: Data = None, headers: Data = None, json: Data = None, hint: Optional[str] = None, parser: Optional[str] = None, parse_only: Optional['SoupStrainer'] = None) -> Response:
+
+        # Make request
+        return await self.request('GET', url, params=params, data=data, headers=headers, json=json, hint=hint, parser=parser, parse_only=parse_only)
+
+    def loads(self, state: bytes) -> None:
+
+        # Loads cookies
+        for cookie in pickle.loads(state):
+            self.client.cookies.jar.set_cookie(cookie)
+
+    async def post(self, url: Union[str, bytes], params: Data = None, data: Data = None, headers: Data = None, json: Data = None, hint: Optional[str] = None, parser: Optional[str] = None, parse_only: Optional['SoupStrainer'] = None) -> Response:
+
+        # Make request
+        return await self.request('POST', url, params=params, data=data, headers=headers, json=json, hint=hint, parser=parser, parse_only=parse_only)
+
+    async def request(self, method: Union[str, bytes], url: Union[str, bytes], params: Data = None, data: Data = None, headers: Data = None, json: Data = None, hint: Optional[str] = None, parser: Optional[str] = None, parse_only: Optional['SoupStrainer'] = None) -> Response:
+
+        started = time.perf_counter()
+        try:
+            # Make request
+            self._count('requests')
+            response = await self.client.request(method, url, params=params,
+                                                 data=data, headers=headers, json=json)
+        except httpx.TooManyRedirects as e:
+            response = Response(self, None, 1000, urlparse(url), hint=hint, query=dict(), parser=parser, parse_only=parse_only)
+        except httpx.TransportError as e:
+            logging.debug(f'{url}:{method}')
+            logging.exception(e)
+            response = Response(self, None, 1001, urlparse(url), hint=hint, query=dict(), parser=parser, parse_only=parse_only)
+
+        # Otherwise build response (decoded lazily)
+        else:
+            self._count('bytes', len(response.content))
+            response = Response(self, response.content, response.status_code, urlparse(str(response.url)),
+                                headers=response.headers, reason=response.reason_phrase, hint=hint,
+                                parser=parser, parse_only=parse_only)
+
+        # Report request time and outcome (errors by sentinel or http status code)
+        if self.instrument is not None:
+            self._timing('request.total', time.perf_counter() - started)
+            self._count(f'status.{response.status_code}')
+            if response.status_code >= 400:
+                self._count(f'errors.{response.status_code}')
+        return response
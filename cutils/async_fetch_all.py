@@ -0,0 +1,52 @@
+import asyncio
+import logging
+
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .async_crawler import AsyncCrawler
+
+# Define end of crawler marker
+_DONE = object()
+
+
+async def async_fetch_each(queue: asyncio.Queue, crawler: 'AsyncCrawler', query: Tuple[str, Optional[Union[int, str]]]) -> None:
+    try:
+        async for product in crawler.fetch(*query):
+            await queue.put(product)
+    except Exception as e:
+        logging.exception(e)
+    finally:
+        await queue.put(_DONE)
+
+
+async def async_fetch_all(crawlers: List['AsyncCrawler'], *queries: Tuple[str, Optional[Union[int, str]]]) -> AsyncIterator[Dict[str, Any]]:
+
+    # Initialize queue
+    queue = asyncio.Queue()
+
+    # Open tasks
+    tasks = [asyncio.create_task(async_fetch_each(queue, crawler, query))
+             for query in queries for crawler in crawlers]
+
+    try:
+        # While tasks are running
+        running = len(tasks)
+        while running > 0:
+
+            # Retrieve product
+            product = await queue.get()
+
+            # Check if product is an end marker
+            if product is _DONE:
+                running -= 1
+
+            # Othewise check if product is not None
+            elif product is not None:
+                yield product
+
+    finally:
+        # Cancel any task left behind (consumer stopped early)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
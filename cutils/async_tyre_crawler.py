@@ -0,0 +1,10 @@
+from .async_crawler import AsyncCrawler
+from .base_tyre_crawler import BaseTyreCrawler
+
+
+# Define base asynchronous tyre crawler
+class AsyncTyreCrawler(BaseTyreCrawler, AsyncCrawler):
+    def __init__(self, username: str, password: str, netloc: str, scheme: str = 'https') -> None:
+
+        # Initialize superclass
+        super().__init__(username, password, netloc, scheme)
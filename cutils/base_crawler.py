@@ -0,0 +1,223 @@
+import time
+
+from abc import ABC
+from concurrent.futures import Executor, Future
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Tuple, TypeVar, Union
+
+from .data import Data
+from .abstract_instrument import AbstractInstrument
+from .decoding import LazyParser, decode, decode_and_extract
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer, Tag
+    from calmjs.parse.parsers.es5 import Parser
+    from .form import Form
+    from .response import Response
+
+# Define generic bound to data
+_T = TypeVar('_T', bound=Data)
+
+# Define generic offload result
+_R = TypeVar('_R')
+
+
+# Define transport-independent base crawler
+class BaseCrawler(ABC):
+    # Define JavaScript parser (built on first use)
+    PARSER = LazyParser()
+
+    # Define html parser engine (one of HTML_PARSERS)
+    HTML_PARSER = 'html5lib'
+
+    # Define html subtrees to build (None builds the whole document)
+    HTML_STRAINER: Optional['SoupStrainer'] = None
+
+    # Define import path ('module:callable') of a factory building this crawler in job workers (None calls the class)
+    FACTORY: Optional[str] = None
+
+    def __init__(self, username: str, password: str, netloc: str, scheme: str = 'https') -> None:
+
+        # Validate credentials and options
+        if not isinstance(username, str):
+            raise TypeError('Username must be a string')
+        if not isinstance(password, str):
+            raise TypeError('Password must be a string')
+        if not isinstance(netloc, str):
+            raise TypeError('Netloc must be a string')
+        if not isinstance(scheme, str):
+            raise TypeError('Scheme must be a string')
+        if scheme not in ('http', 'https'):
+            raise ValueError('Scheme must be either http or https')
+
+        # Set credentials
+        self.username = username
+        self.password = password
+
+        # Set options
+        self.__netloc = netloc
+        self.__scheme = scheme
+
+        # Disable decode executor (opt-in, e.g. a ProcessPoolExecutor)
+        self.executor: Optional[Executor] = None
+
+        # Disable instrumentation (opt-in, e.g. an Aggregator)
+        self.instrument: Optional[AbstractInstrument] = None
+
+    def __js_parser(self, kind: str) -> Optional['Parser']:
+
+        # Retrieve JavaScript parser only for JavaScript (reading PARSER builds the shared parser)
+        return self.PARSER if kind == 'js' else None
+
+    def __prepare(self, content: bytes, kind: str, parser: Optional[str], parse_only: Optional['SoupStrainer']) -> Tuple[Union[bytes, str], str, Optional['SoupStrainer']]:
+
+        # Retrieve parser engine and strainer
+        parser = self.HTML_PARSER if parser is None else parser
+        parse_only = self.HTML_STRAINER if parse_only is None else parse_only
+
+        # Preprocess html
+        if kind == 'html':
+            content = self._preprocessing(content)
+        return content, parser, parse_only
+
+    def _count(self, name: str, value: int = 1) -> None:
+
+        # Report counter to the instrument
+        if self.instrument is not None:
+            self.instrument.count(str(self), name, value)
+
+    def _preprocessing(self, content: bytes) -> Union[bytes, str]:
+
+        # # Retrieve content
+        return content
+
+    def _timing(self, name: str, seconds: float) -> None:
+
+        # Report timing to the instrument
+        if self.instrument is not None:
+            self.instrument.timing(str(self), name, seconds)
+
+    def decode(self, content: bytes, kind: str, parser: Optional[str] = None, parse_only: Optional['SoupStrainer'] = None) -> Any:
+
+        # Decode content with the crawler's options
+        started = time.perf_counter()
+        try:
+            content, parser, parse_only = self.__prepare(
+                content, kind, parser, parse_only)
+            return decode(content, kind, parser, parse_only, self.__js_parser(kind))
+
+        # Report decode time (per kind, and per parser engine for html)
+        finally:
+            if self.instrument is not None:
+                self._timing(f'decode.{kind}.{parser}' if kind == 'html' else f'decode.{kind}',
+                             time.perf_counter() - started)
+
+    @property
+    def domain(self) -> str:
+        return f'{self.__scheme}://{self.__netloc}'
+
+    def fill(self, content: Union['BeautifulSoup', 'Form'], payload: _T, form: Optional[Union[str, 'Tag']] = None) -> _T:
+        from bs4 import BeautifulSoup
+        from .form import Form
+
+        # Index form fields (once, unless an index was given)
+        if isinstance(content, Form):
+            fields = content
+        elif isinstance(content, BeautifulSoup):
+            fields = Form(content, form)
+
+        # Validate content as html
+        else:
+            raise TypeError(f'Content is not html: type={type(content)}')
+
+        # Check payload
+        if payload is None:
+            return None
+
+        # Validate payload
+        elif not isinstance(payload, Mapping):
+            raise TypeError(
+                f'Payload is not a dictionary: type={type(payload)}')
+
+        # Fill payload
+        for key, current_value in payload.items():
+
+            # Check if field exists
+            if key in fields:
+
+                # Get field value
+                value = fields[key]
+
+                # Check if value exists
+                if value is not None:
+
+                    # Set payload value
+                    payload[key] = value
+
+            # Check if field is required
+            elif current_value is None:
+                raise ValueError(f'Field {key} is required')
+
+        # Return payload
+        return payload
+
+    @property
+    def netloc(self) -> str:
+        return self.__netloc
+
+    def offload(self, response: 'Response', extract: Optional[Callable[[Any], _R]] = None, kind: Optional[str] = None) -> 'Future[_R]':
+
+        # Check if there is anything to decode
+        kind = response.kind if kind is None else kind
+        if not response.body:
+            future = Future()
+            future.set_result(None)
+            return future
+
+        # Preprocess content here (hooks may not be picklable)
+        content, parser, parse_only = self.__prepare(
+            response.body, kind, response.parser, response.parse_only)
+
+        # Decode and extract in the executor (ships raw bytes to worker processes)
+        if self.executor is not None:
+            if kind == 'js' and extract is None:
+                raise ValueError(
+                    'JavaScript trees are not picklable: extract is required')
+            return self.executor.submit(decode_and_extract, content, kind, parser, parse_only, extract)
+
+        # Otherwise decode and extract in this thread
+        future = Future()
+        try:
+            future.set_result(decode_and_extract(
+                content, kind, parser, parse_only, extract, self.__js_parser(kind)))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    @property
+    def scheme(self) -> str:
+        return self.__scheme
+
+    def validate(self, term: str, quantity: Optional[Union[int, str]] = None) -> Tuple[str, int]:
+        # Parse term
+        if not isinstance(term, str):
+            raise TypeError('Term must be a string')
+
+        # Parse quantity
+        if quantity is None:
+            quantity = 4
+        elif isinstance(quantity, str):
+            if not quantity.isdigit():
+                raise ValueError('Quantity must be an integer')
+            quantity = int(quantity)
+        elif not isinstance(quantity, int):
+            raise TypeError(
+                'Quantity must be an integer or an integer string or None')
+
+        # Return term and quantity
+        return term, quantity
+
+    def __repr__(self) -> str:
+        return self.__class__.__name__
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
@@ -0,0 +1,167 @@
+import os
+import time
+
+from urllib.parse import urljoin
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, TypeVar, Union
+
+from .base_crawler import BaseCrawler
+from .delivery import normalize_delivery
+from .tyre_product import TyreProduct
+from .tyre_products import TyreProducts
+from .normalization import normalize_ascii, normalize_brand, normalize_consumption_or_grip, normalize_decibels, normalize_noise, normalize_price, normalize_records, normalize_stock, normalize_text
+
+# Define generic normalized value
+_V = TypeVar('_V')
+
+
+# Define transport-independent base tyre crawler
+class BaseTyreCrawler(BaseCrawler):
+    # Define parse method used by normalize_records for each record field
+    NORMALIZERS = {
+        'brand': 'parse_brand',
+        'consumption': 'parse_consumption_or_grip',
+        'decibels': 'parse_decibels',
+        'delivery': 'parse_delivery',
+        'description': 'parse_description',
+        'grip': 'parse_consumption_or_grip',
+        'noise': 'parse_noise',
+        'price': 'parse_price',
+        'stock': 'parse_stock',
+    }
+
+    def __normalize(self, normalizer: Callable[..., _V], value: str) -> _V:
+
+        # Normalize with the memoized helper (run uncached with the parse_text override, if any)
+        if type(self).parse_text is BaseTyreCrawler.parse_text:
+            return normalizer(value)
+        return getattr(normalizer, '__wrapped__', normalizer)(value, self.parse_text)
+
+    def __timed(self, name: str, normalizer: Callable[[Any], Any]) -> Callable[[Any], Any]:
+
+        # Report time of every call to the normalizer
+        def timed(value: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return normalizer(value)
+            finally:
+                self._timing(f'normalize.{name}', time.perf_counter() - started)
+        return timed
+
+    def normalize_products(self, rows: Iterable[Mapping[str, Any]]) -> TyreProducts:
+
+        # Normalize page of records into a columnar batch
+        return TyreProducts(TyreProduct.from_dict(record, crawler=str(self)) for record in self.normalize_records(rows))
+
+    def normalize_records(self, rows: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+
+        # Normalize page of records with the bound parse methods (timed if instrumented)
+        normalizers = {field: getattr(self, method) for field, method in self.NORMALIZERS.items()}
+        if self.instrument is not None:
+            normalizers = {field: self.__timed(self.NORMALIZERS[field], normalizer) for field, normalizer in normalizers.items()}
+        return normalize_records(rows, normalizers)
+
+    def parse(self, value: str) -> str:
+        if not isinstance(value, str):
+            raise TypeError(f'Value must be a string')
+        return normalize_ascii(value)
+
+    def parse_brand(self, brand: Optional[str]) -> Optional[str]:
+        if brand is None:
+            return None
+        elif isinstance(brand, str):
+            return self.__normalize(normalize_brand, brand)
+        raise TypeError(f'Unable to parse brand for type: {type(brand)}')
+
+    def parse_consumption_or_grip(self, consumption_or_grip: Optional[str]) -> Optional[str]:
+        if consumption_or_grip is None:
+            return None
+        elif isinstance(consumption_or_grip, str):
+            return self.__normalize(normalize_consumption_or_grip, consumption_or_grip)
+        raise TypeError(
+            f'Unable to parse grip for type: {type(consumption_or_grip)}')
+
+    def parse_decibels(self, decibels: Optional[Union[str, int]]) -> Optional[int]:
+        if decibels is None:
+            return None
+        elif isinstance(decibels, str):
+            return self.__normalize(normalize_decibels, decibels)
+        elif isinstance(decibels, int):
+            return decibels if decibels > 0 else None
+        raise TypeError(f'Unable to parse decibels for type: {type(decibels)}')
+
+    def parse_delivery(self, delivery: Optional[Union[datetime, str]]) -> Optional[datetime]:
+        if delivery is None:
+            return None
+        elif isinstance(delivery, datetime):
+            return delivery
+        elif isinstance(delivery, str):
+            return normalize_delivery(self.parse(delivery))
+        raise TypeError(f'Unable to parse delivery for type: {type(delivery)}')
+
+    def parse_description(self, description: Optional[str]) -> Optional[str]:
+        if description is None:
+            return None
+        elif isinstance(description, str):
+            description = self.parse_text(description)
+            return None if description is None else description.upper()
+        raise TypeError(
+            f'Unable to parse description for type: {type(description)}')
+
+    def parse_image(self, image: Optional[str]) -> Tuple[str, str]:
+        if image is None:
+            return None, None
+        elif not isinstance(image, str):
+            raise TypeError(f'Image must be a string')
+        if len(image.strip()) == 0:
+            return None, None
+        return urljoin(self.domain, image), self.parse_path(image)
+
+    def parse_noise(self, noise: Optional[Union[str, int]]) -> Optional[int]:
+        if noise is None:
+            return None
+        elif isinstance(noise, str):
+            return self.__normalize(normalize_noise, noise)
+        elif isinstance(noise, int):
+            return noise if noise > 0 else None
+        raise TypeError(f'Unable to parse noise for type: {type(noise)}')
+
+    def parse_path(self, path: Optional[str]) -> Optional[str]:
+        if path is None:
+            return None
+        elif not isinstance(path, str):
+            raise TypeError(f'Path must be a string')
+        _, name = os.path.split(path)
+        name, _ = os.path.splitext(name)
+        return name
+
+    def parse_price(self, price: Optional[Union[str, float, int]], prefer_period: bool = False) -> Optional[float]:
+        if not isinstance(prefer_period, bool):
+            raise TypeError(f'Prefer period must be a boolean')
+        if price is None:
+            return None
+        elif isinstance(price, int):
+            return float(price)
+        elif isinstance(price, float):
+            return price
+        elif isinstance(price, str):
+            return normalize_price(price, prefer_period)
+        raise TypeError(f'Unable to parse price for type: {type(price)}')
+
+    def parse_stock(self, stock: Optional[Union[float, int, str]]) -> Tuple[Optional[str], int, Optional[str]]:
+        if stock is None:
+            return None, 0, None
+        elif isinstance(stock, int):
+            return None, stock, None
+        elif isinstance(stock, str):
+            return self.__normalize(normalize_stock, stock)
+        elif isinstance(stock, float):
+            return None, int(stock), None
+        raise TypeError(f'Unable to parse stock for type: {type(stock)}')
+
+    def parse_text(self, text: Optional[str]) -> Optional[str]:
+        if text is None:
+            return None
+        elif isinstance(text, str):
+            return normalize_text(text)
+        raise TypeError(f'Unable to parse text for type: {type(text)}')
@@ -0,0 +1,184 @@
+import os
+import re
+import time
+import pickle
+import hashlib
+import tempfile
+import json as jslib
+
+from threading import Lock
+from collections import OrderedDict
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+from .data import Data
+
+
+# Define cached response
+class CacheEntry:
+    def __init__(self, body: Optional[bytes], status_code: int, url: str, headers: Mapping[str, str], reason: Optional[str], expires: float) -> None:
+        self.body = body
+        self.status_code = status_code
+        self.url = url
+        self.headers = dict(headers)
+        self.reason = reason
+        self.expires = expires
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires
+
+    @property
+    def validators(self) -> Dict[str, str]:
+
+        # Build conditional request headers
+        headers = dict[str, str]()
+        for header, value in self.headers.items():
+            if header.lower() == 'etag':
+                headers['If-None-Match'] = value
+            elif header.lower() == 'last-modified':
+                headers['If-Modified-Since'] = value
+        return headers
+
+
+# Define two-tier (memory LRU and disk) http response cache
+class Cache:
+    def __init__(self, maxsize: int = 1024, directory: Optional[str] = None, ttl: float = 0, routes: Optional[Mapping[str, float]] = None, methods: Tuple[str, ...] = ('GET',)) -> None:
+
+        # Validate options
+        if not isinstance(maxsize, int):
+            raise TypeError('Max size must be an integer')
+        if maxsize < 0:
+            raise ValueError('Max size must not be negative')
+        if directory is not None and not isinstance(directory, str):
+            raise TypeError('Directory must be a string or None')
+        if not isinstance(ttl, (int, float)):
+            raise TypeError('TTL must be a number')
+
+        # Set options
+        self.maxsize = maxsize
+        self.directory = directory
+        self.ttl = ttl
+        self.methods = tuple(method.upper() for method in methods)
+        self.routes = [(re.compile(pattern), route_ttl)
+                       for pattern, route_ttl in (routes or dict()).items()]
+
+        # Create directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        # Initialize state
+        self.__lock = Lock()
+        self.__entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self.__stats = dict(hits=0, misses=0, revalidations=0, evictions=0)
+
+    def __path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.pickle')
+
+    def __remember(self, key: str, entry: CacheEntry) -> None:
+
+        # Insert entry as most recently used
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+
+            # Evict least recently used entries
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+                self.__stats['evictions'] += 1
+
+    def clear(self) -> None:
+
+        # Clear memory tier
+        with self.__lock:
+            self.__entries.clear()
+
+        # Clear disk tier
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.pickle'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def expiry(self, url: str) -> float:
+
+        # Retrieve ttl of the first matching route (or default)
+        ttl = self.ttl
+        for pattern, route_ttl in self.routes:
+            if pattern.search(url) is not None:
+                ttl = route_ttl
+                break
+        return time.time() + ttl
+
+    def key(self, method: Union[str, bytes], url: Union[str, bytes], params: Data = None, data: Data = None, json: Data = None) -> Optional[str]:
+
+        # Check if method is cacheable
+        method = method.decode() if isinstance(method, bytes) else method
+        if method.upper() not in self.methods:
+            return None
+
+        # Hash request body
+        body = jslib.dumps([data, json], sort_keys=True, default=repr)
+        body = hashlib.sha256(body.encode()).hexdigest()
+
+        # Hash request
+        url = url.decode() if isinstance(url, bytes) else url
+        key = jslib.dumps([method.upper(), url, params, body],
+                          sort_keys=True, default=repr)
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+
+        # Retrieve entry from memory
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+
+        # Retrieve entry from disk
+        if entry is None and self.directory is not None:
+            try:
+                with open(self.__path(key), 'rb') as file:
+                    entry = pickle.load(file)
+                self.__remember(key, entry)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                entry = None
+
+        # Update stats (stale entries count as misses until revalidated)
+        with self.__lock:
+            self.__stats['hits' if entry is not None and entry.fresh else 'misses'] += 1
+
+        # Return entry
+        return entry
+
+    def refresh(self, key: str, url: str, entry: CacheEntry) -> CacheEntry:
+
+        # Extend expiry of revalidated entry
+        with self.__lock:
+            self.__stats['revalidations'] += 1
+        return self.store(key, url, entry)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self.__lock:
+            return dict(self.__stats)
+
+    def store(self, key: str, url: str, entry: CacheEntry) -> CacheEntry:
+
+        # Set entry expiry
+        entry.expires = self.expiry(url)
+
+        # Check if entry is worth keeping (fresh or revalidatable)
+        if not entry.fresh and len(entry.validators) == 0:
+            return entry
+
+        # Store entry in memory
+        self.__remember(key, entry)
+
+        # Store entry on disk (atomically, as other threads may be reading it)
+        if self.directory is not None:
+            descriptor, path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(descriptor, 'wb') as file:
+                pickle.dump(entry, file)
+            os.replace(path, self.__path(key))
+
+        # Return entry
+        return entry
@@ -0,0 +1,74 @@
+import time
+import threading
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+# Define token of the current thread
+_local = threading.local()
+
+
+# Define error raised when work is cancelled
+class Cancelled(Exception):
+    pass
+
+
+# Define cooperative cancellation token (with optional deadline)
+class CancellationToken:
+    def __init__(self, timeout: Optional[float] = None) -> None:
+
+        # Validate options
+        if timeout is not None and not isinstance(timeout, (int, float)):
+            raise TypeError('Timeout must be a number or None')
+
+        # Set deadline
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+
+        # Initialize state
+        self.__event = threading.Event()
+
+    def cancel(self) -> None:
+        self.__event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.__event.is_set() or (self.deadline is not None and time.monotonic() >= self.deadline)
+
+    def check(self) -> None:
+        if self.cancelled:
+            raise Cancelled()
+
+    def remaining(self) -> Optional[float]:
+
+        # Retrieve time left until deadline (None if there is none)
+        if self.__event.is_set():
+            return 0.0
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def sleep(self, seconds: float) -> None:
+
+        # Sleep (waking up early and raising if cancelled or past the deadline)
+        remaining = self.remaining()
+        if remaining is not None and remaining < seconds:
+            self.__event.wait(remaining)
+            raise Cancelled()
+        if self.__event.wait(seconds):
+            raise Cancelled()
+
+
+@contextmanager
+def cancellation(token: Optional[CancellationToken]) -> Iterator[Optional[CancellationToken]]:
+
+    # Set token of the current thread (restoring the previous one afterwards)
+    previous = getattr(_local, 'token', None)
+    _local.token = token
+    try:
+        yield token
+    finally:
+        _local.token = previous
+
+
+def current_token() -> Optional[CancellationToken]:
+    return getattr(_local, 'token', None)
@@ -0,0 +1,78 @@
+import time
+
+from collections import deque
+from threading import Condition, Lock
+from typing import Deque, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+# Define error raised when using a closed channel
+class ChannelClosed(Exception):
+    pass
+
+
+# Define bounded many-producer channel (producers block while it is full)
+class Channel(Generic[T]):
+    def __init__(self, maxsize: int = 0) -> None:
+
+        # Validate options
+        if not isinstance(maxsize, int):
+            raise TypeError('Max size must be an integer')
+        if maxsize < 0:
+            raise ValueError('Max size must not be negative')
+
+        # Set options
+        self.maxsize = maxsize
+
+        # Initialize state
+        self.__closed = False
+        self.__lock = Lock()
+        self.__items: Deque[T] = deque()
+        self.__not_empty = Condition(self.__lock)
+        self.__not_full = Condition(self.__lock)
+
+    def __full(self) -> bool:
+        return self.maxsize > 0 and len(self.__items) >= self.maxsize
+
+    def close(self) -> None:
+
+        # Wake up everyone waiting
+        with self.__lock:
+            self.__closed = True
+            self.__not_empty.notify_all()
+            self.__not_full.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    def pop(self, timeout: Optional[float] = None) -> T:
+        with self.__lock:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while len(self.__items) == 0:
+                if self.__closed:
+                    raise ChannelClosed()
+                if deadline is None:
+                    self.__not_empty.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError()
+                    self.__not_empty.wait(remaining)
+            item = self.__items.popleft()
+            self.__not_full.notify()
+            return item
+
+    def push(self, item: T) -> None:
+        with self.__lock:
+            while not self.__closed and self.__full():
+                self.__not_full.wait()
+            if self.__closed:
+                raise ChannelClosed()
+            self.__items.append(item)
+            self.__not_empty.notify()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__items)
@@ -1,228 +1,461 @@
-import io
+import os
+import time
 import imghdr
-import base64
 import pickle
+import itertools
 import logging
 import requests
-import json as jslib
 
-from bs4 import BeautifulSoup
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
-from calmjs.parse.parsers.es5 import Parser
-from urllib.parse import parse_qs, urlparse
-from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, TypeVar, Union
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 from .data import Data
+from .cache import Cache, CacheEntry
+from .cancellation import CancellationToken, Cancelled, cancellation, current_token
+from .session import Session, connect_time
+from .abstract_session_store import AbstractSessionStore, SessionKey
 from .response import Response
+from .image_store import ImageStore
+from .incremental import incremental
+from .snapshot_store import SnapshotStore
+from .rate_limiter import RateLimiter
+from .retry import IDEMPOTENT_METHODS, MAX_DELAY, RETRY_STATUSES, backoff, overloaded, retry_after
+from .base_crawler import BaseCrawler
 from .abstract_crawler import AbstractCrawler
 
-# Define generic bound to data
-_T = TypeVar('_T', bound=Data)
+if TYPE_CHECKING:
+    from bs4 import SoupStrainer
+
+
+# Define size of streamed chunks
+CHUNK_SIZE = 64 * 1024
 
 
 # Define base crawler
-class Crawler(AbstractCrawler, ABC):
-    # Define JavaScript parser
-    PARSER = Parser()
+class Crawler(BaseCrawler, AbstractCrawler, ABC):
+    # Define retry attempts for failed or throttled requests
+    RETRIES = 0
+
+    # Define base backoff (in seconds) between retries
+    BACKOFF = 0.5
+
+    # Define methods retried (add 'POST' only for requests without side effects)
+    RETRY_METHODS = IDEMPOTENT_METHODS
+
+    # Define longest delay (in seconds) honored from a Retry-After header
+    RETRY_DELAY = MAX_DELAY
+
+    # Define initial request rate (per second) for each netloc (None disables rate limiting)
+    RATE: Optional[float] = None
+
+    # Define slowest response time (in seconds) treated as healthy by the rate limiter (None only reacts to errors)
+    LATENCY: Optional[float] = None
+
+    # Define connections kept alive per host (shared by every thread using the crawler, grown by iter_all to the jobs it runs at once)
+    POOL_SIZE = 10
+
+    # Define lifetime (in seconds) of stored authenticated sessions
+    SESSION_TTL = 1800.0
+
+    # Define timeout (in seconds) of each request (None waits forever, unless a deadline is set)
+    TIMEOUT: Optional[float] = None
 
     def __init__(self, username: str, password: str, netloc: str, scheme: str = 'https') -> None:
 
-        # Validate credentials and options
-        if not isinstance(username, str):
-            raise TypeError('Username must be a string')
-        if not isinstance(password, str):
-            raise TypeError('Password must be a string')
-        if not isinstance(netloc, str):
-            raise TypeError('Netloc must be a string')
-        if not isinstance(scheme, str):
-            raise TypeError('Scheme must be a string')
-        if scheme not in ('http', 'https'):
-            raise ValueError('Scheme must be either http or https')
-
-        # Set credentials
-        self.username = username
-        self.password = password
-
-        # Set options
-        self.__netloc = netloc
-        self.__scheme = scheme
+        # Initialize superclass
+        super().__init__(username, password, netloc, scheme)
 
         # Create session
-        self.session = requests.Session()
+        self.session = Session(self.POOL_SIZE)
 
         # Set default user-agent
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/78.0.3904.108 Safari/537.36'
         })
 
-    @abstractmethod
-    def _fetch(self, term: str, quantity: int) -> Iterator[Dict[str, Any]]:
-        pass
+        # Disable response cache (opt-in)
+        self.cache: Optional[Cache] = None
 
-    def _preprocessing(self, content: bytes) -> Union[bytes, str]:
+        # Disable image store (opt-in)
+        self.images: Optional[ImageStore] = None
 
-        # # Retrieve content
-        return content
+        # Disable session store (opt-in)
+        self.store: Optional[AbstractSessionStore] = None
 
-    @property
-    def domain(self) -> str:
-        return f'{self.__scheme}://{self.__netloc}'
+        # Disable incremental mode (opt-in, emits only added, changed and removed products)
+        self.snapshots: Optional[SnapshotStore] = None
 
-    def dumps(self) -> bytes:
+        # Set authentication state
+        self.authenticated = False
+        self.__login_lock = Lock()
 
-        # Dump cookies
-        return pickle.dumps(self.session.cookies)
+    def __checked(self, terms: Iterable[Union[str, Tuple[str, Optional[Union[int, str]]]]]) -> Iterator[Union[str, Tuple[str, Optional[Union[int, str]]]]]:
 
-    def fetch(self, term: str, quantity: Optional[Union[int, str]] = None) -> Iterator[Dict[str, Any]]:
-        try:
-            term, quantity = self.validate(term, quantity)
-            logging.info(f'Fetching term={term}, quantity={quantity}')
-            return self._fetch(term, quantity)
-        except Exception as e:
-            logging.exception(e)
-        return iter(())
+        # Check cancellation token of the current job before each term
+        token = current_token()
+        for term in terms:
+            if token is not None:
+                token.check()
+            yield term
 
-    def fill(self, content: BeautifulSoup, payload: _T) -> _T:
+    def __counted(self, products: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
 
-        # Validate content as html
-        if not isinstance(content, BeautifulSoup):
-            raise TypeError(f'Content is not html: type={type(content)}')
+        # Count fetched products
+        for product in products:
+            self._count('products')
+            yield product
 
-        # Check payload
-        if payload is None:
-            return None
+    def __download(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
 
-        # Validate payload
-        elif not isinstance(payload, Mapping):
-            raise TypeError(
-                f'Payload is not a dictionary: type={type(payload)}')
+        # Read streamed chunks (reporting bytes and download time)
+        started = time.perf_counter()
+        for chunk in chunks:
+            self._count('bytes', len(chunk))
+            yield chunk
+        self._timing('request.download', time.perf_counter() - started)
 
-        # Fill payload
-        for key, current_value in payload.items():
+    def __location(self, url: Union[str, bytes], params: Data = None) -> str:
 
-            # Get field
-            field = content.find(attrs={'name': key})
+        # Build requested url (with query parameters, as requests encodes them)
+        return requests.Request('GET', url, params=params).prepare().url
 
-            # Check if field exists
-            if field is not None:
+    def __measure(self, response: requests.Response, elapsed: float, streamed: bool) -> None:
 
-                # Get field value
-                value = field.get('value')
+        # Report connection setup, time to first byte (headers) and download (unless streamed)
+        connect = connect_time()
+        first_byte = response.elapsed.total_seconds()
+        if connect > 0:
+            self._timing('request.connect', connect)
+        self._timing('request.ttfb', max(0.0, first_byte - connect))
+        if not streamed:
+            self._timing('request.download', max(0.0, elapsed - first_byte))
 
-                # Check if value exists
-                if value is not None:
+    def __request(self, method: Union[str, bytes], url: Union[str, bytes], params: Data = None, data: Data = None, headers: Data = None, json: Data = None, hint: Optional[str] = None, parser: Optional[str] = None, parse_only: Optional['SoupStrainer'] = None) -> Response:
 
-                    # Set payload value
-                    payload[key] = value
+        # Check if images may be served from (or stored in) the image store
+        images = self.images if self.images is not None and str(method).upper() == 'GET' and hint in (None, 'image') else None
 
-            # Check if field is required
-            elif current_value is None:
-                raise ValueError(f'Field {key} is required')
+        # Look image up in store (by requested url, query included)
+        location = None if images is None else self.__location(url, params)
+        if images is not None:
+            reference = images.lookup(location)
+            if reference is not None:
+                return Response(self, None, 200, urlparse(location), hint='image', reference=reference)
 
-        # Return payload
-        return payload
+        # Look response up in cache
+        key = None if self.cache is None else self.cache.key(
+            method, url, params=params, data=data, json=json)
+        entry = None if key is None else self.cache.lookup(key)
 
-    def get(self, url: Union[str, bytes], params: Data = None, data: Data = None, headers: Data = None, json: Data = None) -> Response:
+        # Check if cached response is fresh
+        if entry is not None and entry.fresh:
+            return self.__response(entry, hint, parser, parse_only)
 
-        # Make request
-        return self.request('GET', url, params=params, data=data, headers=headers, json=json)
+        # Otherwise revalidate cached response
+        elif entry is not None:
+            headers = {**entry.validators, **(headers or dict())}
 
-    def loads(self, state: bytes) -> None:
+        try:
+            # Make request
+            response = self.__send(method, url, params=params, data=data,
+                                   headers=headers, json=json, stream=images is not None)
+        except requests.TooManyRedirects as e:
+            return Response(self, None, 1000, urlparse(url), hint=hint, query=dict(), parser=parser, parse_only=parse_only)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            logging.debug(f'{url}:{method}')
+            logging.exception(e)
+            return Response(self, None, 1001, urlparse(url), hint=hint, query=dict(), parser=parser, parse_only=parse_only)
+
+        # Check if cached response is still valid
+        if entry is not None and response.status_code == 304:
+            entry = self.cache.refresh(key, url, entry)
+            return self.__response(entry, hint, parser, parse_only)
+
+        # Check if response is streamed
+        if images is not None:
+
+            # Stream images straight into the store
+            chunks = response.iter_content(CHUNK_SIZE)
+            head = next(chunks, b'')
+            if response.status_code == 200 and imghdr.what(None, head[:32]) is not None:
+                path = urlparse(response.url).path
+                name, _ = os.path.splitext(os.path.basename(path))
+                reference = images.put(self.__download(itertools.chain(
+                    (head,), chunks)), url=location, name=name or None)
+                return Response(self, None, 200, urlparse(response.url), headers=response.headers,
+                                reason=response.reason, hint='image', reference=reference)
+
+            # Otherwise read the rest of the content
+            content = b''.join(self.__download(itertools.chain((head,), chunks)))
+
+        # Otherwise read content
+        else:
+            content = response.content
+            self._count('bytes', len(content))
+
+        # Check if response is cacheable
+        if key is not None and response.status_code == 200:
+            self.cache.store(key, url, CacheEntry(content, response.status_code,
+                                                  response.url, response.headers, response.reason, 0))
+
+        # Return response (decoded lazily)
+        return Response(self, content, response.status_code, urlparse(response.url),
+                        headers=response.headers, reason=response.reason, hint=hint,
+                        parser=parser, parse_only=parse_only)
+
+    def __response(self, entry: CacheEntry, hint: Optional[str], parser: Optional[str], parse_only: Optional['SoupStrainer']) -> Response:
+
+        # Build response from cache entry
+        return Response(self, entry.body, entry.status_code, urlparse(entry.url),
+                        headers=entry.headers, reason=entry.reason, hint=hint,
+                        parser=parser, parse_only=parse_only)
+
+    def __retryable(self, method: Union[str, bytes]) -> bool:
+        method = method.decode() if isinstance(method, bytes) else method
+        return method.upper() in self.RETRY_METHODS
+
+    def __send(self, method: Union[str, bytes], url: Union[str, bytes], **kwargs: Any) -> requests.Response:
+
+        # Retrieve rate limiter shared by every crawler of the netloc
+        limiter = None if self.RATE is None else RateLimiter.for_netloc(
+            urlparse(url).netloc, self.RATE, latency=self.LATENCY)
+
+        # Retrieve cancellation token of the current job
+        token = current_token()
+
+        # Make request (retrying connection errors and throttled responses of idempotent methods)
+        retries = self.RETRIES if self.__retryable(method) else 0
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire(token)
+            if token is not None:
+                token.check()
+            started = time.monotonic()
+            connect_time()
+            self._count('requests')
+            if attempt > 0:
+                self._count('retries')
+            try:
+                response = self.session.request(
+                    method, url, timeout=self.__timeout(token), **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if limiter is not None:
+                    limiter.failure()
+                if token is not None and token.cancelled:
+                    raise Cancelled() from e
+                if attempt >= retries:
+                    raise
+                delay = None
+            else:
+                if self.instrument is not None:
+                    self.__measure(response, time.monotonic() - started, kwargs.get('stream', False))
+
+                # Slow down on throttling and server errors (pausing everyone if the server asked to)
+                delay = retry_after(response.headers.get('Retry-After'), self.RETRY_DELAY)
+                if limiter is not None:
+                    if overloaded(response.status_code):
+                        limiter.failure(delay)
+                    else:
+                        limiter.success(time.monotonic() - started)
+                if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                    return response
+                response.close()
+            logging.debug(f'Retrying {method}:{url} attempt={attempt + 1}')
+            delay = backoff(attempt, self.BACKOFF, delay)
+            remaining = None if token is None else token.remaining()
+            if remaining is not None and remaining < delay:
+                raise Cancelled()
+            if token is not None:
+                token.sleep(delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
 
-        # Loads cookies
-        self.session.cookies.update(pickle.loads(state))
+    def __timeout(self, token: Optional[CancellationToken]) -> Optional[float]:
 
-    @property
-    def netloc(self) -> str:
-        return self.__netloc
+        # Bound request timeout by the time left until the deadline
+        remaining = None if token is None else token.remaining()
+        if remaining is None:
+            return self.TIMEOUT
+        return remaining if self.TIMEOUT is None else min(self.TIMEOUT, remaining)
 
-    def post(self, url: Union[str, bytes], params: Data = None, data: Data = None, headers: Data = None, json: Data = None) -> Response:
+    @abstractmethod
+    def _fetch(self, term: str, quantity: int) -> Iterator[Dict[str, Any]]:
+        pass
 
-        # Make request
-        return self.request('POST', url, params=params, data=data, headers=headers, json=json)
+    def _login(self) -> bool:
+
+        # Log in (subclasses return True once authenticated, False if they have no login step)
+        return False
 
-    def request(self, method: Union[str, bytes], url: Union[str, bytes], params: Data = None, data: Data = None, headers: Data = None, json: Data = None) -> Response:
+    def _probe(self) -> bool:
 
+        # Check if a restored session is still valid (subclasses may make a cheap request)
+        return True
+
+    @property
+    def connections(self) -> Dict[str, int]:
+        return self.session.stats
+
+    def dumps(self) -> bytes:
+
+        # Dump cookies
+        return pickle.dumps(self.session.cookies)
+
+    def fetch(self, term: str, quantity: Optional[Union[int, str]] = None) -> Iterator[Dict[str, Any]]:
         try:
-            # Make request
-            response = self.session.request(method, url, params=params,
-                                            data=data, headers=headers, json=json)
-        except requests.TooManyRedirects as e:
-            return None, 1000, urlparse(url), dict()
-        except requests.ConnectionError as e:
-            logging.debug(f'{url}:{method}')
+            term, quantity = self.validate(term, quantity)
+            logging.info(f'Fetching term={term}, quantity={quantity}')
+            self.login()
+            products = self._fetch(term, quantity)
+            if self.instrument is not None:
+                products = self.__counted(products)
+            if self.snapshots is not None:
+                products = incremental(products, self.snapshots, self, term, quantity)
+            return products
+        except Cancelled:
+            raise
+        except Exception as e:
             logging.exception(e)
-            return None, 1001, urlparse(url), dict()
+            self._count('errors.fetch')
+        return iter(())
 
-        # Check status code
-        if response.status_code != 200:
+    def fetch_many(self, terms: Iterable[Union[str, Tuple[str, Optional[Union[int, str]]]]], quantity: Optional[Union[int, str]] = None) -> Iterator[Dict[str, Any]]:
 
-            # No content
-            content = response.reason
+        # Log in once (every term reuses the session and any state kept by the crawler)
+        self.login()
 
-        # Otherwise
-        else:
+        # Fetch each term in turn (stopping between terms once the job is cancelled)
+        yield from super().fetch_many(self.__checked(terms), quantity)
 
-            # Parse response content
-            content = response.content.strip()
+    def get(self, url: Union[str, bytes], params: Data = None, data: Data = None, headers: Data = None, json: Data = None, hint: Optional[str] = None, parser: Optional[str] = None, parse_only: Optional['SoupStrainer'] = None) -> Response:
 
-            # Check if response doesn't exist
-            if len(content) == 0:
-                content = None
+        # Make request
+        return self.request('GET', url, params=params, data=data, headers=headers, json=json, hint=hint, parser=parser, parse_only=parse_only)
 
-            # Otherwise
-            else:
+    def invalidate(self) -> None:
 
-                # Check if response is image
-                stream = io.BytesIO(content)
-                imgtype = imghdr.what(stream)
-                if imgtype is not None:
-                    content = base64.b64encode(content)
-                    content = content.decode()
-                    content = f'data:image/{imgtype};base64,{content}'
+        # Forget authenticated session (e.g. when the supplier logged us out)
+        with self.__login_lock:
+            self.authenticated = False
+            if self.store is not None:
+                self.store.delete(self.session_key)
 
-                # Otherwise
-                else:
+    def loads(self, state: bytes) -> None:
+
+        # Loads cookies
+        self.session.cookies.update(pickle.loads(state))
 
-                    # Try to parse response as json
-                    try:
-                        content = jslib.loads(content)
-                    except (jslib.JSONDecodeError, UnicodeDecodeError):
+    def login(self) -> bool:
+        with self.__login_lock:
+
+            # Check if already authenticated
+            if self.authenticated:
+                return True
+
+            # Try to reuse a warm session
+            if self.store is not None:
+                state = self.store.get(self.session_key)
+                if state is not None:
+                    self.loads(state)
+                    if self._probe():
+                        logging.info(f'Reusing session of {self}')
+                        self.authenticated = True
+                        return True
+                    self.store.delete(self.session_key)
+                    self.session.cookies.clear()
+
+            # Log in
+            if not self._login():
+                return False
+            self.authenticated = True
+
+            # Store session
+            if self.store is not None:
+                self.store.put(self.session_key, self.dumps(),
+                               time.time() + self.SESSION_TTL)
+            return True
+
+    def paginate(self, page: Callable[[int], Response], parse: Callable[[Response], Iterable[Dict[str, Any]]], quantity: int, page_size: Optional[int] = None, first: int = 1) -> Iterator[Dict[str, Any]]:
+
+        # Validate options
+        if not isinstance(quantity, int):
+            raise TypeError(f'Quantity must be an integer: type={type(quantity)}')
+        if page_size is not None and (not isinstance(page_size, int) or page_size < 1):
+            raise ValueError(f'Page size must be a positive integer: page_size={page_size}')
+        if quantity < 1:
+            return
+
+        # Load pages under the caller's cancellation token (so prefetches stop with it)
+        token = current_token()
+
+        def load(number: int) -> Response:
+            with cancellation(token):
+                return page(number)
+
+        # Request first page
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            count, largest, number = 0, 0, first
+            response = page(number)
+            while True:
+
+                # Prefetch next page while this one is parsed (only if it is expected to be needed)
+                estimate = page_size if largest == 0 else largest
+                following = None
+                if estimate is not None and count + estimate < quantity:
+                    following = executor.submit(load, number + 1)
+
+                # Yield products of page (stopping once there are enough)
+                products = 0
+                for product in parse(response):
+                    products, count = products + 1, count + 1
+                    yield product
+                    if count >= quantity:
+                        return
+
+                # Check if page was the last one (empty or shorter than previous pages)
+                if products == 0 or products < largest:
+                    return
+                largest = products
+
+                # Retrieve next page
+                number += 1
+                response = page(number) if following is None else following.result()
+
+        # Drop prefetched pages no longer needed
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def post(self, url: Union[str, bytes], params: Data = None, data: Data = None, headers: Data = None, json: Data = None, hint: Optional[str] = None, parser: Optional[str] = None, parse_only: Optional['SoupStrainer'] = None) -> Response:
+
+        # Make request
+        return self.request('POST', url, params=params, data=data, headers=headers, json=json, hint=hint, parser=parser, parse_only=parse_only)
 
-                        # Try to parse response as JavaScript
-                        try:
-                            content = self.PARSER.parse(content.decode())
-                        except (SyntaxError, UnicodeDecodeError):
+    def reserve(self, connections: int) -> None:
 
-                            # Parse response as html
-                            content = BeautifulSoup(
-                                self._preprocessing(content), 'html5lib')
+        # Grow connection pool so concurrent threads don't discard connections (never below POOL_SIZE)
+        self.session.resize(max(self.POOL_SIZE, connections))
 
-        # Parse url
-        url = urlparse(response.url)
+    def request(self, method: Union[str, bytes], url: Union[str, bytes], params: Data = None, data: Data = None, headers: Data = None, json: Data = None, hint: Optional[str] = None, parser: Optional[str] = None, parse_only: Optional['SoupStrainer'] = None) -> Response:
 
-        # Return response
-        return content, response.status_code, url, parse_qs(url.query)
+        # Make request
+        started = time.perf_counter()
+        response = self.__request(method, url, params=params, data=data, headers=headers,
+                                  json=json, hint=hint, parser=parser, parse_only=parse_only)
+
+        # Report request time and outcome (errors by sentinel or http status code)
+        if self.instrument is not None:
+            self._timing('request.total', time.perf_counter() - started)
+            self._count(f'status.{response.status_code}')
+            if response.status_code >= 400:
+                self._count(f'errors.{response.status_code}')
+        return response
 
     @property
-    def scheme(self) -> str:
-        return self.__scheme
-
-    def validate(self, term: str, quantity: Optional[Union[int, str]] = None) -> Tuple[str, int]:
-        # Parse term
-        if not isinstance(term, str):
-            raise TypeError('Term must be a string')
-
-        # Parse quantity
-        if quantity is None:
-            quantity = 4
-        elif isinstance(quantity, str):
-            if not quantity.isdigit():
-                raise ValueError('Quantity must be an integer')
-            quantity = int(quantity)
-        elif not isinstance(quantity, int):
-            raise TypeError(
-                'Quantity must be an integer or an integer string or None')
-
-        # Return term and quantity
-        return term, quantity
+    def session_key(self) -> SessionKey:
+        return f'{self.__class__.__module__}.{self.__class__.__qualname__}', self.netloc, self.username
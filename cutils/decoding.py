@@ -0,0 +1,73 @@
+import imghdr
+import base64
+import json as jslib
+
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+if TYPE_CHECKING:
+    from bs4 import SoupStrainer
+    from calmjs.parse.parsers.es5 import Parser
+
+# Define supported html parser engines
+HTML_PARSERS = ('html.parser', 'html5lib', 'lxml')
+
+# Define JavaScript parser of this process (built on first use)
+_PARSER: Optional['Parser'] = None
+
+
+# Define lazily built JavaScript parser (shared by every crawler of the process)
+class LazyParser:
+    def __get__(self, instance: Any, owner: Any = None) -> 'Parser':
+        return shared_parser()
+
+
+def decode(content: Union[bytes, str], kind: str, parser: str = 'html5lib', parse_only: Optional['SoupStrainer'] = None, js_parser: Optional['Parser'] = None) -> Any:
+
+    # Decode image as data uri
+    if kind == 'image':
+        imgtype = imghdr.what(None, content)
+        if imgtype is None:
+            raise ValueError('Content is not a known image type')
+        content = base64.b64encode(content)
+        content = content.decode()
+        return f'data:image/{imgtype};base64,{content}'
+
+    # Decode json
+    elif kind == 'json':
+        return jslib.loads(content)
+
+    # Decode JavaScript
+    elif kind == 'js':
+        if js_parser is None:
+            js_parser = shared_parser()
+        return js_parser.parse(content.decode() if isinstance(content, bytes) else content)
+
+    # Decode html
+    elif kind == 'html':
+        if parser not in HTML_PARSERS:
+            raise ValueError(
+                f'Parser must be one of {HTML_PARSERS}: parser={parser}')
+
+        # Parse html (html5lib always builds the whole document)
+        from bs4 import BeautifulSoup
+        if parser == 'html5lib':
+            parse_only = None
+        return BeautifulSoup(content, parser, parse_only=parse_only)
+    raise ValueError(f'Unable to decode content for kind: {kind}')
+
+
+def decode_and_extract(content: Union[bytes, str], kind: str, parser: str = 'html5lib', parse_only: Optional['SoupStrainer'] = None, extract: Optional[Callable[[Any], Any]] = None, js_parser: Optional['Parser'] = None) -> Any:
+
+    # Decode content and reduce it to a (picklable) result
+    decoded = decode(content, kind, parser, parse_only, js_parser)
+    return decoded if extract is None else extract(decoded)
+
+
+def shared_parser() -> 'Parser':
+    global _PARSER
+
+    # Build JavaScript parser (importing calmjs and building its tables on first use)
+    if _PARSER is None:
+        from calmjs.parse.parsers.es5 import Parser
+        _PARSER = Parser()
+    return _PARSER
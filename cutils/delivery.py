@@ -0,0 +1,108 @@
+import re
+
+from functools import lru_cache
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from .normalization import CACHE_SIZE, SPACES, normalize_ascii
+
+# Define month numbers for each (ascii) Portuguese month name and abbreviation
+MONTHS = {
+    'janeiro': 1, 'jan': 1,
+    'fevereiro': 2, 'fev': 2,
+    'marco': 3, 'mar': 3,
+    'abril': 4, 'abr': 4,
+    'maio': 5, 'mai': 5,
+    'junho': 6, 'jun': 6,
+    'julho': 7, 'jul': 7,
+    'agosto': 8, 'ago': 8,
+    'setembro': 9, 'set': 9,
+    'outubro': 10, 'out': 10,
+    'novembro': 11, 'nov': 11,
+    'dezembro': 12, 'dez': 12,
+}
+
+# Define weekday numbers for each (ascii) Portuguese weekday name
+WEEKDAYS = {
+    'segunda': 0,
+    'terca': 1,
+    'quarta': 2,
+    'quinta': 3,
+    'sexta': 4,
+    'sabado': 5,
+    'domingo': 6,
+}
+
+# Define hour for each part of the day
+PERIODS = {
+    'manha': 10,
+    'tarde': 16,
+}
+
+# Define precompiled delivery patterns
+START = re.compile(r'inicio\s+de\s+')
+DAY = re.compile(
+    r'(([1-2][0-9])|(([0])?[1-9])|(3[0-1]))\s+de\s+(\w+)(\s+de\s+(\d{4}))?')
+RELATIVE = re.compile(
+    r'(depois\s+de\s+)?(amanha|hoje)(\s+de\s+(manha|tarde))?')
+WEEKDAY = re.compile(
+    r'\b(segunda|terca|quarta|quinta|sexta|sabado|domingo)\b')
+
+# Define dateparser settings (fallback for unrecognized phrases)
+SETTINGS = {
+    'SKIP_TOKENS': ['o', 't', 'da', 'de', 'do'],
+    'PREFER_DATES_FROM': 'future',
+    'DATE_ORDER': 'DMY',
+}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_delivery(delivery: str, today: date) -> Optional[datetime]:
+    midnight = datetime(today.year, today.month, today.day)
+
+    # Parse "<dd> de <month>" (and "inicio de <month>")
+    delivery = START.sub('1 de ', delivery)
+    match = DAY.search(delivery)
+    if match is not None:
+        month = MONTHS.get(match.group(6))
+        if month is not None:
+            day = int(match.group(1))
+            year = today.year if match.group(8) is None else int(match.group(8))
+            try:
+                result = datetime(year, month, day)
+                if match.group(8) is None and result < midnight:
+                    result = result.replace(year=year + 1)
+                return result
+            except ValueError:
+                pass
+        delivery = match.group(0)
+
+    # Otherwise parse "hoje", "amanha" and "depois de amanha" (de manha / de tarde)
+    else:
+        match = RELATIVE.search(delivery)
+        if match is not None:
+            days = 0 if match.group(2) == 'hoje' else 1
+            if match.group(1) is not None:
+                days += 1
+            return midnight + timedelta(days=days, hours=PERIODS.get(match.group(4), 0))
+
+        # Otherwise parse weekday (next occurrence)
+        match = WEEKDAY.search(delivery)
+        if match is not None:
+            days = (WEEKDAYS[match.group(1)] - today.weekday() - 1) % 7 + 1
+            return midnight + timedelta(days=days)
+
+    # Fallback to dateparser (imported on first use, as it is slow to load)
+    import dateparser
+    result = dateparser.parse(
+        delivery, settings={**SETTINGS, 'RELATIVE_BASE': midnight})
+    if result is not None:
+        result = result.replace(hour=0, minute=0, second=0, microsecond=0)
+    return result
+
+
+def normalize_delivery(delivery: str, today: Optional[date] = None) -> Optional[datetime]:
+
+    # Normalize phrase (memoized per normalized phrase and current date)
+    delivery = SPACES.sub(' ', normalize_ascii(delivery).lower().strip())
+    return parse_delivery(delivery, date.today() if today is None else today)
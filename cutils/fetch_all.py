@@ -1,97 +1,273 @@
 import logging
 
-from threading import Condition, Thread, current_thread
-from typing import Any, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar, Union
+from functools import partial
+from threading import Lock, Semaphore, Thread, Timer
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Union
 
+from .merge import merge_best
+from .scheduler import Scheduler
+from .channel import Channel, ChannelClosed
+from .cancellation import CancellationToken, Cancelled, cancellation
+from .incremental import deferred, track
+from .fetch_queued import Query, iter_queued
+from .abstract_job_queue import AbstractJobQueue
+from .snapshot_store import SnapshotStore
 from .abstract_crawler import AbstractCrawler
 
-T = TypeVar('T')
 
+def fetch_each(channel: Channel[Union[List[Dict[str, Any]], int]], crawler: AbstractCrawler, query: Query, identity: int, batch_size: int = 1, flush_interval: Optional[float] = None, token: Optional[CancellationToken] = None, snapshots: Optional[SnapshotStore] = None, saves: Optional[Dict[int, List[Callable[[], None]]]] = None, errors: Optional[Dict[int, str]] = None) -> None:
 
-class Queue(Generic[T]):
-    def __init__(self) -> None:
-        self.__queue = list[T]()
-        self.__condition = Condition()
+    # Initialize batch (shared with the flush timer)
+    lock, batch, timer = Lock(), list[Dict[str, Any]](), None
 
-    def push(self, item: T) -> None:
-        with self.__condition:
-            self.__queue.append(item)
-            self.__condition.notify()
+    def flush() -> None:
+        nonlocal batch
+        with lock:
+            if len(batch) > 0:
+                channel.push(batch)
+                batch = list[Dict[str, Any]]()
 
-    def pop(self, block: bool = True) -> T:
-        with self.__condition:
-            while block and len(self.__queue) == 0:
-                self.__condition.wait()
-            return self.__queue.pop()
+    def expire() -> None:
+        try:
+            flush()
+        except ChannelClosed:
+            pass
 
-    def pop_all(self, block: bool = True) -> Iterator[T]:
-        with self.__condition:
-            while block and len(self.__queue) == 0:
-                self.__condition.wait()
-            while len(self.__queue) > 0:
-                yield self.__queue.pop(0)
+    try:
+        # Run job under the cancellation token (so requests observe it), deferring snapshot saves to the consumer
+        pending = list[Callable[[], None]]()
+        with cancellation(token), deferred(pending):
 
+            # Check if job was cancelled before starting
+            if token is not None:
+                token.check()
 
-def fetch_each(queue: Queue[Union[Dict[str, Any], int]], crawler: AbstractCrawler, query: Tuple[str, Optional[Union[int, str]]]) -> None:
-    try:
-        for product in crawler.fetch(*query):
-            queue.push(product)
+            # Push products in batches (flushed when full, or by a timer once the oldest product is too old)
+            products = crawler.fetch(*query)
+            if snapshots is not None:
+                products = track(products, snapshots, crawler, query)
+            for product in products:
+                if token is not None:
+                    token.check()
+                with lock:
+                    batch.append(product)
+                    size = len(batch)
+                if size >= batch_size:
+                    if timer is not None:
+                        timer.cancel()
+                    flush()
+                elif size == 1 and flush_interval is not None:
+                    timer = Timer(flush_interval, expire)
+                    timer.daemon = True
+                    timer.start()
+            flush()
+
+        # Hand snapshot saves to the consumer (or run them if it doesn't collect them) and push identity to signal the end of the job
+        if saves is None:
+            for save in pending:
+                save()
+        elif len(pending) > 0:
+            saves[identity] = pending
+        channel.push(identity)
+
+    # Stop quietly if the consumer went away (or the job was cancelled)
+    except (Cancelled, ChannelClosed):
+        pass
     except Exception as e:
         logging.exception(e)
-    queue.push(current_thread().ident)
+        if errors is not None:
+            errors[identity] = repr(e)
+        try:
+            channel.push(identity)
+        except ChannelClosed:
+            pass
+
+    # Stop flush timer
+    finally:
+        if timer is not None:
+            timer.cancel()
+
+
+def fetch_concurrency(crawler: AbstractCrawler, crawlers: List[AbstractCrawler], queries: int, workers: Optional[int] = None, per_netloc: Optional[int] = None) -> int:
+
+    # Count jobs of the crawler (capped by the pool and by the limit of its netloc)
+    concurrency = queries * sum(1 for other in crawlers if other is crawler)
+    if workers is not None:
+        concurrency = min(concurrency, workers)
+    if per_netloc is not None:
+        concurrency = min(concurrency, per_netloc)
+    return concurrency
+
 
+def fetch_key(crawler: AbstractCrawler) -> Hashable:
 
-def fetch_next(queue: Queue[Union[Dict[str, Any], int]], threads: Dict[int, Thread]) -> Iterator[Dict[str, Any]]:
-    
-    # Get products from queue
-    products = queue.pop_all()
+    # Group crawlers by netloc (or by instance if they have none)
+    return getattr(crawler, 'netloc', None) or id(crawler)
 
-    # Process products
-    for product in products:
 
-        # Check if product is an identity
-        if isinstance(product, int):
+def fetch_limited(semaphore: Semaphore, task: Callable[[], None]) -> None:
 
-            # Remove thread from threads
-            thread = threads.pop(product, None)
+    # Run task once its netloc has a free slot
+    with semaphore:
+        task()
 
-            # Check if thread exists
-            if thread is not None:
 
-                # Join thread
-                thread.join()
+def iter_all(crawlers: List[AbstractCrawler], *queries: Query, workers: Optional[int] = None, per_netloc: Optional[int] = None, maxsize: int = 1024, batch_size: int = 1, flush_interval: Optional[float] = None, merge: Optional[Callable[[Dict[str, Any]], Optional[Hashable]]] = None, timeout: Optional[float] = None, limit: Optional[int] = None, on_timeout: Optional[Callable[[AbstractCrawler, Query], None]] = None, on_error: Optional[Callable[[AbstractCrawler, Query, str], None]] = None, snapshots: Optional[SnapshotStore] = None, queue: Optional[AbstractJobQueue] = None) -> Iterator[Dict[str, Any]]:
 
-        # Othewise check if product is not None
-        elif product is not None:
-            yield product
+    # Check if products should be merged (keeping and emitting the best offer per key) or limited
+    if merge is not None or limit is not None:
 
+        # Validate options
+        if limit is not None and not isinstance(limit, int):
+            raise TypeError('Limit must be an integer or None')
+        if limit is not None and limit < 1:
+            raise ValueError('Limit must be positive')
 
-def fetch_all(crawlers: List[AbstractCrawler], *queries: Tuple[str, Optional[Union[int, str]]]) -> Iterator[Iterator[Dict[str, Any]]]:
+        # Stop all jobs once enough products were yielded
+        stream = iter_all(crawlers, *queries, workers=workers, per_netloc=per_netloc, maxsize=maxsize, batch_size=batch_size,
+                          flush_interval=flush_interval, timeout=timeout, on_timeout=on_timeout, on_error=on_error, snapshots=snapshots, queue=queue)
+        try:
+            products = stream if merge is None else merge_best(stream, merge)
+            for count, product in enumerate(products, 1):
+                yield product
+                if count == limit:
+                    break
+        finally:
+            stream.close()
+        return
 
-    # Initialize queue
-    queue = Queue[Union[Dict[str, Any], int]]()
+    # Check if jobs should run in worker processes (results are streamed back through the queue)
+    if queue is not None:
+        yield from iter_queued(queue, crawlers, *queries, batch_size=batch_size,
+                               timeout=timeout, on_timeout=on_timeout, on_error=on_error, snapshots=snapshots)
+        return
 
-    # Initialize threads
-    threads = dict[int, Thread]()
+    # Validate options
+    if not isinstance(batch_size, int):
+        raise TypeError('Batch size must be an integer')
+    if batch_size < 1:
+        raise ValueError('Batch size must be positive')
+    if per_netloc is not None and not isinstance(per_netloc, int):
+        raise TypeError('Per netloc limit must be an integer or None')
+    if per_netloc is not None and per_netloc < 1:
+        raise ValueError('Per netloc limit must be positive')
 
-    # Open threads
+    # Initialize cancellation token (shared by all jobs, expiring at the deadline)
+    token = CancellationToken(timeout)
+
+    # Initialize channel (bounded, in batches)
+    channel = Channel[Union[List[Dict[str, Any]], int]](maxsize)
+
+    # Initialize threads (None for jobs run by the scheduler) and their jobs
+    threads = dict[int, Optional[Thread]]()
+    jobs = dict[int, Tuple[AbstractCrawler, Query]]()
+
+    # Initialize snapshot saves of finished jobs (run once the consumer received all their records)
+    saves = dict[int, List[Callable[[], None]]]()
+
+    # Initialize errors of failed jobs (reported once the consumer reaches their end)
+    errors = dict[int, str]()
+
+    # Initialize scheduler if pooled (otherwise limit threads of each netloc with semaphores)
+    scheduler = None if workers is None else Scheduler(workers, per_netloc)
+    semaphores = dict[Hashable, Semaphore]()
+
+    # Size connection pools to the jobs each crawler may run at once
+    for crawler in crawlers:
+        reserve = getattr(crawler, 'reserve', None)
+        if reserve is not None:
+            reserve(fetch_concurrency(crawler, crawlers, len(queries), workers, per_netloc))
+
+    # Open jobs
     for query in queries:
         for crawler in crawlers:
 
-            # Create thread
-            thread = Thread(target=fetch_each, args=(queue, crawler, query))
+            # Identify job
+            identity = len(threads)
+            jobs[identity] = crawler, query
+            task = partial(fetch_each, channel, crawler, query,
+                           identity, batch_size, flush_interval, token, snapshots, saves, errors)
+
+            # Check if pooled
+            if scheduler is not None:
+
+                # Add job to threads
+                threads[identity] = None
+
+                # Submit job
+                scheduler.submit(fetch_key(crawler), task)
+
+            # Otherwise
+            else:
+
+                # Create thread (waiting for a slot of its netloc if limited)
+                if per_netloc is not None:
+                    semaphore = semaphores.setdefault(fetch_key(crawler), Semaphore(per_netloc))
+                    task = partial(fetch_limited, semaphore, task)
+                thread = Thread(target=task)
+
+                # Add thread to threads
+                threads[identity] = thread
+
+                # Start thread
+                thread.start()
+
+    # Stop scheduler once submitted jobs are done
+    if scheduler is not None:
+        scheduler.close()
+
+    try:
+        # While jobs are running
+        while len(threads) > 0:
+
+            # Retrieve batch (until the deadline)
+            try:
+                batch = channel.pop(token.remaining())
+
+            # Report jobs still running at the deadline
+            except TimeoutError:
+                if on_timeout is not None:
+                    for identity in threads:
+                        on_timeout(*jobs[identity])
+                break
+
+            # Check if batch is an identity
+            if isinstance(batch, int):
+
+                # Remove thread from threads
+                thread = threads.pop(batch, None)
+
+                # Check if thread exists
+                if thread is not None:
+
+                    # Join thread
+                    thread.join()
+
+                # Report failed job
+                error = errors.pop(batch, None)
+                if error is not None and on_error is not None:
+                    on_error(*jobs[batch], error)
+
+                # Save snapshots of the job (every record was yielded)
+                for save in saves.pop(batch, ()):
+                    try:
+                        save()
+                    except Exception as e:
+                        logging.exception(e)
 
-            # Start thread
-            thread.start()
+            # Otherwise yield products
+            else:
+                for product in batch:
+                    if product is not None:
+                        yield product
 
-            # Add thread to threads
-            threads[thread.ident] = thread
+    # Cancel and release producers (if the consumer stopped early)
+    finally:
+        token.cancel()
+        channel.close()
 
-    # While threads are running
-    while len(threads) > 0:
 
-        # Retrieve products
-        yield fetch_next(queue, threads)
+def fetch_all(crawlers: List[AbstractCrawler], *queries: Query, workers: Optional[int] = None, per_netloc: Optional[int] = None, merge: Optional[Callable[[Dict[str, Any]], Optional[Hashable]]] = None, timeout: Optional[float] = None, limit: Optional[int] = None, on_timeout: Optional[Callable[[AbstractCrawler, Query], None]] = None, on_error: Optional[Callable[[AbstractCrawler, Query, str], None]] = None, snapshots: Optional[SnapshotStore] = None, queue: Optional[AbstractJobQueue] = None) -> Iterator[Iterator[Dict[str, Any]]]:
 
-    # Yield any products left in queue
-    yield queue.pop_all(block=False)
\ No newline at end of file
+    # Yield products as a single stream
+    yield iter_all(crawlers, *queries, workers=workers, per_netloc=per_netloc, merge=merge, timeout=timeout, limit=limit, on_timeout=on_timeout, on_error=on_error, snapshots=snapshots, queue=queue)
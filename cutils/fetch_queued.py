@@ -0,0 +1,167 @@
+import time
+import uuid
+import pickle
+import inspect
+import logging
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from .safe_pickle import SafeUnpickler
+from .cancellation import CancellationToken
+from .snapshot_store import SnapshotStore
+from .abstract_crawler import AbstractCrawler
+from .abstract_job_queue import AbstractJobQueue
+
+# Define query type
+Query = Tuple[str, Optional[Union[int, str]]]
+
+# Define crawler attributes kept out of job specifications
+PRIVATE = ('username', 'password', 'session', 'client', 'authenticated', 'FACTORY')
+
+# Define message types sent back by workers
+PRODUCTS = 'products'
+SNAPSHOT = 'snapshot'
+FAILED = 'failed'
+TIMEOUT = 'timeout'
+
+
+def job_options(crawler: AbstractCrawler) -> Dict[str, Any]:
+
+    # Collect options set on the crawler (credentials and runtime state never leave this process)
+    options = dict[str, Any]()
+    for name, value in vars(crawler).items():
+        if name.startswith('_') or name in PRIVATE or value is None:
+            continue
+
+        # Check if option can be sent to workers (otherwise the factory must set it up)
+        try:
+            pickle.dumps(value)
+        except Exception as e:
+            raise ValueError(f'Option {name} of {crawler} can\'t be sent to workers (set it up in its factory)') from e
+        options[name] = value
+    return options
+
+
+def job_spec(crawler: AbstractCrawler, query: Query, batch_size: int = 50, snapshots: Optional[SnapshotStore] = None, deadline: Optional[float] = None) -> bytes:
+
+    # Reference crawler by factory (or class) path, so workers build it with their own credentials
+    cls = crawler.__class__
+    factory = getattr(crawler, 'FACTORY', None)
+    if factory is None:
+
+        # Check if workers can build the crawler by calling its class
+        try:
+            inspect.signature(cls).bind()
+        except (TypeError, ValueError) as e:
+            raise ValueError(f'{crawler} can\'t be built by workers without arguments (set FACTORY to a function building it)') from e
+        factory = f'{cls.__module__}:{cls.__qualname__}'
+
+    # Send authenticated session (so workers reuse it instead of logging in again)
+    state = crawler.dumps() if getattr(crawler, 'authenticated', False) else None
+
+    # Describe job (crawler, options, session, query, snapshot store path and wall-clock deadline)
+    return pickle.dumps(dict(crawler=factory, options=job_options(crawler), state=state, query=tuple(query), batch_size=batch_size,
+                             snapshots=None if snapshots is None else snapshots.path, deadline=deadline))
+
+
+def message(kind: str, **fields: Any) -> bytes:
+
+    # Encode message of a worker (read back as plain data only)
+    return pickle.dumps(dict(fields, type=kind))
+
+
+def iter_queued(queue: AbstractJobQueue, crawlers: List[AbstractCrawler], *queries: Query, batch_size: int = 50, poll_interval: float = 0.1, timeout: Optional[float] = None, on_timeout: Optional[Callable[[AbstractCrawler, Query], None]] = None, on_error: Optional[Callable[[AbstractCrawler, Query, str], None]] = None, snapshots: Optional[SnapshotStore] = None) -> Iterator[Dict[str, Any]]:
+
+    # Validate options
+    if not isinstance(batch_size, int):
+        raise TypeError('Batch size must be an integer')
+    if batch_size < 1:
+        raise ValueError('Batch size must be positive')
+
+    # Initialize deadline (sent to workers as wall-clock time, as monotonic clocks differ between processes)
+    token = CancellationToken(timeout)
+    deadline = None if timeout is None else time.time() + timeout
+
+    # Describe jobs before publishing any (so a crawler workers can't build fails the whole run upfront)
+    specs = [(crawler, query, job_spec(crawler, query, batch_size, snapshots, deadline)) for query in queries for crawler in crawlers]
+
+    # Publish jobs (workers claim them from the queue)
+    run = uuid.uuid4().hex
+    jobs = dict[int, Tuple[AbstractCrawler, Query]]()
+    for crawler, query, spec in specs:
+        jobs[queue.submit(run, spec)] = crawler, query
+
+    # Initialize snapshots sent by workers (saved once all records of their job were yielded)
+    saves = dict[int, List[Tuple[str, str, Dict[str, str]]]]()
+
+    try:
+        # While jobs are running
+        cursor = 0
+        while len(jobs) > 0:
+
+            # Report jobs still running at the deadline
+            if token.cancelled:
+                if on_timeout is not None:
+                    for crawler, query in jobs.values():
+                        on_timeout(crawler, query)
+                break
+
+            # Retrieve results (waiting for workers if there are none)
+            results = queue.poll(run, cursor)
+            if len(results) == 0:
+                remaining = token.remaining()
+                time.sleep(poll_interval if remaining is None else min(poll_interval, remaining))
+                continue
+
+            # Handle results of jobs still running
+            for cursor, job, payload in results:
+                if job not in jobs:
+                    continue
+
+                # Remove finished job (saving its snapshots, as every record was yielded)
+                if payload is None:
+                    jobs.pop(job)
+                    for owner, query, fingerprints in saves.pop(job, ()):
+                        try:
+                            snapshots.save(owner, query, fingerprints)
+                        except Exception as e:
+                            logging.exception(e)
+                    continue
+
+                # Decode message (as plain data, treating anything else as a failure of the job)
+                try:
+                    message = SafeUnpickler.loads(payload)
+                    kind = message['type']
+                except Exception as e:
+                    message, kind = dict(error=repr(e)), FAILED
+
+                # Yield products
+                if kind == PRODUCTS:
+                    yield from message['products']
+
+                # Keep snapshot (if the caller tracks changes)
+                elif kind == SNAPSHOT:
+                    if snapshots is not None:
+                        saves.setdefault(job, list[Tuple[str, str, Dict[str, str]]]()).append((message['owner'], message['query'], message['fingerprints']))
+
+                # Report job that reached the deadline on its worker
+                elif kind == TIMEOUT:
+                    saves.pop(job, None)
+                    crawler, query = jobs.pop(job)
+                    if on_timeout is not None:
+                        on_timeout(crawler, query)
+
+                # Report failed job (logging it unless the caller handles it)
+                else:
+                    saves.pop(job, None)
+                    crawler, query = jobs.pop(job)
+                    error = message.get('error', f'Unknown message type: type={kind}')
+                    if on_error is not None:
+                        on_error(crawler, query, error)
+                    else:
+                        logging.error(f'Job of {crawler} failed: query={query}, error={error}')
+
+    # Stop workers still running jobs of the run and drop its rows
+    finally:
+        queue.cancel(run)
+        queue.purge(run)
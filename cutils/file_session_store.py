@@ -0,0 +1,57 @@
+import os
+import time
+import pickle
+import hashlib
+import tempfile
+
+from typing import Optional
+
+from .abstract_session_store import AbstractSessionStore, SessionKey
+
+
+# Define file-based session store (one file per session)
+class FileSessionStore(AbstractSessionStore):
+    def __init__(self, directory: str) -> None:
+
+        # Validate options
+        if not isinstance(directory, str):
+            raise TypeError('Directory must be a string')
+
+        # Set options
+        self.directory = directory
+
+        # Create directory
+        os.makedirs(directory, exist_ok=True)
+
+    def __path(self, key: SessionKey) -> str:
+        name = hashlib.sha256('\0'.join(key).encode()).hexdigest()
+        return os.path.join(self.directory, f'{name}.session')
+
+    def delete(self, key: SessionKey) -> None:
+        try:
+            os.remove(self.__path(key))
+        except FileNotFoundError:
+            pass
+
+    def get(self, key: SessionKey) -> Optional[bytes]:
+
+        # Read session
+        try:
+            with open(self.__path(key), 'rb') as file:
+                state, expires = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        # Check expiry
+        if expires <= time.time():
+            self.delete(key)
+            return None
+        return state
+
+    def put(self, key: SessionKey, state: bytes, expires: float) -> None:
+
+        # Write session atomically
+        descriptor, path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(descriptor, 'wb') as file:
+            pickle.dump((state, expires), file)
+        os.replace(path, self.__path(key))
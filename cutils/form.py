@@ -0,0 +1,68 @@
+from bs4 import Tag
+from typing import Optional, Union
+
+# Define named form controls
+CONTROLS = ('button', 'input', 'select', 'textarea')
+
+
+# Define form field index (built in a single traversal)
+class Form:
+    def __init__(self, content: Tag, form: Optional[Union[str, Tag]] = None) -> None:
+
+        # Validate content as html
+        if not isinstance(content, Tag):
+            raise TypeError(f'Content is not html: type={type(content)}')
+
+        # Retrieve scope (by id or name if form is a string)
+        if form is None:
+            scope = content
+        elif isinstance(form, Tag):
+            scope = form
+        elif isinstance(form, str):
+            scope = content.find('form', attrs={'id': form}) or content.find(
+                'form', attrs={'name': form})
+            if scope is None:
+                raise ValueError(f'Form {form} not found')
+        else:
+            raise TypeError(f'Form must be a string or html: type={type(form)}')
+
+        # Set form options
+        self.action = scope.get('action') if scope.name == 'form' else None
+        self.method = (scope.get('method') or 'GET').upper() if scope.name == 'form' else None
+
+        # Index named controls (first occurrence wins, unless a later radio/checkbox is checked)
+        self.fields = dict[str, Optional[str]]()
+        for field in scope.find_all(CONTROLS, attrs={'name': True}):
+            name = field['name']
+            if name not in self.fields or (field.name == 'input' and field.get('type') in ('checkbox', 'radio') and field.has_attr('checked')):
+                self.fields[name] = self.__value(field)
+
+    @staticmethod
+    def __value(field: Tag) -> Optional[str]:
+
+        # Retrieve text area value
+        if field.name == 'textarea':
+            return field.get_text()
+
+        # Retrieve selected (or first) option value
+        elif field.name == 'select':
+            option = field.find('option', selected=True) or field.find('option')
+            if option is None:
+                return None
+            value = option.get('value')
+            return option.get_text().strip() if value is None else value
+
+        # Retrieve input or button value
+        return field.get('value')
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.fields
+
+    def __getitem__(self, name: str) -> Optional[str]:
+        return self.fields[name]
+
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    def __repr__(self) -> str:
+        return f'Form(action={self.action}, method={self.method}, fields={len(self.fields)})'
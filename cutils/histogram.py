@@ -0,0 +1,93 @@
+import math
+
+from bisect import bisect_left
+from typing import List, Optional, Sequence
+
+# Define default bucket upper bounds (in seconds, roughly logarithmic)
+BOUNDS = (0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+          0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 60.0)
+
+
+# Define fixed-bucket histogram of durations
+class Histogram:
+    def __init__(self, bounds: Sequence[float] = BOUNDS) -> None:
+
+        # Validate bounds
+        if len(bounds) == 0 or any(lower >= upper for lower, upper in zip(bounds, bounds[1:])):
+            raise ValueError('Bounds must be non-empty and increasing')
+
+        # Initialize buckets (the last one holds values above every bound)
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return None if self.count == 0 else self.total / self.count
+
+    def merge(self, other: 'Histogram') -> 'Histogram':
+
+        # Validate bounds
+        if other.bounds != self.bounds:
+            raise ValueError('Histograms must have the same bounds')
+
+        # Add other histogram's buckets
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def percentile(self, fraction: float) -> Optional[float]:
+
+        # Check if there are values
+        if self.count == 0:
+            return None
+
+        # Retrieve upper bound of the bucket holding the rank (capped by the observed extremes)
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                bound = self.bounds[index] if index < len(self.bounds) else self.maximum
+                return max(self.minimum, min(bound, self.maximum))
+        return self.maximum
+
+    def render(self, width: int = 40) -> List[str]:
+
+        # Check if there are values
+        if self.count == 0:
+            return list[str]()
+
+        # Render non-empty bucket range as bars
+        indexes = [index for index, count in enumerate(self.counts) if count > 0]
+        peak = max(self.counts)
+        lines = list[str]()
+        for index in range(indexes[0], indexes[-1] + 1):
+            count = self.counts[index]
+            label = f'<= {duration(self.bounds[index])}' if index < len(self.bounds) else f' > {duration(self.bounds[-1])}'
+            lines.append(f'{label:>11} | {"#" * math.ceil(width * count / peak):<{width}} {count}')
+        return lines
+
+
+def duration(seconds: float) -> str:
+
+    # Format duration with a readable unit
+    if seconds < 0.001:
+        return f'{seconds * 1000000:.3g}us'
+    elif seconds < 1:
+        return f'{seconds * 1000:.4g}ms'
+    return f'{seconds:.4g}s'
@@ -0,0 +1,118 @@
+import os
+import imghdr
+import hashlib
+import tempfile
+
+from typing import Iterable, Optional
+
+
+# Define reference to a stored image
+class ImageReference:
+    def __init__(self, digest: str, path: str, imgtype: str, url: Optional[str] = None, name: Optional[str] = None) -> None:
+        self.digest = digest
+        self.path = path
+        self.imgtype = imgtype
+        self.url = url
+        self.name = name
+
+    def read(self) -> bytes:
+        with open(self.path, 'rb') as file:
+            return file.read()
+
+    @property
+    def uri(self) -> str:
+        return f'file://{os.path.abspath(self.path)}'
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ImageReference) and self.digest == other.digest
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __repr__(self) -> str:
+        return f'ImageReference(digest={self.digest}, imgtype={self.imgtype}, name={self.name})'
+
+    def __str__(self) -> str:
+        return self.uri
+
+
+# Define content-addressed (deduplicated) on-disk image store
+class ImageStore:
+    def __init__(self, directory: str) -> None:
+
+        # Validate options
+        if not isinstance(directory, str):
+            raise TypeError('Directory must be a string')
+
+        # Set options
+        self.directory = directory
+
+        # Create directories
+        os.makedirs(os.path.join(directory, 'objects'), exist_ok=True)
+        os.makedirs(os.path.join(directory, 'urls'), exist_ok=True)
+
+    def __object(self, digest: str, imgtype: str) -> str:
+        return os.path.join(self.directory, 'objects', digest[:2], f'{digest}.{imgtype}')
+
+    def __url(self, url: str) -> str:
+        name = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.directory, 'urls', f'{name}.ref')
+
+    def __write(self, path: str, content: bytes) -> None:
+
+        # Write file atomically
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(content)
+        os.replace(temporary, path)
+
+    def lookup(self, url: str) -> Optional[ImageReference]:
+
+        # Read url reference
+        try:
+            with open(self.__url(url), 'r') as file:
+                digest, imgtype, name = file.read().split('\n', 2)
+        except (OSError, ValueError):
+            return None
+
+        # Check if image still exists
+        path = self.__object(digest, imgtype)
+        if not os.path.isfile(path):
+            return None
+        return ImageReference(digest, path, imgtype, url, name or None)
+
+    def put(self, chunks: Iterable[bytes], url: Optional[str] = None, name: Optional[str] = None) -> Optional[ImageReference]:
+
+        # Stream chunks to a temporary file while hashing them
+        digest, header = hashlib.sha256(), b''
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                for chunk in chunks:
+                    if len(header) < 32:
+                        header += chunk[:32 - len(header)]
+                    digest.update(chunk)
+                    file.write(chunk)
+
+            # Check if content is an image
+            imgtype = imghdr.what(None, header)
+            if imgtype is None:
+                return None
+
+            # Move image into place (unless already stored)
+            digest = digest.hexdigest()
+            path = self.__object(digest, imgtype)
+            if not os.path.isfile(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(temporary, path)
+
+        # Remove temporary file (if not moved)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+        # Reference image by url
+        if url is not None:
+            self.__write(self.__url(url),
+                         f'{digest}\n{imgtype}\n{name or ""}'.encode())
+        return ImageReference(digest, path, imgtype, url, name)
@@ -0,0 +1,110 @@
+import json
+import hashlib
+import threading
+
+from functools import partial
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .merge import offer_rank, product_key
+from .snapshot_store import SnapshotStore
+
+# Define change kinds
+ADDED = 'added'
+CHANGED = 'changed'
+REMOVED = 'removed'
+
+# Define deferred snapshot saves of the current thread
+_local = threading.local()
+
+
+@contextmanager
+def deferred(saves: List[Callable[[], None]]) -> Iterator[List[Callable[[], None]]]:
+
+    # Collect snapshot saves of the current thread instead of running them (run them once the consumer received every record)
+    previous = getattr(_local, 'saves', None)
+    _local.saves = saves
+    try:
+        yield saves
+    finally:
+        _local.saves = previous
+
+
+def fingerprint(rank: Tuple[float, int, float]) -> str:
+
+    # Hash normalized price, stock quantity and delivery (compactly)
+    price, quantity, delivery = rank
+    return hashlib.blake2b(repr((price, -quantity, delivery)).encode(), digest_size=8).hexdigest()
+
+
+def incremental(products: Iterable[Any], store: SnapshotStore, crawler: Any, term: str, quantity: Optional[Union[int, str]] = None) -> Iterator[Dict[str, Any]]:
+
+    # Load previous snapshot of the query
+    owner, query = snapshot_key(crawler, term, quantity)
+    previous = store.load(owner, query)
+
+    # Emit added and changed products as they arrive (products without a key can't be tracked)
+    current = dict[str, Set[str]]()
+    for product in products:
+        identity = product_key(product)
+        if identity is None:
+            yield record(product, ADDED)
+            continue
+
+        # Skip exact duplicates (other offers for the same key are tracked side by side)
+        key, value = json.dumps(identity), fingerprint(offer_rank(product))
+        offers = current.setdefault(key, set())
+        if value in offers:
+            continue
+        offers.add(value)
+
+        # Emit offer if it is new for its key
+        if key not in previous:
+            yield record(product, ADDED)
+        elif value not in previous[key].split(','):
+            yield record(product, CHANGED)
+
+    # Keep previous snapshot if nothing was fetched (failed logins and outages look the same)
+    if len(current) == 0:
+        return
+
+    # Emit removed products
+    for key in previous.keys() - current.keys():
+        description, brand = json.loads(key)
+        yield {'description': description, 'brand': brand, 'change': REMOVED}
+
+    # Save snapshot once the whole query was consumed (or leave it to whoever deferred it)
+    save = partial(store.save, owner, query, {key: ','.join(sorted(offers)) for key, offers in current.items()})
+    saves = getattr(_local, 'saves', None)
+    if saves is None:
+        save()
+    else:
+        saves.append(save)
+
+
+def record(product: Any, change: str) -> Dict[str, Any]:
+
+    # Copy product as a record tagged with its change
+    record = dict(product.to_dict() if hasattr(product, 'to_dict') else product)
+    record['change'] = change
+    return record
+
+
+def track(products: Iterable[Any], store: SnapshotStore, crawler: Any, query: Tuple[str, Optional[Union[int, str]]]) -> Iterator[Any]:
+
+    # Skip crawlers tracking changes themselves (Crawler.snapshots)
+    if getattr(crawler, 'snapshots', None) is not None:
+        return iter(products)
+
+    # Track query as validated by the crawler (if it can), so snapshots match those taken by Crawler.fetch
+    validate = getattr(crawler, 'validate', None)
+    term, quantity = query if validate is None else validate(*query)
+    return incremental(products, store, crawler, term, quantity)
+
+
+def snapshot_key(crawler: Any, term: str, quantity: Optional[Union[int, str]] = None) -> Tuple[str, str]:
+
+    # Identify crawler by class, netloc and username (if it has them) and query by term and quantity
+    session_key = getattr(crawler, 'session_key', None)
+    owner = '|'.join(session_key) if session_key is not None else f'{crawler.__class__.__module__}.{crawler.__class__.__qualname__}'
+    return owner, json.dumps([term, None if quantity is None else str(quantity)])
@@ -0,0 +1,138 @@
+import os
+import sys
+import time
+import pickle
+import socket
+import logging
+import argparse
+import multiprocessing
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Optional
+
+from .incremental import deferred, track
+from .snapshot_store import SnapshotStore
+from .cancellation import CancellationToken, Cancelled, cancellation
+from .fetch_queued import FAILED, PRODUCTS, SNAPSHOT, TIMEOUT, message
+from .abstract_crawler import AbstractCrawler
+from .abstract_job_queue import AbstractJobQueue
+
+
+def build_crawler(spec: Dict[str, Any]) -> AbstractCrawler:
+
+    # Import crawler factory (or class)
+    module, qualname = spec['crawler'].split(':', 1)
+    factory = import_module(module)
+    for name in qualname.split('.'):
+        factory = getattr(factory, name)
+
+    # Build crawler (with the worker's own credentials) and apply the caller's options
+    crawler = factory()
+    for name, value in spec['options'].items():
+        setattr(crawler, name, value)
+
+    # Reuse the caller's session if it is still valid (otherwise the crawler logs in with the worker's credentials)
+    state = spec.get('state')
+    probe = getattr(crawler, '_probe', None)
+    if state is not None and probe is not None:
+        crawler.loads(state)
+        if probe():
+            crawler.authenticated = True
+    return crawler
+
+
+def run_job(queue: AbstractJobQueue, worker: str, job: int, spec: Dict[str, Any], lease: float) -> None:
+    try:
+        # Build crawler
+        crawler = build_crawler(spec)
+        term, quantity = spec['query']
+
+        # Run job until the caller's deadline, deferring snapshot saves to the caller
+        deadline = spec.get('deadline')
+        token = CancellationToken(None if deadline is None else max(0.0, deadline - time.time()))
+        saves = list[Callable[[], None]]()
+        with cancellation(token), deferred(saves):
+
+            # Fetch products (tracking changes against the caller's snapshot store if requested)
+            products = crawler.fetch(term, quantity)
+            if spec.get('snapshots') is not None:
+                products = track(products, SnapshotStore(spec['snapshots']), crawler, (term, quantity))
+
+            # Push products in batches (stopping if the job was cancelled or taken over)
+            batch = list[Any]()
+            for product in products:
+                token.check()
+                batch.append(product)
+                if len(batch) >= spec['batch_size']:
+                    if not queue.push(job, worker, message(PRODUCTS, products=batch), lease):
+                        return
+                    batch = list[Any]()
+            if len(batch) > 0 and not queue.push(job, worker, message(PRODUCTS, products=batch), lease):
+                return
+
+        # Send snapshots as plain data (deferred saves are partials of SnapshotStore.save, run by the caller) and mark job done
+        for save in saves:
+            owner, query, fingerprints = save.args
+            if not queue.push(job, worker, message(SNAPSHOT, owner=owner, query=query, fingerprints=fingerprints), lease):
+                return
+        queue.complete(job, worker)
+    except Cancelled:
+        queue.push(job, worker, message(TIMEOUT), lease)
+        queue.complete(job, worker, 'Cancelled at the deadline')
+    except Exception as e:
+        logging.exception(e)
+        queue.push(job, worker, message(FAILED, error=repr(e)), lease)
+        queue.complete(job, worker, repr(e))
+
+
+def work(queue: AbstractJobQueue, worker: Optional[str] = None, lease: float = 300.0, poll_interval: float = 0.5, idle_timeout: Optional[float] = None) -> int:
+
+    # Identify worker (host and process)
+    worker = f'{socket.gethostname()}:{os.getpid()}' if worker is None else worker
+
+    # Run jobs until idle for too long (forever if there is no idle timeout)
+    jobs, idle = 0, time.monotonic()
+    while True:
+        claimed = queue.claim(worker, lease)
+        if claimed is None:
+            if idle_timeout is not None and time.monotonic() - idle >= idle_timeout:
+                return jobs
+            time.sleep(poll_interval)
+            continue
+        job, spec = claimed
+        logging.info(f'Running job={job} worker={worker}')
+        run_job(queue, worker, job, pickle.loads(spec), lease)
+        jobs, idle = jobs + 1, time.monotonic()
+
+
+def spawn(queue: AbstractJobQueue, processes: int, **kwargs: Any) -> List[multiprocessing.Process]:
+
+    # Start worker processes on this host
+    workers = [multiprocessing.Process(target=work, args=(queue,), kwargs=kwargs) for _ in range(processes)]
+    for process in workers:
+        process.start()
+    return workers
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description='Run crawler jobs from a SQLite job queue')
+    parser.add_argument('path', help='path of the SQLite job queue')
+    parser.add_argument('--processes', type=int, default=1, help='worker processes to run')
+    parser.add_argument('--lease', type=float, default=300.0, help='seconds a job stays claimed without progress')
+    parser.add_argument('--idle-timeout', type=float, default=None, help='exit after this many idle seconds')
+    options = parser.parse_args(arguments)
+
+    # Run workers until they go idle
+    from .sqlite_job_queue import SQLiteJobQueue
+    logging.basicConfig(level=logging.INFO)
+    workers = spawn(SQLiteJobQueue(options.path), options.processes,
+                    lease=options.lease, idle_timeout=options.idle_timeout)
+    for process in workers:
+        process.join()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,281 @@
+import re
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from calmjs.parse.asttypes import Node
+
+# Define precompiled token patterns (whitespace and comments before each token are skipped)
+TOKEN = re.compile(r'''
+    (?:\s|//[^\n]*|/\*[\s\S]*?\*/)*
+    (?:(?P<string>"(?:[^"\\\n]|\\[\s\S])*"|'(?:[^'\\\n]|\\[\s\S])*'|`(?:[^`\\]|\\[\s\S])*`)
+   |(?P<number>0[xX][0-9a-fA-F]+|0[oO][0-7]+|0[bB][01]+|(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)
+   |(?P<name>(?:[^\W\d]|\$)(?:\w|\$)*)
+   |(?P<punct>=>|\.\.\.|&&|\|\||\+\+|--|[-+*/%&|^<>!=]=?=?|[?:;,.(){}\[\]~])
+   |(?P<unknown>[\s\S]))?
+''', re.VERBOSE)
+REGEX = re.compile(r'/(?![*/])(?:[^/\\\n\[]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[\w$]*')
+ESCAPE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|[0-7]{1,3}|\r\n|[\s\S])')
+
+# Define value of each literal name
+NAMES = {
+    'true': True,
+    'false': False,
+    'null': None,
+    'undefined': None,
+    'NaN': float('nan'),
+    'Infinity': float('inf'),
+}
+
+# Define escaped characters
+ESCAPES = {
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+    'v': '\v',
+    '\n': '',
+    '\r': '',
+    '\r\n': '',
+    '\u2028': '',
+    '\u2029': '',
+}
+
+# Define tokens allowed after an assigned literal (anything else means it is part of an expression)
+TERMINATORS = (';', ',', '}', ')', ']')
+
+# Define keywords a regular expression may follow (after anything else "/" divides)
+KEYWORDS = ('await', 'case', 'delete', 'do', 'else', 'in', 'instanceof',
+            'new', 'return', 'throw', 'typeof', 'void', 'yield')
+
+# Define token (kind, text and end position)
+Token = Tuple[Optional[str], str, int]
+
+
+def extract(source: str, *names: str) -> Dict[str, Any]:
+
+    # Validate names
+    for name in names:
+        if not isinstance(name, str):
+            raise TypeError(f'Name must be a string: type={type(name)}')
+
+    # Initialize names still to find
+    values = dict[str, Any]()
+    wanted = set(names)
+    if len(wanted) == 0:
+        return values
+
+    # Scan tokens (so names inside strings and comments are never matched)
+    chain, joined = list[str](), False
+    name, operators = None, ()
+    for kind, text, position in tokenize(source):
+
+        # Decode literal assigned to the previous name ("<name> =", "<name>:" and "'<name>':")
+        if name is not None and kind == 'punct' and text in operators:
+            try:
+                value, end = literal(source, position)
+            except (ValueError, RecursionError):
+                value, end = None, None
+
+            # Check if literal is the whole assigned expression (otherwise skip the assignment)
+            if end is not None:
+                following, terminator, _ = token(source, end)
+                if following is None or following != 'punct' or terminator in TERMINATORS:
+                    values[name] = value
+                    if len(values) == len(wanted):
+                        break
+
+        # Track dotted name ending at this token (e.g. "window.config")
+        if kind == 'name':
+            chain, joined = [*chain, text] if joined else [text], False
+        elif kind == 'punct' and text == '.' and len(chain) > 0 and not joined:
+            joined = True
+        else:
+            chain, joined = list[str](), False
+
+        # Check if token names a value still to find (longest dotted suffix first)
+        name, operators = None, ()
+        if kind == 'name':
+            name = suffix(chain, wanted, values)
+            operators = ('=', ':')
+        elif kind == 'string' and text[0] != '`':
+            key = string(text)
+            name = key if key in wanted and key not in values else None
+            operators = (':',)
+
+    # Return values
+    return values
+
+
+def extract_tree(tree: 'Node', *names: str) -> Dict[str, Any]:
+    from calmjs.parse.unparsers.extractor import ast_to_dict
+
+    # Retrieve values assigned to each name from the syntax tree (fallback for non-literal assignments)
+    values = dict[str, Any]()
+    for key, value in ast_to_dict(tree).items():
+        if not isinstance(key, str):
+            continue
+        for name in names:
+            if name not in values and (key == name or key.endswith(f'.{name}')):
+                values[name] = value
+    return values
+
+
+def literal(source: str, position: int = 0) -> Tuple[Any, int]:
+
+    # Decode literal starting at position (returning it and the position after it)
+    kind, text, position = token(source, position)
+
+    # Decode string
+    if kind == 'string':
+        return string(text), position
+
+    # Decode (signed) number
+    elif kind == 'number':
+        return number(text), position
+    elif kind == 'punct' and text in ('-', '+'):
+        value, position = literal(source, position)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f'Unexpected token after sign: {text}')
+        return -value if text == '-' else value, position
+
+    # Decode named literal
+    elif kind == 'name' and text in NAMES:
+        return NAMES[text], position
+
+    # Decode array (holes decode as None)
+    elif kind == 'punct' and text == '[':
+        values = list[Any]()
+        while True:
+            kind, text, end = token(source, position)
+            if kind == 'punct' and text == ']':
+                return values, end
+            if kind == 'punct' and text == ',':
+                values.append(None)
+                position = end
+                continue
+            value, position = literal(source, position)
+            values.append(value)
+            kind, text, position = token(source, position)
+            if kind == 'punct' and text == ']':
+                return values, position
+            if kind != 'punct' or text != ',':
+                raise ValueError(f'Unexpected token in array: {text}')
+
+    # Decode object (keys may be unquoted, quoted or numeric)
+    elif kind == 'punct' and text == '{':
+        value = dict[str, Any]()
+        while True:
+            kind, text, position = token(source, position)
+            if kind == 'punct' and text == '}':
+                return value, position
+            if kind == 'name':
+                key = text
+            elif kind == 'string':
+                key = string(text)
+            elif kind == 'number':
+                key = text
+            else:
+                raise ValueError(f'Unexpected token in object: {text}')
+            kind, text, position = token(source, position)
+            if kind != 'punct' or text != ':':
+                raise ValueError(f'Unexpected token in object: {text}')
+            value[key], position = literal(source, position)
+            kind, text, position = token(source, position)
+            if kind == 'punct' and text == '}':
+                return value, position
+            if kind != 'punct' or text != ',':
+                raise ValueError(f'Unexpected token in object: {text}')
+    raise ValueError(f'Not a literal: {text}')
+
+
+def suffix(chain: List[str], wanted: Set[str], values: Dict[str, Any]) -> Optional[str]:
+
+    # Retrieve longest dotted suffix of chain still to find
+    for index in range(len(chain)):
+        name = '.'.join(chain[index:])
+        if name in wanted and name not in values:
+            return name
+    return None
+
+
+def number(text: str) -> Any:
+
+    # Decode number (hexadecimal, octal, binary, integer or float)
+    prefix = text[:2].lower()
+    if prefix in ('0x', '0o', '0b'):
+        return int(text[2:], {'0x': 16, '0o': 8, '0b': 2}[prefix])
+    if '.' in text or 'e' in text or 'E' in text:
+        return float(text)
+    return int(text)
+
+
+def regex(kind: Optional[str], text: str) -> bool:
+
+    # Check if a "/" after the given token starts a regular expression
+    if kind is None:
+        return True
+    elif kind == 'punct':
+        return text not in (')', ']', '}')
+    return kind == 'name' and text in KEYWORDS
+
+
+def string(text: str) -> str:
+
+    # Check if template has substitutions
+    if text[0] == '`' and '${' in text:
+        raise ValueError('Template literal has substitutions')
+
+    # Decode escape sequences
+    value = text[1:-1]
+    if '\\' in value:
+        value = ESCAPE.sub(unescape, value)
+
+        # Join surrogate pairs
+        if any('\ud800' <= character <= '\udfff' for character in value):
+            value = value.encode('utf-16', 'surrogatepass').decode('utf-16', 'replace')
+    return value
+
+
+def token(source: str, position: int = 0) -> Token:
+
+    # Match next token (skipping whitespace and comments before it)
+    match = TOKEN.match(source, position)
+    kind = match.lastgroup
+    if kind is None:
+        return None, '', match.end()
+    return kind, match.group(kind), match.end()
+
+
+def tokenize(source: str, position: int = 0) -> Iterator[Token]:
+
+    # Yield tokens lazily (without building a syntax tree)
+    previous = None, ''
+    while True:
+        kind, text, position = token(source, position)
+        if kind is None:
+            return
+
+        # Read regular expression literals whole (where a "/" can't be a division)
+        if kind == 'punct' and text in ('/', '/=') and regex(*previous):
+            expression = REGEX.match(source, position - len(text))
+            if expression is not None:
+                kind, text, position = 'regex', expression.group(0), expression.end()
+        yield kind, text, position
+        previous = kind, text
+
+
+def unescape(match: 're.Match[str]') -> str:
+
+    # Decode escape sequence
+    sequence = match.group(1)
+    if sequence in ESCAPES:
+        return ESCAPES[sequence]
+    if sequence[0] == 'u':
+        return chr(int(sequence[1:].strip('{}'), 16))
+    if sequence[0] == 'x':
+        return chr(int(sequence[1:], 16))
+    if sequence[0] in '01234567':
+        return chr(int(sequence, 8))
+    return sequence
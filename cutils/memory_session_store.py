@@ -0,0 +1,32 @@
+import time
+
+from threading import Lock
+from typing import Optional, Tuple
+
+from .abstract_session_store import AbstractSessionStore, SessionKey
+
+
+# Define in-process session store
+class MemorySessionStore(AbstractSessionStore):
+    def __init__(self) -> None:
+        self.__lock = Lock()
+        self.__sessions = dict[SessionKey, Tuple[bytes, float]]()
+
+    def delete(self, key: SessionKey) -> None:
+        with self.__lock:
+            self.__sessions.pop(key, None)
+
+    def get(self, key: SessionKey) -> Optional[bytes]:
+        with self.__lock:
+            session = self.__sessions.get(key)
+            if session is None:
+                return None
+            state, expires = session
+            if expires <= time.time():
+                del self.__sessions[key]
+                return None
+            return state
+
+    def put(self, key: SessionKey, state: bytes, expires: float) -> None:
+        with self.__lock:
+            self.__sessions[key] = (state, expires)
@@ -0,0 +1,74 @@
+import math
+
+from datetime import datetime
+from typing import Any, Callable, Hashable, Iterable, Iterator, Optional, Tuple
+
+from .delivery import normalize_delivery
+from .normalization import normalize_brand, normalize_price, normalize_stock, normalize_text
+
+
+def offer_rank(product: Any) -> Tuple[float, int, float]:
+
+    # Retrieve price (lower is better)
+    price = product.get('price')
+    if isinstance(price, str):
+        price = normalize_price(price)
+    price = math.inf if price is None else float(price)
+
+    # Retrieve stock quantity (higher is better)
+    stock = product.get('stock')
+    if isinstance(stock, str):
+        stock = normalize_stock(stock)
+    if isinstance(stock, tuple):
+        stock = stock[1]
+    quantity = 0 if stock is None else int(stock)
+
+    # Retrieve delivery (sooner is better)
+    delivery = product.get('delivery')
+    if isinstance(delivery, str):
+        delivery = normalize_delivery(delivery)
+    delivery = math.inf if not isinstance(
+        delivery, datetime) else delivery.timestamp()
+
+    # Return rank (lower is better)
+    return price, -quantity, delivery
+
+
+def product_key(product: Any) -> Optional[Hashable]:
+
+    # Retrieve normalized description
+    description = product.get('description')
+    if not isinstance(description, str):
+        return None
+    description = normalize_text(description)
+    if description is None:
+        return None
+
+    # Retrieve normalized brand
+    brand = product.get('brand')
+    brand = normalize_brand(brand) if isinstance(brand, str) else None
+
+    # Return key
+    return description.upper(), brand
+
+
+def merge_best(products: Iterable[Any], key: Callable[[Any], Optional[Hashable]] = product_key, rank: Callable[[Any], Any] = offer_rank) -> Iterator[Any]:
+
+    # Initialize index of best offer per key
+    best = dict[Hashable, Any]()
+
+    # Emit products as they become the best offer for their key
+    for product in products:
+
+        # Pass products without a key through
+        identity = key(product)
+        if identity is None:
+            yield product
+            continue
+
+        # Check if product beats the current best offer
+        score = rank(product)
+        current = best.get(identity)
+        if current is None or score < current:
+            best[identity] = score
+            yield product
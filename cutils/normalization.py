@@ -0,0 +1,156 @@
+import re
+import unicodedata
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+# Define precompiled patterns
+BRACKETS = re.compile(r'\(.*?\)')
+SPACES = re.compile(r'\s+')
+LAST_LETTER = re.compile(r'[A-Z]$')
+DECIBELS = re.compile(r'[0-9]{2}')
+NOISE_LETTER = re.compile(r'[A-C]')
+NOISE_DIGIT = re.compile(r'[1-3]')
+STOCK = re.compile(r'(\>|\<|\+|\-)?\s*(\d+)')
+PRICE_PREFER_COMMA = r'(?P<comma>\d+(\.\d{3})*(\,\d{2})?)(\€|\£|\$|\§)?'
+PRICE_PREFER_PERIOD = r'(?P<period>\d+(\,\d{3})*(\.\d{2})?)(\€|\£|\$|\§)?'
+PRICE_COMMA_FIRST = re.compile(f'({PRICE_PREFER_COMMA}|{PRICE_PREFER_PERIOD})')
+PRICE_PERIOD_FIRST = re.compile(f'({PRICE_PREFER_PERIOD}|{PRICE_PREFER_COMMA})')
+
+# Define memoization size for low-cardinality fields
+CACHE_SIZE = 4096
+
+
+def hashable(value: Any) -> bool:
+
+    # Check if value can key a memo (normalizers may receive lists or dictionaries)
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def normalize_ascii(value: str) -> str:
+    return unicodedata.normalize('NFD', value).encode('ascii', 'ignore').decode('ascii')
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_brand(brand: str, parse_text: Optional[Callable[[str], Optional[str]]] = None) -> Optional[str]:
+    information = BRACKETS.search(brand)
+    if information is not None:
+        start, end = information.start(), information.end()
+        brand = ' '.join((brand[:start], brand[end:]))
+    brand = (parse_text or normalize_text)(brand)
+    return None if brand is None else ' '.join((name.capitalize() for name in brand.split(' ')))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_consumption_or_grip(consumption_or_grip: str, parse_text: Optional[Callable[[str], Optional[str]]] = None) -> Optional[str]:
+    consumption_or_grip = (parse_text or normalize_text)(consumption_or_grip)
+    if consumption_or_grip is None:
+        return None
+    match = LAST_LETTER.search(consumption_or_grip.upper())
+    return None if match is None else match.group(0)
+
+
+def normalize_decibels(decibels: str, parse_text: Optional[Callable[[str], Optional[str]]] = None) -> Optional[int]:
+    decibels = (parse_text or normalize_text)(decibels)
+    if decibels is None:
+        return None
+    match = DECIBELS.search(decibels)
+    if match is not None:
+        decibels = int(match.group(0))
+        return decibels if decibels > 0 else None
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_noise(noise: str, parse_text: Optional[Callable[[str], Optional[str]]] = None) -> Optional[int]:
+    noise = (parse_text or normalize_text)(noise)
+    if noise is None:
+        return None
+    noise = noise.upper()
+    match = NOISE_LETTER.search(noise)
+    if match is not None:
+        return ord(match.group(0)) - ord('A') + 1
+    match = NOISE_DIGIT.search(noise)
+    if match is not None:
+        return int(match.group(0))
+    return None
+
+
+def normalize_price(price: str, prefer_period: bool = False) -> Optional[float]:
+
+    # Remove all spaces
+    price = SPACES.sub('', price.strip())
+
+    # Try to match the price with all formats
+    pattern = PRICE_PERIOD_FIRST if prefer_period else PRICE_COMMA_FIRST
+    match = pattern.search(price)
+    if match is None:
+        return None
+
+    # Get the price if it was matched (period)
+    match_period = match.group('period')
+    if match_period is not None:
+        match_period = float(match_period.replace(',', ''))
+
+    # Get the price if it was matched (comma)
+    match_comma = match.group('comma')
+    if match_comma is not None:
+        match_comma = float(match_comma.replace('.', '').replace(',', '.'))
+
+    # Check first match
+    for match in ((match_period, match_comma) if prefer_period else (match_comma, match_period)):
+        if match is not None and match > 0:
+            return match
+    return None
+
+
+def normalize_records(rows: Iterable[Mapping[str, Any]], normalizers: Mapping[str, Callable[[Any], Any]]) -> List[Dict[str, Any]]:
+
+    # Initialize page-local memo per field (values repeat a lot within a page)
+    memos = {field: dict[Hashable, Any]() for field in normalizers}
+
+    # Normalize rows
+    records = list[Dict[str, Any]]()
+    for row in rows:
+        record = dict(row)
+        for field, normalizer in normalizers.items():
+            if field not in record:
+                continue
+            value = record[field]
+            if not hashable(value):
+                record[field] = normalizer(value)
+                continue
+            memo = memos[field]
+            if value not in memo:
+                memo[value] = normalizer(value)
+            record[field] = memo[value]
+        records.append(record)
+
+    # Return records
+    return records
+
+
+def normalize_stock(stock: str, parse_text: Optional[Callable[[str], Optional[str]]] = None) -> Tuple[Optional[str], int, Optional[str]]:
+    match = STOCK.search(stock)
+    if match is None:
+        return None, 0, None
+    extraction = (parse_text or normalize_text)(
+        ' '.join((stock[:match.start()], stock[match.end():])))
+    modifier = match.group(1)
+    quantity = int(match.group(2))
+    if modifier == '+':
+        modifier = '>'
+    elif modifier == '-':
+        modifier = '<'
+    if quantity < 2 and modifier == '<':
+        return None, 0, extraction
+    return modifier, quantity, extraction
+
+
+def normalize_text(text: str) -> Optional[str]:
+    text = SPACES.sub(' ', text.strip())
+    return text if len(text) > 0 else None
@@ -0,0 +1,92 @@
+import time
+
+from threading import Lock
+from typing import Dict, Optional
+
+from .cancellation import CancellationToken
+
+
+# Define adaptive (AIMD) token bucket rate limiter
+class RateLimiter:
+    # Define limiters shared by every crawler in the process
+    __limiters: Dict[str, 'RateLimiter'] = dict()
+    __limiters_lock = Lock()
+
+    def __init__(self, rate: float, burst: float = 1, minimum: float = 0.1, maximum: Optional[float] = None, increase: float = 0.5, decrease: float = 0.5, latency: Optional[float] = None) -> None:
+
+        # Validate options
+        if not isinstance(rate, (int, float)) or rate <= 0:
+            raise ValueError('Rate must be a positive number')
+        if not isinstance(burst, (int, float)) or burst < 1:
+            raise ValueError('Burst must be a number not lower than 1')
+        if not 0 < decrease < 1:
+            raise ValueError('Decrease must be between 0 and 1')
+
+        # Set options
+        self.burst = burst
+        self.minimum = minimum
+        self.maximum = rate * 4 if maximum is None else maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency = latency
+
+        # Initialize state
+        self.__lock = Lock()
+        self.__rate = float(rate)
+        self.__tokens = float(burst)
+        self.__updated = time.monotonic()
+        self.__paused = 0.0
+
+    def acquire(self, token: Optional[CancellationToken] = None) -> float:
+
+        # Reserve a token (going into debt if needed) and compute wait
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.burst, self.__tokens +
+                                (now - self.__updated) * self.__rate)
+            self.__updated = now
+            self.__tokens -= 1
+            wait = max(0.0, -self.__tokens / self.__rate,
+                       self.__paused - now)
+
+        # Wait outside the lock (stopping if the token is cancelled)
+        if wait > 0:
+            if token is not None:
+                token.sleep(wait)
+            else:
+                time.sleep(wait)
+        return wait
+
+    def failure(self, delay: Optional[float] = None) -> None:
+
+        # Decrease rate multiplicatively (and pause everyone if the server asked to)
+        with self.__lock:
+            self.__rate = max(self.minimum, self.__rate * self.decrease)
+            if delay is not None:
+                self.__paused = max(self.__paused, time.monotonic() + delay)
+
+    @classmethod
+    def for_netloc(cls, netloc: str, rate: float, **options) -> 'RateLimiter':
+
+        # Retrieve shared limiter (created with the first caller's options)
+        with cls.__limiters_lock:
+            limiter = cls.__limiters.get(netloc)
+            if limiter is None:
+                limiter = cls.__limiters[netloc] = cls(rate, **options)
+            return limiter
+
+    @property
+    def rate(self) -> float:
+        return self.__rate
+
+    def success(self, latency: Optional[float] = None) -> None:
+
+        # Treat slow responses as congestion
+        if self.latency is not None and latency is not None and latency > self.latency:
+            self.failure()
+            return
+
+        # Increase rate additively (by about `increase` per second of traffic)
+        with self.__lock:
+            self.__rate = min(self.maximum, self.__rate +
+                              self.increase / self.__rate)
@@ -1,8 +1,220 @@
-from bs4 import BeautifulSoup
-from urllib.parse import ParseResult
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+import time
+import imghdr
 
+from requests.structures import CaseInsensitiveDict
+from urllib.parse import ParseResult, parse_qs
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Union
 
-# Define response type
-Response = Tuple[Optional[Union[str, bytes, BeautifulSoup,
-                                Dict[Any, Any]]], int, ParseResult, Mapping[str, Iterable[str]]]
+from . import js
+from .image_store import ImageReference
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
+    from .base_crawler import BaseCrawler
+
+# Define decodable content kinds
+KINDS = ('html', 'image', 'js', 'json')
+
+# Define content kind for each known mime type
+MIME_KINDS = {
+    'application/ecmascript': 'js',
+    'application/javascript': 'js',
+    'application/json': 'json',
+    'application/x-javascript': 'js',
+    'application/xhtml+xml': 'html',
+    'text/ecmascript': 'js',
+    'text/html': 'html',
+    'text/javascript': 'js',
+    'text/json': 'json',
+}
+
+
+# Define lazily decoded response (unpacks as content, status code, url, query)
+class Response:
+    def __init__(self, crawler: 'BaseCrawler', body: Optional[bytes], status_code: int, url: ParseResult, headers: Optional[Mapping[str, str]] = None, reason: Optional[str] = None, hint: Optional[str] = None, query: Optional[Mapping[str, Iterable[str]]] = None, parser: Optional[str] = None, parse_only: Optional['SoupStrainer'] = None, reference: Optional[ImageReference] = None) -> None:
+
+        # Validate hint
+        if hint is not None and hint not in KINDS:
+            raise ValueError(f'Hint must be one of {KINDS}: hint={hint}')
+
+        # Set response
+        self.crawler = crawler
+        self.body = None if body is None else body.strip()
+        self.status_code = status_code
+        self.url = url
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.reason = reason
+        self.hint = hint
+        self.query = parse_qs(url.query) if query is None else query
+
+        # Set html options (None uses the crawler's)
+        self.parser = parser
+        self.parse_only = parse_only
+
+        # Initialize decoded contents
+        self.__kind = None
+        self.__decoded = dict[str, Any]()
+
+        # Set stored image (replaces the body)
+        self.reference = reference
+        if reference is not None:
+            self.__kind = 'image'
+            self.__decoded['image'] = reference
+
+    def __decode(self, kind: str) -> Any:
+
+        # Check if already decoded
+        if kind not in self.__decoded:
+
+            # Decode body
+            self.__decoded[kind] = None if not self.body else self.crawler.decode(
+                self.body, kind, parser=self.parser, parse_only=self.parse_only)
+
+        # Return decoded body
+        return self.__decoded[kind]
+
+    def __item(self, index: int) -> Any:
+        if index == 0:
+            return self.content
+        elif index == 1:
+            return self.status_code
+        elif index == 2:
+            return self.url
+        elif index == 3:
+            return self.query
+        raise IndexError('Response index out of range')
+
+    @property
+    def content(self) -> Optional[Union[str, 'BeautifulSoup', Dict[Any, Any], ImageReference]]:
+
+        # Check status code
+        if self.status_code != 200:
+            return self.reason
+
+        # Check if response doesn't exist
+        if not self.body and self.reference is None:
+            return None
+
+        # Decode as detected kind (falling back to html if the detection was wrong)
+        kind = self.kind
+        try:
+            return self.__decode(kind)
+        except (ValueError, SyntaxError, UnicodeDecodeError):
+            if kind == 'html':
+                raise
+            return self.html
+
+    @property
+    def content_type(self) -> Optional[str]:
+
+        # Retrieve mime type without parameters
+        content_type = self.headers.get('Content-Type')
+        if content_type is None:
+            return None
+        return content_type.split(';', 1)[0].strip().lower()
+
+    @property
+    def html(self) -> Optional['BeautifulSoup']:
+        return self.__decode('html')
+
+    @property
+    def image(self) -> Optional[Union[str, ImageReference]]:
+        return self.__decode('image')
+
+    @property
+    def js(self) -> Any:
+        return self.__decode('js')
+
+    @property
+    def json(self) -> Any:
+        return self.__decode('json')
+
+    @property
+    def kind(self) -> Optional[str]:
+
+        # Check if kind already detected
+        if self.__kind is None and self.body:
+            started = time.perf_counter()
+            self.__kind = self.__sniff()
+            self.crawler._timing('sniff', time.perf_counter() - started)
+        return self.__kind
+
+    def literals(self, *names: str, fallback: bool = True) -> Dict[str, Any]:
+
+        # Check if response doesn't exist
+        if not self.body:
+            return dict()
+
+        # Extract literals assigned to names (without building the syntax tree)
+        values = js.extract(self.body.decode(errors='replace'), *names)
+
+        # Fall back to the syntax tree for names without a plain literal
+        missing = [name for name in names if name not in values]
+        if fallback and len(missing) > 0:
+            try:
+                values.update(js.extract_tree(self.js, *missing))
+            except (SyntaxError, UnicodeDecodeError):
+                pass
+        return values
+
+    def offload(self, extract: Optional[Callable[[Any], Any]] = None, kind: Optional[str] = None) -> 'Future[Any]':
+
+        # Decode (and extract) in the crawler's executor
+        return self.crawler.offload(self, extract, kind)
+
+    def __sniff(self) -> str:
+
+        # Check hint
+        if self.hint is not None:
+            return self.hint
+
+        # Retrieve kind from content type
+        content_type = self.content_type
+        kind = MIME_KINDS.get(content_type)
+        if kind is None and content_type is not None:
+            if content_type.startswith('image/'):
+                kind = 'image'
+            elif content_type.endswith('+json'):
+                kind = 'json'
+
+        # Check if response is image
+        if kind == 'image' or (kind is None and imghdr.what(None, self.body) is not None):
+            return 'image'
+
+        # Check if response looks like json (servers often mislabel it)
+        if self.body[:1] in (b'{', b'['):
+            try:
+                self.__decode('json')
+                return 'json'
+            except (ValueError, UnicodeDecodeError):
+                pass
+
+        # Check if kind was declared
+        if kind is not None:
+            return kind
+
+        # Check if response looks like markup
+        if self.body[:1] == b'<':
+            return 'html'
+
+        # Try to parse response as JavaScript
+        try:
+            self.__decode('js')
+            return 'js'
+        except (SyntaxError, UnicodeDecodeError):
+            return 'html'
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return tuple(self.__item(i) for i in range(len(self))[index])
+        return self.__item(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self.__item(i) for i in range(len(self)))
+
+    def __len__(self) -> int:
+        return 4
+
+    def __repr__(self) -> str:
+        return f'Response(status_code={self.status_code}, url={self.url.geturl()}, kind={self.kind})'
@@ -0,0 +1,47 @@
+import random
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Define status codes worth retrying
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# Define methods safe to retry (retrying others may repeat side effects)
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE')
+
+# Define longest delay (in seconds) honored from a Retry-After header
+MAX_DELAY = 60.0
+
+
+def backoff(attempt: int, base: float, delay: Optional[float] = None) -> float:
+
+    # Compute exponential backoff with full jitter (never shorter than the server asked for)
+    return max(delay or 0.0, random.uniform(0, base * 2 ** attempt))
+
+
+def overloaded(status: int) -> bool:
+
+    # Check if status signals an overloaded (throttling or failing) server
+    return status == 429 or status >= 500
+
+
+def retry_after(value: Optional[str], maximum: float = MAX_DELAY) -> Optional[float]:
+
+    # Check if header exists
+    if value is None:
+        return None
+
+    # Parse delay in seconds
+    value = value.strip()
+    if value.isdigit():
+        return min(maximum, float(value))
+
+    # Parse http date
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return min(maximum, max(0.0, (date - datetime.now(timezone.utc)).total_seconds()))
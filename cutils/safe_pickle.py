@@ -0,0 +1,35 @@
+import io
+import pickle
+
+from typing import Any, FrozenSet, Tuple
+
+
+# Define unpickler restricted to plain data (so whoever can write a shared job queue can't run code on its readers)
+class SafeUnpickler(pickle.Unpickler):
+
+    # Define classes allowed besides the builtin containers (module, name)
+    GLOBALS: FrozenSet[Tuple[str, str]] = frozenset({
+        ('builtins', 'bytearray'),
+        ('builtins', 'complex'),
+        ('builtins', 'frozenset'),
+        ('builtins', 'set'),
+        ('collections', 'OrderedDict'),
+        ('datetime', 'date'),
+        ('datetime', 'datetime'),
+        ('datetime', 'time'),
+        ('datetime', 'timedelta'),
+        ('datetime', 'timezone'),
+        ('decimal', 'Decimal'),
+        ('cutils.tyre_product', 'TyreProduct'),
+    })
+
+    def find_class(self, module: str, name: str) -> Any:
+
+        # Check if class holds plain data
+        if (module, name) not in self.GLOBALS:
+            raise pickle.UnpicklingError(f'Class can\'t be sent through the job queue: class={module}.{name}')
+        return super().find_class(module, name)
+
+    @classmethod
+    def loads(cls, data: bytes) -> Any:
+        return cls(io.BytesIO(data)).load()
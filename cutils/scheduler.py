@@ -0,0 +1,101 @@
+import logging
+
+from collections import OrderedDict, deque
+from threading import Condition, Thread
+from typing import Callable, Deque, Dict, Hashable, Optional, Tuple
+
+
+# Define bounded worker pool with per-key concurrency limits and round-robin scheduling across keys
+class Scheduler:
+    def __init__(self, workers: int, limit: Optional[int] = None) -> None:
+
+        # Validate options
+        if not isinstance(workers, int):
+            raise TypeError('Workers must be an integer')
+        if workers < 1:
+            raise ValueError('Workers must be positive')
+        if limit is not None and not isinstance(limit, int):
+            raise TypeError('Limit must be an integer or None')
+        if limit is not None and limit < 1:
+            raise ValueError('Limit must be positive')
+
+        # Set options
+        self.__limit = limit
+
+        # Initialize state
+        self.__closed = False
+        self.__condition = Condition()
+        self.__running = dict[Hashable, int]()
+        self.__queues: Dict[Hashable, Deque[Callable[[], None]]] = OrderedDict()
+
+        # Start workers
+        self.__threads = list[Thread]()
+        for _ in range(workers):
+            thread = Thread(target=self.__work, daemon=True)
+            thread.start()
+            self.__threads.append(thread)
+
+    def __next(self) -> Optional[Tuple[Hashable, Callable[[], None]]]:
+
+        # Find first key (in round-robin order) with pending tasks and free slots
+        for key, queue in self.__queues.items():
+            if len(queue) > 0 and (self.__limit is None or self.__running.get(key, 0) < self.__limit):
+
+                # Move key to the end so other keys are served first next time
+                self.__queues.move_to_end(key)
+                return key, queue.popleft()
+
+        # No task can run right now
+        return None
+
+    def __pending(self) -> bool:
+        return any(len(queue) > 0 for queue in self.__queues.values())
+
+    def __work(self) -> None:
+        while True:
+
+            # Wait for a runnable task
+            with self.__condition:
+                while True:
+                    job = self.__next()
+                    if job is not None:
+                        break
+                    if self.__closed and not self.__pending():
+                        return
+                    self.__condition.wait()
+                key, task = job
+                self.__running[key] = self.__running.get(key, 0) + 1
+
+            # Run task
+            try:
+                task()
+            except Exception as e:
+                logging.exception(e)
+
+            # Release slot
+            finally:
+                with self.__condition:
+                    self.__running[key] -= 1
+                    self.__condition.notify_all()
+
+    def close(self) -> None:
+
+        # Stop accepting tasks (workers exit once queues drain)
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+    def join(self) -> None:
+
+        # Wait for workers
+        for thread in self.__threads:
+            thread.join()
+
+    def submit(self, key: Hashable, task: Callable[[], None]) -> None:
+
+        # Enqueue task under its key
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError('Scheduler is closed')
+            self.__queues.setdefault(key, deque()).append(task)
+            self.__condition.notify()
@@ -0,0 +1,130 @@
+import time
+import requests
+import threading
+
+from typing import Any, Dict, Iterator
+from http.cookiejar import Cookie
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Define connection setup time of the current thread (read and reset by connect_time)
+_local = threading.local()
+
+
+def connect_time() -> float:
+
+    # Retrieve (and reset) time spent opening connections in this thread
+    elapsed = getattr(_local, 'connect', 0.0)
+    _local.connect = 0.0
+    return elapsed
+
+
+# Define connections recording their setup time (tcp and tls handshakes)
+class TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _local.connect = getattr(_local, 'connect', 0.0) + time.perf_counter() - started
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _local.connect = getattr(_local, 'connect', 0.0) + time.perf_counter() - started
+
+
+# Define connection pools opening timed connections
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+# Define adapter pooling timed connections
+class TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+
+# Define cookie jar safe to share between threads
+class CookieJar(RequestsCookieJar):
+    def __iter__(self) -> Iterator[Cookie]:
+
+        # Iterate over a snapshot (taken under the jar's lock)
+        with self._cookies_lock:
+            return iter(list(super().__iter__()))
+
+
+# Define session with a sized connection pool and a thread-safe cookie jar
+class Session(requests.Session):
+    def __init__(self, pool_size: int = 10) -> None:
+
+        # Validate options
+        if not isinstance(pool_size, int):
+            raise TypeError('Pool size must be an integer')
+        if pool_size < 1:
+            raise ValueError('Pool size must be positive')
+
+        # Initialize superclass
+        super().__init__()
+
+        # Set pool size
+        self.pool_size = pool_size
+
+        # Replace cookie jar
+        self.cookies = CookieJar()
+
+        # Mount adapters keeping up to pool size connections alive per host
+        for prefix in ('https://', 'http://'):
+            self.mount(prefix, TimedHTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size))
+
+    def resize(self, pool_size: int) -> None:
+
+        # Validate options
+        if not isinstance(pool_size, int):
+            raise TypeError('Pool size must be an integer')
+        if pool_size < 1:
+            raise ValueError('Pool size must be positive')
+
+        # Check if pool is already large enough (pools only grow)
+        if pool_size <= self.pool_size:
+            return
+        self.pool_size = pool_size
+
+        # Replace adapters (closing the old pools' idle connections)
+        for prefix in ('https://', 'http://'):
+            adapter = self.adapters.get(prefix)
+            self.mount(prefix, TimedHTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size))
+            if adapter is not None:
+                adapter.close()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+
+        # Sum connection pool counters of every adapter
+        connections, requests = 0, 0
+        for adapter in self.adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    connections += pool.num_connections
+                    requests += pool.num_requests
+
+        # Return keep-alive reuse metrics
+        return dict(connections=connections, requests=requests, reused=max(0, requests - connections))
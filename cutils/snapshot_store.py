@@ -0,0 +1,40 @@
+from typing import Dict
+
+from .sqlite import connect, execute
+
+
+# Define SQLite store of product fingerprints per (crawler, query) snapshot
+class SnapshotStore:
+    def __init__(self, path: str) -> None:
+
+        # Validate options
+        if not isinstance(path, str):
+            raise TypeError('Path must be a string')
+
+        # Set options
+        self.path = path
+
+        # Create table
+        execute(self.path, 'CREATE TABLE IF NOT EXISTS snapshots (crawler TEXT, query TEXT, key TEXT, '
+                'fingerprint TEXT, PRIMARY KEY (crawler, query, key)) WITHOUT ROWID')
+
+    def delete(self, crawler: str, query: str) -> None:
+        execute(self.path, 'DELETE FROM snapshots WHERE crawler = ? AND query = ?', (crawler, query))
+
+    def load(self, crawler: str, query: str) -> Dict[str, str]:
+        rows = execute(
+            self.path, 'SELECT key, fingerprint FROM snapshots WHERE crawler = ? AND query = ?', (crawler, query))
+        return dict(rows)
+
+    def save(self, crawler: str, query: str, fingerprints: Dict[str, str]) -> None:
+
+        # Replace snapshot atomically (in a single transaction)
+        connection = connect(self.path)
+        try:
+            with connection:
+                connection.execute(
+                    'DELETE FROM snapshots WHERE crawler = ? AND query = ?', (crawler, query))
+                connection.executemany('INSERT INTO snapshots (crawler, query, key, fingerprint) VALUES (?, ?, ?, ?)',
+                                       ((crawler, query, key, fingerprint) for key, fingerprint in fingerprints.items()))
+        finally:
+            connection.close()
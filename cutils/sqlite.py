@@ -0,0 +1,23 @@
+import sqlite3
+
+from typing import Any, List, Tuple
+
+# Define how long (in seconds) a connection waits for another writer to release the database
+TIMEOUT = 30
+
+
+def connect(path: str, autocommit: bool = False) -> sqlite3.Connection:
+
+    # Open connection (autocommit leaves transactions to explicit BEGIN/COMMIT statements)
+    return sqlite3.connect(path, timeout=TIMEOUT, isolation_level=None if autocommit else '')
+
+
+def execute(path: str, statement: str, parameters: Tuple[Any, ...] = (), autocommit: bool = False) -> List[Tuple[Any, ...]]:
+
+    # Open a connection per operation (so the database can be shared between threads and processes)
+    connection = connect(path, autocommit)
+    try:
+        with connection:
+            return connection.execute(statement, parameters).fetchall()
+    finally:
+        connection.close()
@@ -0,0 +1,98 @@
+import time
+import sqlite3
+
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from .sqlite import connect, execute
+
+from .abstract_job_queue import AbstractJobQueue, Job, Result
+
+
+# Define SQLite job queue (shared by worker processes on one host, or over a shared filesystem)
+class SQLiteJobQueue(AbstractJobQueue):
+    def __init__(self, path: str) -> None:
+
+        # Validate options
+        if not isinstance(path, str):
+            raise TypeError('Path must be a string')
+
+        # Set options
+        self.path = path
+
+        # Create tables (write-ahead log lets workers write while the caller polls)
+        execute(self.path, 'PRAGMA journal_mode=WAL')
+        execute(self.path, 'CREATE TABLE IF NOT EXISTS jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, run TEXT, spec BLOB, '
+                'status TEXT, worker TEXT, expires REAL, attempts INTEGER DEFAULT 0, error TEXT)')
+        execute(self.path, 'CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id)')
+        execute(self.path, 'CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY AUTOINCREMENT, run TEXT, '
+                'job INTEGER, payload BLOB)')
+        execute(self.path, 'CREATE INDEX IF NOT EXISTS results_run ON results (run, id)')
+
+    @contextmanager
+    def __transaction(self) -> Iterator[sqlite3.Connection]:
+
+        # Run statements in a write transaction (taking the lock upfront, so concurrent claims never interleave)
+        connection = connect(self.path, autocommit=True)
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield connection
+                connection.execute('COMMIT')
+            except BaseException:
+                connection.execute('ROLLBACK')
+                raise
+        finally:
+            connection.close()
+
+    def cancel(self, run: str) -> None:
+        execute(self.path, "UPDATE jobs SET status = 'cancelled' WHERE run = ? AND status IN ('pending', 'running')", (run,))
+
+    def claim(self, worker: str, lease: float) -> Optional[Job]:
+
+        # Claim oldest pending job (or one whose worker stopped renewing its lease)
+        with self.__transaction() as connection:
+            now = time.time()
+            rows = connection.execute("SELECT id, spec FROM jobs WHERE status = 'pending' OR (status = 'running' AND expires < ?) "
+                                      'ORDER BY id LIMIT 1', (now,)).fetchall()
+            if len(rows) > 0:
+                connection.execute("UPDATE jobs SET status = 'running', worker = ?, expires = ?, attempts = attempts + 1 WHERE id = ?",
+                                   (worker, now + lease, rows[0][0]))
+        return rows[0] if len(rows) > 0 else None
+
+    def complete(self, job: int, worker: str, error: Optional[str] = None) -> None:
+
+        # Mark job finished and append its end marker (unless another worker took it over)
+        with self.__transaction() as connection:
+            updated = connection.execute("UPDATE jobs SET status = ?, error = ? WHERE id = ? AND worker = ? AND status = 'running'",
+                                         ('done' if error is None else 'failed', error, job, worker)).rowcount
+            if updated > 0:
+                connection.execute('INSERT INTO results (run, job, payload) SELECT run, id, NULL FROM jobs WHERE id = ?', (job,))
+
+    def poll(self, run: str, after: int = 0, limit: int = 1000) -> List[Result]:
+        return execute(self.path, 'SELECT id, job, payload FROM results WHERE run = ? AND id > ? ORDER BY id LIMIT ?',
+                       (run, after, limit))
+
+    def purge(self, run: str) -> None:
+        execute(self.path, 'DELETE FROM results WHERE run = ?', (run,))
+        execute(self.path, 'DELETE FROM jobs WHERE run = ?', (run,))
+
+    def push(self, job: int, worker: str, payload: bytes, lease: float) -> bool:
+
+        # Append results and renew the lease (False if the job was cancelled, purged or taken over)
+        with self.__transaction() as connection:
+            updated = connection.execute("UPDATE jobs SET expires = ? WHERE id = ? AND worker = ? AND status = 'running'",
+                                         (time.time() + lease, job, worker)).rowcount
+            if updated > 0:
+                connection.execute('INSERT INTO results (run, job, payload) SELECT run, id, ? FROM jobs WHERE id = ?',
+                                   (payload, job))
+        return updated > 0
+
+    def submit(self, run: str, spec: bytes) -> int:
+
+        # Publish pending job
+        connection = connect(self.path, autocommit=True)
+        try:
+            return connection.execute("INSERT INTO jobs (run, spec, status) VALUES (?, ?, 'pending')", (run, spec)).lastrowid
+        finally:
+            connection.close()
@@ -0,0 +1,34 @@
+import time
+
+from typing import Optional
+
+from .sqlite import execute
+from .abstract_session_store import AbstractSessionStore, SessionKey
+
+
+# Define SQLite session store
+class SQLiteSessionStore(AbstractSessionStore):
+    def __init__(self, path: str) -> None:
+
+        # Validate options
+        if not isinstance(path, str):
+            raise TypeError('Path must be a string')
+
+        # Set options
+        self.path = path
+
+        # Create table
+        execute(self.path, 'CREATE TABLE IF NOT EXISTS sessions (crawler TEXT, netloc TEXT, username TEXT, '
+                'state BLOB, expires REAL, PRIMARY KEY (crawler, netloc, username))')
+
+    def delete(self, key: SessionKey) -> None:
+        execute(self.path, 'DELETE FROM sessions WHERE crawler = ? AND netloc = ? AND username = ?', key)
+
+    def get(self, key: SessionKey) -> Optional[bytes]:
+        rows = execute(self.path, 'SELECT state FROM sessions WHERE crawler = ? AND netloc = ? AND username = ? AND expires > ?',
+                       (*key, time.time()))
+        return rows[0][0] if len(rows) > 0 else None
+
+    def put(self, key: SessionKey, state: bytes, expires: float) -> None:
+        execute(self.path, 'INSERT OR REPLACE INTO sessions (crawler, netloc, username, state, expires) VALUES (?, ?, ?, ?, ?)',
+                (*key, state, expires))
@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+# Define stock type (modifier, quantity, extraction) as returned by parse_stock
+Stock = Tuple[Optional[str], int, Optional[str]]
+
+
+# Define compact tyre product record (fields match the TyreCrawler.parse_* outputs)
+class TyreProduct:
+    __slots__ = ('crawler', 'description', 'brand', 'price', 'stock', 'delivery', 'noise',
+                 'decibels', 'grip', 'consumption', 'image', 'name', 'extra')
+
+    def __init__(self, crawler: Optional[str] = None, description: Optional[str] = None, brand: Optional[str] = None, price: Optional[float] = None, stock: Stock = (None, 0, None), delivery: Optional[datetime] = None, noise: Optional[int] = None, decibels: Optional[int] = None, grip: Optional[str] = None, consumption: Optional[str] = None, image: Optional[str] = None, name: Optional[str] = None, extra: Optional[Dict[str, Any]] = None) -> None:
+        self.crawler = crawler
+        self.description = description
+        self.brand = brand
+        self.price = price
+        self.stock = stock
+        self.delivery = delivery
+        self.noise = noise
+        self.decibels = decibels
+        self.grip = grip
+        self.consumption = consumption
+        self.image = image
+        self.name = name
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, product: Mapping[str, Any], crawler: Optional[str] = None) -> 'TyreProduct':
+
+        # Split known fields from extra ones
+        fields, extra = dict[str, Any](), dict[str, Any]()
+        for key, value in product.items():
+            if key in cls.__slots__ and key != 'extra':
+                fields[key] = value
+            else:
+                extra[key] = value
+
+        # Set crawler (unless product has one)
+        if crawler is not None:
+            fields.setdefault('crawler', crawler)
+
+        # Create product
+        return cls(**fields, extra=extra or None)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+
+        # Build dictionary (extra fields included)
+        product = {key: getattr(self, key)
+                   for key in self.__slots__ if key != 'extra'}
+        if self.extra is not None:
+            product.update(self.extra)
+        return product
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TyreProduct) and all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    def __getitem__(self, key: str) -> Any:
+
+        # Retrieve field like a dictionary (for code written against dict products)
+        if key in self.__slots__ and key != 'extra':
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f'TyreProduct(crawler={self.crawler}, description={self.description}, brand={self.brand}, price={self.price})'
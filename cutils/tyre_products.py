@@ -0,0 +1,128 @@
+import math
+
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Union
+
+from .tyre_product import Stock, TyreProduct
+from .normalization import normalize_stock
+
+# Define numeric columns (array typecode for each)
+NUMERIC_COLUMNS = {
+    'price': 'd',
+    'quantity': 'q',
+    'delivery': 'd',
+    'noise': 'b',
+    'decibels': 'h',
+}
+
+# Define object columns
+OBJECT_COLUMNS = ('crawler', 'description', 'brand', 'modifier', 'extraction',
+                  'grip', 'consumption', 'image', 'name', 'extra')
+
+
+# Define columnar batch of tyre products (missing numbers are nan for floats and 0 for integers)
+class TyreProducts:
+    def __init__(self, products: Iterable[Union[TyreProduct, Mapping[str, Any]]] = ()) -> None:
+
+        # Initialize columns
+        self.__numbers = {column: array(typecode)
+                          for column, typecode in NUMERIC_COLUMNS.items()}
+        self.__objects = {column: list[Any]() for column in OBJECT_COLUMNS}
+
+        # Add products
+        self.extend(products)
+
+    @staticmethod
+    def __stock(stock: Any) -> Stock:
+
+        # Normalize stock (as parse_stock does for raw values)
+        if stock is None:
+            return None, 0, None
+        elif isinstance(stock, str):
+            return normalize_stock(stock)
+        elif isinstance(stock, (int, float)) and not isinstance(stock, bool):
+            return None, int(stock), None
+        elif isinstance(stock, (tuple, list)) and len(stock) == 3:
+            modifier, quantity, extraction = stock
+            return modifier, 0 if quantity is None else int(quantity), extraction
+        raise TypeError(f'Unable to store stock for type: {type(stock)}')
+
+    def append(self, product: Union[TyreProduct, Mapping[str, Any]]) -> None:
+
+        # Convert product to record
+        if not isinstance(product, TyreProduct):
+            product = TyreProduct.from_dict(product)
+        modifier, quantity, extraction = self.__stock(product.stock)
+
+        # Append numeric columns
+        self.__numbers['price'].append(
+            math.nan if product.price is None else product.price)
+        self.__numbers['quantity'].append(quantity)
+        self.__numbers['delivery'].append(
+            math.nan if product.delivery is None else product.delivery.timestamp())
+        self.__numbers['noise'].append(product.noise or 0)
+        self.__numbers['decibels'].append(product.decibels or 0)
+
+        # Append object columns
+        objects = self.__objects
+        objects['crawler'].append(product.crawler)
+        objects['description'].append(product.description)
+        objects['brand'].append(product.brand)
+        objects['modifier'].append(modifier)
+        objects['extraction'].append(extraction)
+        objects['grip'].append(product.grip)
+        objects['consumption'].append(product.consumption)
+        objects['image'].append(product.image)
+        objects['name'].append(product.name)
+        objects['extra'].append(product.extra)
+
+    def column(self, name: str) -> Union[array, List[Any]]:
+        if name in self.__numbers:
+            return self.__numbers[name]
+        elif name in self.__objects:
+            return self.__objects[name]
+        raise KeyError(name)
+
+    def columns(self) -> Dict[str, Union[array, List[Any]]]:
+        return {**self.__numbers, **self.__objects}
+
+    def extend(self, products: Iterable[Union[TyreProduct, Mapping[str, Any]]]) -> None:
+        for product in products:
+            self.append(product)
+
+    def to_numpy(self) -> Dict[str, Any]:
+
+        # Import numpy (optional dependency)
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError('NumPy is required to export numpy columns') from e
+
+        # Export numeric columns (copied through the buffer protocol) and object columns as object arrays
+        columns = {column: numpy.array(values, dtype=values.typecode)
+                   for column, values in self.__numbers.items()}
+        columns.update({column: numpy.array(values, dtype=object)
+                       for column, values in self.__objects.items()})
+        return columns
+
+    def __getitem__(self, index: int) -> TyreProduct:
+
+        # Rebuild record from columns
+        numbers, objects = self.__numbers, self.__objects
+        price, delivery = numbers['price'][index], numbers['delivery'][index]
+        return TyreProduct(crawler=objects['crawler'][index], description=objects['description'][index],
+                           brand=objects['brand'][index], price=None if math.isnan(price) else price,
+                           stock=(objects['modifier'][index], numbers['quantity']
+                                  [index], objects['extraction'][index]),
+                           delivery=None if math.isnan(
+                               delivery) else datetime.fromtimestamp(delivery),
+                           noise=numbers['noise'][index] or None, decibels=numbers['decibels'][index] or None,
+                           grip=objects['grip'][index], consumption=objects['consumption'][index],
+                           image=objects['image'][index], name=objects['name'][index], extra=objects['extra'][index])
+
+    def __iter__(self) -> Iterator[TyreProduct]:
+        return (self[index] for index in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self.__numbers['price'])
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+from typing import Iterator
+
+# Import helpers (and the package from the repository root)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from helpers import Server  # noqa: E402
+
+
+@pytest.fixture
+def server() -> Iterator[Server]:
+    server = Server(dict())
+    try:
+        yield server
+    finally:
+        server.close()
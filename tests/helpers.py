@@ -0,0 +1,132 @@
+import time
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from cutils import Crawler
+from cutils.abstract_crawler import AbstractCrawler
+
+# Define route handler type (request handler in, status, headers and body out)
+Route = Callable[[BaseHTTPRequestHandler], Tuple[int, Dict[str, str], bytes]]
+
+# Define smallest body recognized as a png image
+PNG = b'\x89PNG\r\n\x1a\n' + bytes(24)
+
+
+# Define local http server serving routes by path (query ignored)
+class Server:
+    def __init__(self, routes: Dict[str, Route]) -> None:
+        self.routes = routes
+        self.hits = dict[str, int]()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                path = self.path.split('?', 1)[0]
+                server.hits[path] = server.hits.get(path, 0) + 1
+                route = server.routes.get(path)
+                status, headers, body = (404, dict(), b'') if route is None else route(self)
+                self.send_response(status)
+                for header, value in headers.items():
+                    self.send_header(header, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_GET
+
+        self.__server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target=self.__server.serve_forever, args=(0.01,), daemon=True)
+        self.__thread.start()
+
+    def close(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    @property
+    def netloc(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f'{host}:{port}'
+
+    def url(self, path: str) -> str:
+        return f'http://{self.netloc}{path}'
+
+
+# Define in-memory crawler yielding given products (optionally slowly or failing)
+class ListCrawler(AbstractCrawler):
+    def __init__(self, products: List[Dict[str, Any]], delay: float = 0.0, netloc: Optional[str] = None, error: Optional[Exception] = None) -> None:
+        self.products = products
+        self.delay = delay
+        self.netloc = netloc
+        self.error = error
+        self.running = 0
+        self.peak = 0
+        self.__lock = threading.Lock()
+
+    def dumps(self) -> bytes:
+        return b''
+
+    def fetch(self, term: str, quantity: Optional[Union[int, str]] = None) -> Iterator[Dict[str, Any]]:
+        with self.__lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            for product in self.products:
+                if self.delay > 0:
+                    time.sleep(self.delay)
+                yield dict(product, term=term)
+            if self.error is not None:
+                raise self.error
+        finally:
+            with self.__lock:
+                self.running -= 1
+
+    def loads(self, state: bytes) -> None:
+        pass
+
+
+# Define http crawler of a local server (products are not fetched)
+class HttpCrawler(Crawler):
+    def __init__(self, netloc: str) -> None:
+        super().__init__('user', 'password', netloc, 'http')
+
+    def _fetch(self, term: str, quantity: int) -> Iterator[Dict[str, Any]]:
+        return iter(())
+
+
+# Define http crawler counting its logins (the session cookie proves it is authenticated)
+class LoginCrawler(HttpCrawler):
+    def __init__(self, netloc: str) -> None:
+        super().__init__(netloc)
+        self.logins = 0
+
+    def _fetch(self, term: str, quantity: int) -> Iterator[Dict[str, Any]]:
+        yield {'description': term}
+
+    def _login(self) -> bool:
+        self.logins += 1
+        self.session.cookies.set('token', 'secret')
+        return True
+
+    def _probe(self) -> bool:
+        return self.session.cookies.get('token') == 'secret'
+
+
+def status(code: int, headers: Optional[Dict[str, str]] = None, body: bytes = b'body') -> Route:
+
+    # Build route answering every request alike
+    return lambda handler: (code, headers or dict(), body)
+
+
+def products(count: int, prefix: str = 'tyre', price: float = 10.0) -> List[Dict[str, Any]]:
+
+    # Build keyed products with distinct prices
+    return [{'description': f'{prefix} {index}', 'brand': 'Brand', 'price': f'{price + index:.2f}'.replace('.', ',')}
+            for index in range(count)]
@@ -0,0 +1,50 @@
+import pytest
+
+from cutils.aggregator import Aggregator
+from cutils.histogram import Histogram, duration
+
+
+def test_histogram_percentiles_are_bucket_bounds():
+    histogram = Histogram((1, 2, 4))
+    for value in (0.5, 1.5, 1.5, 3, 10):
+        histogram.add(value)
+    assert histogram.count == 5 and histogram.mean == 3.3
+    assert histogram.percentile(0.2) == 1
+    assert histogram.percentile(0.6) == 2
+    assert histogram.percentile(1.0) == 10
+    assert Histogram().percentile(0.5) is None
+
+
+def test_histogram_merge_requires_same_bounds():
+    first, second = Histogram((1, 2)), Histogram((1, 2))
+    first.add(0.5)
+    second.add(1.5)
+    assert first.merge(second).counts == [1, 1, 0]
+    with pytest.raises(ValueError):
+        first.merge(Histogram((1, 3)))
+    with pytest.raises(ValueError):
+        Histogram((2, 1))
+
+
+def test_histogram_renders_used_buckets():
+    histogram = Histogram((0.001, 0.01, 0.1))
+    histogram.add(0.005)
+    histogram.add(0.5)
+    assert len(histogram.render(10)) == 3
+    assert duration(0.0000015) == '1.5us' and duration(0.25) == '250ms' and duration(2) == '2s'
+
+
+def test_aggregator_groups_by_crawler():
+    aggregator = Aggregator()
+    aggregator.count('a', 'requests')
+    aggregator.count('b', 'requests', 2)
+    aggregator.timing('a', 'request', 0.1)
+    aggregator.timing('b', 'request', 0.3)
+    assert aggregator.crawlers == ['a', 'b']
+    assert aggregator.counters() == {'requests': 3}
+    assert aggregator.counters('b') == {'requests': 2}
+    assert aggregator.histogram('request').count == 2
+    assert aggregator.summary()['a']['timings']['request']['count'] == 1
+    assert 'requests' in aggregator.report(histograms=True)
+    aggregator.reset()
+    assert aggregator.crawlers == [] and aggregator.report() == ''
@@ -0,0 +1,82 @@
+import asyncio
+
+import httpx
+
+from cutils import AsyncCrawler, async_fetch_all
+
+
+class Supplier(AsyncCrawler):
+    def __init__(self, prices):
+        super().__init__('user', 'password', 'example.com')
+        self.prices = prices
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+    def handle(self, request):
+        if request.url.path == '/missing':
+            return httpx.Response(404)
+        return httpx.Response(200, json={'term': request.url.params['q'], 'prices': self.prices})
+
+    async def _fetch(self, term, quantity):
+        response = await self.get(f'{self.domain}/search', params={'q': term})
+        for price in response.json['prices'][:quantity]:
+            yield {'description': response.json['term'], 'price': price}
+
+
+class FailingSupplier(Supplier):
+    async def _fetch(self, term, quantity):
+        yield {'description': term, 'price': 0}
+        raise RuntimeError('boom')
+
+
+def collect(crawlers, *queries):
+
+    # Collect every product of the queries
+    async def run():
+        return [product async for product in async_fetch_all(crawlers, *queries)]
+    return asyncio.run(run())
+
+
+def test_fetches_every_crawler_and_query():
+    products = collect([Supplier([1, 2]), Supplier([3])], ('a', None), ('b', 1))
+    assert sorted((product['description'], product['price']) for product in products) == [
+        ('a', 1), ('a', 2), ('a', 3), ('b', 1), ('b', 3)]
+
+
+def test_failed_crawler_does_not_stop_others():
+    products = collect([FailingSupplier([]), Supplier([1])], ('a', None))
+    assert sorted(product['price'] for product in products) == [0, 1]
+
+
+def test_request_builds_lazy_response():
+
+    async def run():
+        crawler = Supplier([1])
+        try:
+            found = await crawler.get(f'{crawler.domain}/search', params={'q': 'a'})
+            missing = await crawler.post(f'{crawler.domain}/missing')
+            return found, missing
+        finally:
+            await crawler.close()
+
+    found, missing = asyncio.run(run())
+    assert found.kind == 'json' and found.content == {'term': 'a', 'prices': [1]}
+    assert missing.status_code == 404
+
+
+def test_consumer_may_stop_early():
+
+    async def run():
+        stream = async_fetch_all([Supplier(list(range(100)))], ('a', None))
+        product = await stream.__anext__()
+        await stream.aclose()
+        return product
+
+    assert asyncio.run(run())['price'] == 0
+
+
+def test_cookies_round_trip():
+    crawler = Supplier([])
+    crawler.client.cookies.set('token', 'secret', domain='example.com')
+    other = Supplier([])
+    other.loads(crawler.dumps())
+    assert other.client.cookies.get('token') == 'secret'
@@ -0,0 +1,27 @@
+import os
+import sys
+import json
+import subprocess
+
+from benchmarks.suite import compare
+
+# Define repository root (benchmarks run as a module from it)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {'json': {'requests_per_second': 100.0, 'p99_ms': 10.0, 'cpu_total_s': 0.01}}
+    assert compare(baseline, {'json': {'requests_per_second': 80.0, 'p99_ms': 12.0, 'cpu_total_s': 0.04}}, 0.25) == []
+    assert compare(baseline, {'json': {'requests_per_second': 70.0, 'p99_ms': 13.0}}, 0.25) == [
+        'json.requests_per_second: 100.000 -> 70.000', 'json.p99_ms: 10.000 -> 13.000']
+    assert compare(dict(), {'json': {'requests_per_second': 1.0}}, 0.25) == []
+
+
+def test_suite_runs_against_stand_in(tmp_path):
+    path = os.path.join(tmp_path, 'baseline.json')
+    subprocess.run([sys.executable, '-m', 'benchmarks.suite', '--scenarios', 'json', '--crawlers', '1', '--terms', '1',
+                    '--products', '10', '--latency', '0', '--jitter', '0', '--save', path],
+                   cwd=ROOT, check=True, capture_output=True)
+    with open(path, 'r') as file:
+        results = json.load(file)
+    assert results['json']['products_per_second'] > 0
@@ -0,0 +1,48 @@
+import os
+
+from cutils import Cache
+
+from helpers import HttpCrawler, status
+
+
+def test_cache_serves_fresh_and_revalidated_responses(server):
+    server.routes['/fresh'] = status(200, {'Content-Type': 'text/plain'})
+    server.routes['/etag'] = lambda handler: ((304, dict(), b'') if handler.headers.get('If-None-Match') == '"v1"'
+                                              else (200, {'ETag': '"v1"', 'Content-Type': 'text/plain'}, b'etag'))
+    crawler = HttpCrawler(server.netloc)
+    crawler.cache = Cache(ttl=60, routes={'/etag': 0})
+    for _ in range(3):
+        assert crawler.get(server.url('/fresh')).body == b'body'
+        assert crawler.get(server.url('/etag')).body == b'etag'
+    assert server.hits['/fresh'] == 1
+    assert server.hits['/etag'] == 3
+    assert crawler.cache.stats['revalidations'] == 2
+
+
+def test_cache_keys_include_params(server, tmp_path):
+    server.routes['/search'] = status(200)
+    crawler = HttpCrawler(server.netloc)
+    crawler.cache = Cache(ttl=60, directory=os.path.join(tmp_path, 'cache'))
+    crawler.get(server.url('/search'), params={'q': 'a'})
+    crawler.get(server.url('/search'), params={'q': 'b'})
+    crawler.get(server.url('/search'), params={'q': 'a'})
+    assert server.hits['/search'] == 2
+
+    # Disk tier survives a cleared memory tier
+    crawler.cache = Cache(ttl=60, directory=os.path.join(tmp_path, 'cache'))
+    crawler.get(server.url('/search'), params={'q': 'b'})
+    assert server.hits['/search'] == 2
+
+
+def test_cache_skips_other_methods_and_evicts_least_recent(server):
+    server.routes['/page'] = status(200)
+    crawler = HttpCrawler(server.netloc)
+    crawler.cache = Cache(maxsize=1, ttl=60)
+    crawler.post(server.url('/page'))
+    crawler.post(server.url('/page'))
+    assert server.hits['/page'] == 2
+    crawler.get(server.url('/page'), params={'q': 'a'})
+    crawler.get(server.url('/page'), params={'q': 'b'})
+    crawler.get(server.url('/page'), params={'q': 'a'})
+    assert server.hits['/page'] == 5
+    assert crawler.cache.stats['evictions'] == 2
@@ -0,0 +1,61 @@
+import time
+import threading
+
+import pytest
+
+from cutils.cancellation import CancellationToken, Cancelled, cancellation, current_token
+
+
+def test_token_without_deadline():
+    token = CancellationToken()
+    assert not token.cancelled
+    assert token.remaining() is None
+    token.check()
+    token.cancel()
+    assert token.cancelled
+    assert token.remaining() == 0
+    with pytest.raises(Cancelled):
+        token.check()
+
+
+def test_token_expires_at_deadline():
+    token = CancellationToken(0.05)
+    assert 0 < token.remaining() <= 0.05
+    time.sleep(0.06)
+    assert token.cancelled
+    assert token.remaining() == 0
+
+
+def test_sleep_wakes_up_when_cancelled():
+    token = CancellationToken()
+    threading.Timer(0.05, token.cancel).start()
+    started = time.monotonic()
+    with pytest.raises(Cancelled):
+        token.sleep(5)
+    assert time.monotonic() - started < 1
+
+
+def test_sleep_stops_at_deadline():
+    token = CancellationToken(0.05)
+    started = time.monotonic()
+    with pytest.raises(Cancelled):
+        token.sleep(5)
+    assert time.monotonic() - started < 1
+
+
+def test_sleep_returns_if_not_cancelled():
+    CancellationToken(1).sleep(0.01)
+
+
+def test_current_token_is_thread_local_and_restored():
+    outer, inner = CancellationToken(), CancellationToken()
+    seen = list()
+    with cancellation(outer):
+        with cancellation(inner):
+            assert current_token() is inner
+            thread = threading.Thread(target=lambda: seen.append(current_token()))
+            thread.start()
+            thread.join()
+        assert current_token() is outer
+    assert current_token() is None
+    assert seen == [None]
@@ -0,0 +1,72 @@
+import time
+import threading
+
+import pytest
+
+from cutils.channel import Channel, ChannelClosed
+
+
+def test_pop_returns_items_in_order():
+    channel = Channel[int]()
+    for item in range(3):
+        channel.push(item)
+    assert [channel.pop() for _ in range(3)] == [0, 1, 2]
+    assert len(channel) == 0
+
+
+def test_push_blocks_while_full():
+    channel = Channel[int](1)
+    channel.push(0)
+    pushed = threading.Event()
+
+    def push():
+        channel.push(1)
+        pushed.set()
+
+    thread = threading.Thread(target=push)
+    thread.start()
+    assert not pushed.wait(0.1)
+    assert channel.pop() == 0
+    assert pushed.wait(1)
+    thread.join()
+    assert channel.pop() == 1
+
+
+def test_pop_times_out():
+    channel = Channel[int]()
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        channel.pop(0.05)
+    assert time.monotonic() - started >= 0.05
+
+
+def test_close_releases_producers_and_consumers():
+    channel = Channel[int](1)
+    channel.push(0)
+    errors = list[Exception]()
+
+    def push():
+        try:
+            channel.push(1)
+        except ChannelClosed as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=push)
+    thread.start()
+    time.sleep(0.05)
+    channel.close()
+    thread.join(1)
+    assert len(errors) == 1
+    assert channel.closed
+
+    # Items pushed before closing are still delivered
+    assert channel.pop() == 0
+    with pytest.raises(ChannelClosed):
+        channel.pop()
+
+
+def test_rejects_invalid_size():
+    with pytest.raises(TypeError):
+        Channel('1')
+    with pytest.raises(ValueError):
+        Channel(-1)
@@ -0,0 +1,114 @@
+import time
+import threading
+
+import pytest
+
+from cutils import Aggregator
+from cutils.rate_limiter import RateLimiter
+from cutils.cancellation import CancellationToken, Cancelled, cancellation
+
+from helpers import HttpCrawler, status
+
+
+class RetryingCrawler(HttpCrawler):
+    RETRIES = 2
+    BACKOFF = 0.01
+
+
+def test_retries_throttled_requests(server):
+    server.routes['/busy'] = status(503)
+    assert RetryingCrawler(server.netloc).get(server.url('/busy')).status_code == 503
+    assert server.hits['/busy'] == 3
+
+
+def test_does_not_retry_non_idempotent_methods(server):
+    server.routes['/busy'] = status(503)
+    assert RetryingCrawler(server.netloc).post(server.url('/busy')).status_code == 503
+    assert server.hits['/busy'] == 1
+
+
+def test_does_not_retry_client_errors(server):
+    server.routes['/missing'] = status(404)
+    assert RetryingCrawler(server.netloc).get(server.url('/missing')).status_code == 404
+    assert server.hits['/missing'] == 1
+
+
+def test_clamps_retry_after(server):
+    class ClampedCrawler(RetryingCrawler):
+        RETRIES = 1
+        RETRY_DELAY = 0.05
+
+    server.routes['/busy'] = status(503, {'Retry-After': '86400'})
+    started = time.monotonic()
+    ClampedCrawler(server.netloc).get(server.url('/busy'))
+    assert time.monotonic() - started < 1
+    assert server.hits['/busy'] == 2
+
+
+def test_server_errors_lower_the_rate(server):
+    class LimitedCrawler(HttpCrawler):
+        RATE = 100.0
+
+    server.routes['/error'] = status(500)
+    LimitedCrawler(server.netloc).get(server.url('/error'))
+    assert RateLimiter.for_netloc(server.netloc, 100.0).rate == 50.0
+
+
+def test_slow_responses_lower_the_rate(server):
+    class SlowCrawler(HttpCrawler):
+        RATE = 100.0
+        LATENCY = 0.05
+
+    def slow(handler):
+        time.sleep(0.1)
+        return 200, dict(), b'body'
+
+    server.routes['/slow'] = slow
+    SlowCrawler(server.netloc).get(server.url('/slow'))
+    assert RateLimiter.for_netloc(server.netloc, 100.0).rate == 50.0
+
+
+def test_deadline_cancels_backoff(server):
+    class SlowRetryCrawler(RetryingCrawler):
+        BACKOFF = 10
+
+    server.routes['/busy'] = status(503, {'Retry-After': '5'})
+    started = time.monotonic()
+    with cancellation(CancellationToken(0.2)), pytest.raises(Cancelled):
+        SlowRetryCrawler(server.netloc).get(server.url('/busy'))
+    assert time.monotonic() - started < 1
+
+
+def test_reserve_grows_connection_pool(server):
+    crawler = HttpCrawler(server.netloc)
+    crawler.reserve(4)
+    assert crawler.session.pool_size == crawler.POOL_SIZE
+    crawler.reserve(32)
+    assert crawler.session.pool_size == 32
+    assert crawler.session.adapters['http://']._pool_maxsize == 32
+
+
+def test_shared_crawler_reuses_connections(server):
+    server.routes['/page'] = status(200)
+    crawler = HttpCrawler(server.netloc)
+    crawler.reserve(8)
+    threads = [threading.Thread(target=lambda: [crawler.get(server.url('/page')) for _ in range(5)]) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = crawler.connections
+    assert stats['requests'] == 40 and stats['connections'] <= 8
+
+
+def test_instrument_records_requests(server):
+    server.routes['/page'] = status(200, {'Content-Type': 'text/html'}, b'<p>a</p>')
+    server.routes['/missing'] = status(404)
+    crawler = HttpCrawler(server.netloc)
+    crawler.instrument = Aggregator()
+    crawler.get(server.url('/page')).content
+    crawler.get(server.url('/missing'))
+    counters = crawler.instrument.counters()
+    assert counters['requests'] == 2 and counters['status.200'] == 1 and counters['errors.404'] == 1
+    assert crawler.instrument.histogram('request.total').count == 2
+    assert crawler.instrument.histogram(f'decode.html.{crawler.HTML_PARSER}').count == 1
@@ -0,0 +1,24 @@
+from datetime import date, datetime
+
+from cutils.delivery import normalize_delivery
+
+# Define fixed current date (a Wednesday)
+TODAY = date(2024, 5, 15)
+
+
+def test_parses_day_and_month():
+    assert normalize_delivery('20 de Maio', TODAY) == datetime(2024, 5, 20)
+    assert normalize_delivery('10 de maio', TODAY) == datetime(2025, 5, 10)
+    assert normalize_delivery('3 de março de 2026', TODAY) == datetime(2026, 3, 3)
+    assert normalize_delivery('Início de Junho', TODAY) == datetime(2024, 6, 1)
+
+
+def test_parses_relative_days():
+    assert normalize_delivery('Amanhã de manhã', TODAY) == datetime(2024, 5, 16, 10)
+    assert normalize_delivery('depois de amanhã', TODAY) == datetime(2024, 5, 17)
+    assert normalize_delivery('hoje de tarde', TODAY) == datetime(2024, 5, 15, 16)
+
+
+def test_parses_next_weekday():
+    assert normalize_delivery('Sexta-feira', TODAY) == datetime(2024, 5, 17)
+    assert normalize_delivery('quarta', TODAY) == datetime(2024, 5, 22)
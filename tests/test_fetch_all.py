@@ -0,0 +1,109 @@
+import time
+
+import pytest
+
+from cutils import fetch_all, iter_all
+from cutils.merge import product_key
+
+from helpers import ListCrawler, products
+
+
+def test_yields_products_of_every_job():
+    crawlers = [ListCrawler(products(3, 'a')), ListCrawler(products(2, 'b'))]
+    result = list(iter_all(crawlers, ('x', None), ('y', None)))
+    assert len(result) == 10
+    assert {product['term'] for product in result} == {'x', 'y'}
+
+
+def test_fetch_all_yields_single_stream():
+    streams = list(fetch_all([ListCrawler(products(3))], ('x', None)))
+    assert len(streams) == 1
+    assert len(list(streams[0])) == 3
+
+
+@pytest.mark.parametrize('workers', [None, 2])
+def test_batches_keep_every_product(workers):
+    result = list(iter_all([ListCrawler(products(25))], ('x', None), workers=workers, batch_size=10))
+    assert [product['description'] for product in result] == [f'tyre {index}' for index in range(25)]
+
+
+class PausingCrawler(ListCrawler):
+    def fetch(self, term, quantity=None):
+
+        # Yield one product, then pause (the batch is far from full)
+        yield dict(self.products[0], term=term)
+        time.sleep(1)
+
+
+def test_flush_interval_bounds_product_latency():
+    started = time.monotonic()
+    stream = iter_all([PausingCrawler(products(1))], ('x', None), batch_size=100, flush_interval=0.05)
+    next(stream)
+    assert time.monotonic() - started < 0.5
+    stream.close()
+
+
+@pytest.mark.parametrize('workers', [None, 8])
+def test_per_netloc_limits_jobs_of_a_host(workers):
+    crawler = ListCrawler(products(1), delay=0.05, netloc='host')
+    list(iter_all([crawler], *[(str(index), None) for index in range(6)], workers=workers, per_netloc=2))
+    assert crawler.peak == 2
+
+
+def test_rejects_invalid_per_netloc():
+    with pytest.raises(ValueError):
+        list(iter_all([ListCrawler(products(1))], ('x', None), per_netloc=0))
+
+
+def test_failed_job_does_not_stop_others():
+    crawlers = [ListCrawler(products(2, 'a'), error=RuntimeError('boom')), ListCrawler(products(2, 'b'))]
+    assert len(list(iter_all(crawlers, ('x', None)))) == 4
+
+
+def test_failed_jobs_are_reported():
+    failed = list()
+    crawlers = [ListCrawler(products(2, 'a'), error=RuntimeError('boom')), ListCrawler(products(2, 'b'))]
+    list(iter_all(crawlers, ('x', None), on_error=lambda crawler, query, error: failed.append((crawler, query, error))))
+    assert failed == [(crawlers[0], ('x', None), "RuntimeError('boom')")]
+
+
+def test_deadline_reports_jobs_still_running():
+    late = list()
+    fast, slow = ListCrawler(products(1)), ListCrawler(products(50), delay=0.1)
+    started = time.monotonic()
+    result = list(iter_all([fast, slow], ('x', None), timeout=0.3, on_timeout=lambda crawler, query: late.append((crawler, query))))
+    assert time.monotonic() - started < 1
+    assert late == [(slow, ('x', None))]
+    assert 1 <= len(result) < 51
+
+
+def test_limit_stops_after_enough_products():
+    crawler = ListCrawler(products(1000), delay=0.001)
+    started = time.monotonic()
+    assert len(list(iter_all([crawler], ('x', None), limit=5))) == 5
+    assert time.monotonic() - started < 1
+
+
+def test_limit_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        list(iter_all([ListCrawler(products(1))], ('x', None), limit=0))
+    with pytest.raises(TypeError):
+        list(iter_all([ListCrawler(products(1))], ('x', None), limit='5'))
+
+
+def test_merge_keeps_best_offer_per_key():
+    expensive = ListCrawler(products(3, price=20.0))
+    cheap = ListCrawler(products(3, price=10.0))
+    best = dict()
+    for product in iter_all([expensive, cheap], ('x', None), merge=product_key):
+        best[product_key(product)] = product['price']
+    assert sorted(best.values()) == ['10,00', '11,00', '12,00']
+
+
+def test_closing_stream_stops_producers():
+    crawler = ListCrawler(products(1000), delay=0.001)
+    stream = iter_all([crawler], ('x', None))
+    next(stream)
+    stream.close()
+    time.sleep(0.1)
+    assert crawler.running == 0
@@ -0,0 +1,41 @@
+import pytest
+
+from bs4 import BeautifulSoup
+
+from cutils import Form
+
+from helpers import HttpCrawler
+
+# Define form page
+PAGE = b'''<html><body>
+    <form id="login" action="/login" method="post">
+        <input name="user" value="default">
+        <input type="radio" name="mode" value="a"><input type="radio" name="mode" value="b" checked>
+        <select name="country"><option value="pt">Portugal</option><option value="es" selected>Spain</option></select>
+        <textarea name="note">hello</textarea>
+        <input name="token">
+    </form>
+    <form name="other"><input name="user" value="other"></form>
+</body></html>'''
+
+
+def test_form_indexes_fields_once():
+    html = BeautifulSoup(PAGE, 'html5lib')
+    form = Form(html, 'login')
+    assert (form.action, form.method, len(form)) == ('/login', 'POST', 5)
+    assert form['user'] == 'default' and form['mode'] == 'b' and form['country'] == 'es'
+    assert form['note'] == 'hello' and form['token'] is None
+    assert Form(html, 'other')['user'] == 'other'
+    with pytest.raises(ValueError):
+        Form(html, 'missing')
+
+
+def test_fill_keeps_required_fields():
+    crawler = HttpCrawler('example.com')
+    html = BeautifulSoup(PAGE, 'html5lib')
+    payload = crawler.fill(Form(html, 'login'), {'user': None, 'token': 'x', 'extra': 1})
+    assert payload == {'user': 'default', 'token': 'x', 'extra': 1}
+    with pytest.raises(ValueError):
+        crawler.fill(html, {'missing': None}, 'login')
+    with pytest.raises(TypeError):
+        crawler.fill('html', dict())
@@ -0,0 +1,25 @@
+import os
+
+from cutils.image_store import ImageStore
+
+from helpers import PNG, HttpCrawler
+
+
+def test_crawler_stores_images_by_url_with_params(server, tmp_path):
+    server.routes['/image'] = lambda handler: (200, {'Content-Type': 'image/png'}, PNG + handler.path.encode())
+    crawler = HttpCrawler(server.netloc)
+    crawler.images = ImageStore(os.path.join(tmp_path, 'images'))
+    first = crawler.get(server.url('/image'), params={'id': 1}, hint='image').content
+    second = crawler.get(server.url('/image'), params={'id': 2}, hint='image').content
+    assert first.read().startswith(PNG) and first != second
+    assert crawler.get(server.url('/image'), params={'id': 1}, hint='image').content == first
+    assert server.hits['/image'] == 2
+
+
+def test_store_deduplicates_content(tmp_path):
+    store = ImageStore(os.path.join(tmp_path, 'images'))
+    first = store.put([PNG[:8], PNG[8:]], url='a', name='a')
+    assert store.put([PNG], url='b') == first
+    assert store.lookup('b').path == first.path
+    assert store.lookup('missing') is None
+    assert store.put([b'not an image']) is None
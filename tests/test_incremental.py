@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+from cutils import SnapshotStore, iter_all
+from cutils.incremental import ADDED, CHANGED, REMOVED, deferred, incremental
+
+from helpers import ListCrawler, products
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(os.path.join(tmp_path, 'snapshots.db'))
+
+
+def changes(records):
+    return sorted((record['description'], record['change']) for record in records)
+
+
+def test_store_replaces_snapshots(store):
+    store.save('crawler', 'query', {'a': '1', 'b': '2'})
+    store.save('crawler', 'query', {'c': '3'})
+    assert store.load('crawler', 'query') == {'c': '3'}
+    assert store.load('crawler', 'other') == {}
+    store.delete('crawler', 'query')
+    assert store.load('crawler', 'query') == {}
+
+
+def test_emits_added_changed_and_removed(store):
+    crawler = ListCrawler(products(3))
+    assert changes(incremental(crawler.fetch('x'), store, crawler, 'x')) == [
+        ('tyre 0', ADDED), ('tyre 1', ADDED), ('tyre 2', ADDED)]
+
+    # Unchanged products are not emitted again
+    assert list(incremental(crawler.fetch('x'), store, crawler, 'x')) == []
+
+    # Price change, removal and addition
+    crawler.products = [dict(products(1)[0], price='9,00'), products(4)[3]]
+    assert changes(incremental(crawler.fetch('x'), store, crawler, 'x')) == [
+        ('TYRE 1', REMOVED), ('TYRE 2', REMOVED), ('tyre 0', CHANGED), ('tyre 3', ADDED)]
+
+
+def test_empty_fetch_keeps_snapshot(store):
+    crawler = ListCrawler(products(2))
+    list(incremental(crawler.fetch('x'), store, crawler, 'x'))
+    crawler.products = []
+    assert list(incremental(crawler.fetch('x'), store, crawler, 'x')) == []
+    crawler.products = products(2)
+    assert list(incremental(crawler.fetch('x'), store, crawler, 'x')) == []
+
+
+def test_abandoned_stream_keeps_snapshot(store):
+    crawler = ListCrawler(products(3))
+    stream = incremental(crawler.fetch('x'), store, crawler, 'x')
+    next(stream)
+    stream.close()
+    assert len(list(incremental(crawler.fetch('x'), store, crawler, 'x'))) == 3
+
+
+def test_deferred_saves_wait_for_caller(store):
+    crawler = ListCrawler(products(2))
+    saves = list()
+    with deferred(saves):
+        list(incremental(crawler.fetch('x'), store, crawler, 'x'))
+    assert len(saves) == 1
+    assert len(list(incremental(crawler.fetch('x'), store, crawler, 'x'))) == 2
+    saves[0]()
+    assert list(incremental(crawler.fetch('x'), store, crawler, 'x')) == []
+
+
+def test_duplicate_keys_are_tracked_per_offer(store):
+    crawler = ListCrawler(products(1) + [dict(products(1)[0], price='5,00')])
+    assert changes(incremental(crawler.fetch('x'), store, crawler, 'x')) == [('tyre 0', ADDED), ('tyre 0', ADDED)]
+    assert list(incremental(crawler.fetch('x'), store, crawler, 'x')) == []
+
+
+def test_limit_does_not_lose_added_records(store):
+    crawler = ListCrawler(products(40))
+    assert len(list(iter_all([crawler], ('x', None), snapshots=store, limit=5, batch_size=40))) == 5
+    assert len(list(iter_all([crawler], ('x', None), snapshots=store))) == 40
+    assert list(iter_all([crawler], ('x', None), snapshots=store)) == []
+
+
+def test_closed_consumer_does_not_lose_added_records(store):
+    crawler = ListCrawler(products(40))
+    stream = iter_all([crawler], ('x', None), snapshots=store, batch_size=40)
+    next(stream)
+    stream.close()
+    assert len(list(iter_all([crawler], ('x', None), snapshots=store))) == 40
@@ -0,0 +1,186 @@
+import os
+import time
+import pickle
+import threading
+
+from functools import partial
+from datetime import datetime, timezone
+
+import pytest
+
+from cutils import SnapshotStore, SQLiteJobQueue
+from cutils.job_worker import build_crawler, work
+from cutils.safe_pickle import SafeUnpickler
+from cutils.tyre_product import TyreProduct
+from cutils.fetch_queued import iter_queued, job_options, job_spec
+
+from helpers import HttpCrawler, ListCrawler, LoginCrawler, products
+
+
+def build() -> ListCrawler:
+    return ListCrawler(list())
+
+
+def build_login() -> LoginCrawler:
+    return LoginCrawler('localhost')
+
+
+class EmptyCrawler(ListCrawler):
+    def __init__(self) -> None:
+        super().__init__(list())
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SQLiteJobQueue(os.path.join(tmp_path, 'jobs.db'))
+
+
+def crawler(*args, **kwargs) -> ListCrawler:
+    crawler = ListCrawler(*args, **kwargs)
+    crawler.FACTORY = f'{__name__}:build'
+    return crawler
+
+
+def workers(queue, count=2):
+
+    # Start worker threads exiting once the queue stays idle
+    threads = [threading.Thread(target=work, args=(queue, f'worker-{index}'), kwargs=dict(poll_interval=0.02, idle_timeout=0.5))
+               for index in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_claims_jobs_once_in_order(queue):
+    first, second = queue.submit('run', b'a'), queue.submit('run', b'b')
+    assert queue.claim('w1', 60) == (first, b'a')
+    assert queue.claim('w2', 60) == (second, b'b')
+    assert queue.claim('w3', 60) is None
+
+
+def test_reclaims_expired_leases(queue):
+    job = queue.submit('run', b'a')
+    queue.claim('w1', 0.01)
+    time.sleep(0.02)
+    assert queue.claim('w2', 60) == (job, b'a')
+
+    # Former worker can no longer push or complete the job
+    assert not queue.push(job, 'w1', b'x', 60)
+    queue.complete(job, 'w1')
+    assert queue.poll('run') == []
+
+
+def test_push_and_complete_append_results(queue):
+    job = queue.submit('run', b'a')
+    queue.claim('w1', 60)
+    assert queue.push(job, 'w1', b'x', 60)
+    queue.complete(job, 'w1')
+    results = queue.poll('run')
+    assert [(result_job, payload) for _, result_job, payload in results] == [(job, b'x'), (job, None)]
+    assert queue.poll('run', results[0][0]) == results[1:]
+    assert queue.poll('other') == []
+
+
+def test_cancel_stops_pushes_and_purge_drops_rows(queue):
+    job = queue.submit('run', b'a')
+    queue.claim('w1', 60)
+    queue.push(job, 'w1', b'x', 60)
+    queue.cancel('run')
+    assert not queue.push(job, 'w1', b'y', 60)
+    queue.purge('run')
+    assert queue.poll('run') == []
+    assert queue.claim('w1', 60) is None
+
+
+def test_job_spec_keeps_credentials_out(server):
+    crawler = HttpCrawler(server.netloc)
+    crawler.FACTORY = f'{__name__}:build_login'
+    spec = job_spec(crawler, ('x', None))
+    assert b'password' not in spec
+    options = pickle.loads(spec)['options']
+    assert 'session' not in options and 'username' not in options
+    assert pickle.loads(spec)['state'] is None
+
+
+def test_job_spec_requires_a_factory(server):
+    with pytest.raises(ValueError):
+        job_spec(HttpCrawler(server.netloc), ('x', None))
+    assert pickle.loads(job_spec(EmptyCrawler(), ('x', None)))['crawler'] == f'{__name__}:EmptyCrawler'
+
+
+def test_workers_reuse_the_callers_session(server):
+    crawler = LoginCrawler(server.netloc)
+    crawler.FACTORY = f'{__name__}:build_login'
+    crawler.login()
+    built = build_crawler(pickle.loads(job_spec(crawler, ('x', None))))
+    assert built.authenticated
+    assert built.login() and built.logins == 1
+
+
+def test_job_options_reject_unpicklable_values():
+    crawler = ListCrawler(list())
+    crawler.hook = lambda: None
+    with pytest.raises(ValueError):
+        job_options(crawler)
+
+
+def test_build_crawler_applies_options():
+    built = build_crawler(pickle.loads(job_spec(crawler(products(2), delay=0.5), ('x', None))))
+    assert isinstance(built, ListCrawler)
+    assert built.products == products(2) and built.delay == 0.5
+
+
+def test_workers_run_every_job(queue):
+    threads = workers(queue)
+    result = list(iter_queued(queue, [crawler(products(30))], ('x', None), ('y', None), batch_size=7, poll_interval=0.02))
+    for thread in threads:
+        thread.join()
+    assert len(result) == 60
+    assert {product['term'] for product in result} == {'x', 'y'}
+
+
+def test_deadline_reaches_workers(queue):
+    late = list()
+    threads = workers(queue, 1)
+    started = time.monotonic()
+    list(iter_queued(queue, [crawler(products(100), delay=0.05)], ('x', None), batch_size=1, poll_interval=0.02,
+                     timeout=0.3, on_timeout=lambda crawler, query: late.append(query)))
+    assert late == [('x', None)]
+    for thread in threads:
+        thread.join()
+
+    # Worker gave up the job at the deadline (not after fetching every product)
+    assert time.monotonic() - started < 2
+
+
+def test_failed_jobs_are_reported(queue, caplog):
+    failed = list()
+    threads = workers(queue, 1)
+    source = crawler(products(3), error=RuntimeError('boom'))
+    result = list(iter_queued(queue, [source], ('x', None), batch_size=1, poll_interval=0.02,
+                              on_error=lambda crawler, query, error: failed.append((query, error))))
+    assert len(result) == 3
+    assert failed == [(('x', None), "RuntimeError('boom')")]
+
+    # Failures are logged by the caller if it doesn't handle them
+    assert len(list(iter_queued(queue, [source], ('x', None), batch_size=1, poll_interval=0.02))) == 3
+    assert "RuntimeError('boom')" in caplog.text
+    for thread in threads:
+        thread.join()
+
+
+def test_messages_are_read_as_plain_data():
+    product = TyreProduct(description='x', stock=(None, 4, None), delivery=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    assert SafeUnpickler.loads(pickle.dumps([product]))[0].to_dict() == product.to_dict()
+    with pytest.raises(pickle.UnpicklingError):
+        SafeUnpickler.loads(pickle.dumps(partial(os.remove, 'nothing')))
+
+
+def test_snapshots_are_saved_by_the_caller(queue, tmp_path):
+    snapshots = SnapshotStore(os.path.join(tmp_path, 'snapshots.db'))
+    threads = workers(queue)
+    source = crawler(products(5))
+    assert len(list(iter_queued(queue, [source], ('x', None), poll_interval=0.02, snapshots=snapshots))) == 5
+    assert list(iter_queued(queue, [source], ('x', None), poll_interval=0.02, snapshots=snapshots)) == []
+    for thread in threads:
+        thread.join()
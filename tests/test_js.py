@@ -0,0 +1,97 @@
+import math
+
+import pytest
+
+from cutils import js
+
+
+def test_extracts_assigned_literals():
+    source = '''
+        var products = [{"id": 1, name: 'A\\u00e9', price: 1.5e1, tags: ['x',, 'y']}];
+        window.config = {enabled: true, missing: null, hex: 0x1F, neg: -2};
+    '''
+    values = js.extract(source, 'products', 'config')
+    assert values['products'] == [{'id': 1, 'name': 'Aé', 'price': 15.0, 'tags': ['x', None, 'y']}]
+    assert values['config'] == {'enabled': True, 'missing': None, 'hex': 31, 'neg': -2}
+
+
+def test_extracts_object_properties_and_quoted_keys():
+    values = js.extract('init({"items": [1, 2], total: 2})', 'items', 'total')
+    assert values == {'items': [1, 2], 'total': 2}
+
+
+def test_skips_non_literal_and_commented_assignments():
+    source = '''
+        // products = 1;
+        var products = compute(2);
+        var products = [3];
+    '''
+    assert js.extract(source, 'products') == {'products': [3]}
+
+
+def test_keeps_urls_on_the_line():
+    assert js.extract('var url = "http://example.com"; var page = 2;', 'page') == {'page': 2}
+
+
+def test_skips_expressions_starting_with_a_literal():
+    assert js.extract('var total = 1 + other; var total = 5;', 'total') == {'total': 5}
+
+
+def test_ignores_names_inside_other_names():
+    assert js.extract('var subtotal = 1; var total = 2;', 'total') == {'total': 2}
+
+
+def test_returns_nothing_for_missing_names():
+    assert js.extract('var a = 1;', 'b') == {}
+    assert js.extract('var a = 1;') == {}
+
+
+def test_decodes_named_numbers():
+    values = js.extract('a = NaN; b = Infinity; c = -Infinity;', 'a', 'b', 'c')
+    assert math.isnan(values['a'])
+    assert values['b'] == math.inf
+    assert values['c'] == -math.inf
+
+
+def test_decodes_escapes_and_surrogate_pairs():
+    assert js.string(r'"\x41\n\u{1F600}😀"') == 'A\n\U0001F600\U0001F600'
+
+
+def test_rejects_template_substitutions():
+    with pytest.raises(ValueError):
+        js.literal('`a ${b}`')
+
+
+def test_rejects_invalid_names():
+    with pytest.raises(TypeError):
+        js.extract('a = 1', 1)
+
+
+def test_matches_syntax_tree_extraction():
+    pytest.importorskip('calmjs.parse')
+    from cutils.decoding import shared_parser
+    source = 'var data = {"a": [1, 2, {"b": "c"}], "d": false};'
+    assert js.extract(source, 'data') == js.extract_tree(shared_parser().parse(source), 'data')
+
+
+def test_ignores_names_inside_strings_and_comments():
+    assert js.extract('var base = "a//b"; var products = [1, 2];', 'products') == {'products': [1, 2]}
+    assert js.extract('/* var products = [9]; */ var products = [1];', 'products') == {'products': [1]}
+    assert js.extract('var s = "products = [5]"; var products = [1];', 'products') == {'products': [1]}
+    assert js.extract('var s = `products = [5]`; var products = [1];', 'products') == {'products': [1]}
+
+
+def test_skips_regular_expressions():
+    assert js.extract('var r = /"products = [5]/g; var products = [1];', 'products') == {'products': [1]}
+    assert js.extract('var half = total / 2; var products = [3];', 'products') == {'products': [3]}
+
+
+def test_matches_dotted_names():
+    assert js.extract('window.config = {a: 1};', 'config') == {'config': {'a': 1}}
+    assert js.extract('window.config = {a: 1};', 'window.config') == {'window.config': {'a': 1}}
+
+
+def test_tokenizes_lazily():
+    tokens = js.tokenize('return /a"b/.test(x) / 2 // done')
+    assert next(tokens) == ('name', 'return', 6)
+    assert [kind for kind, _, _ in tokens] == ['regex', 'punct', 'name', 'punct', 'name', 'punct', 'punct', 'number']
@@ -0,0 +1,18 @@
+from cutils.merge import merge_best, offer_rank, product_key
+
+
+def test_ranks_offers_by_price_stock_and_delivery():
+    assert offer_rank({'price': '10,00'}) < offer_rank({'price': '11,00'})
+    assert offer_rank({'price': 10.0, 'stock': '20'}) < offer_rank({'price': 10.0, 'stock': (None, 5, None)})
+    assert offer_rank({}) == (float('inf'), 0, float('inf'))
+
+
+def test_keys_products_by_description_and_brand():
+    assert product_key({'description': ' tyre  1 ', 'brand': 'michelin'}) == ('TYRE 1', 'Michelin')
+    assert product_key({'description': None}) is None
+
+
+def test_merge_emits_improving_offers():
+    offers = [{'description': 'a', 'price': '10,00'}, {'description': 'a', 'price': '12,00'},
+              {'description': 'a', 'price': '9,00'}, {'description': None, 'price': '1,00'}]
+    assert [offer['price'] for offer in merge_best(offers)] == ['10,00', '9,00', '1,00']
@@ -0,0 +1,46 @@
+from cutils.normalization import (normalize_brand, normalize_consumption_or_grip, normalize_decibels, normalize_noise,
+                                  normalize_price, normalize_records, normalize_stock, normalize_text)
+
+
+def test_normalizes_text_fields():
+    assert normalize_text('  a \n b  ') == 'a b'
+    assert normalize_text('   ') is None
+    assert normalize_brand('michelin  (pt)') == 'Michelin'
+    assert normalize_consumption_or_grip(' class b ') == 'B'
+    assert normalize_decibels('71 dB') == 71
+    assert normalize_decibels('00') is None
+    assert normalize_noise('b') == 2
+    assert normalize_noise(' 2 ') == 2
+
+
+def test_normalizes_prices():
+    assert normalize_price('1.234,56 €') == 1234.56
+    assert normalize_price('1,234.56', prefer_period=True) == 1234.56
+    assert normalize_price('12') == 12.0
+    assert normalize_price('free') is None
+
+
+def test_normalizes_stock():
+    assert normalize_stock('+ 20 units') == ('>', 20, 'units')
+    assert normalize_stock('< 1') == (None, 0, None)
+    assert normalize_stock('none') == (None, 0, None)
+
+
+def test_normalizers_use_custom_text_parser():
+    assert normalize_brand('michelin', str.upper) == 'Michelin'
+    assert normalize_consumption_or_grip('x', lambda text: 'A') == 'A'
+    assert normalize_stock('5 units', lambda text: 'parsed') == (None, 5, 'parsed')
+
+
+def test_normalize_records_memoizes_per_field():
+    calls = list()
+
+    def brand(value):
+        calls.append(value)
+        return value.upper()
+
+    rows = [{'brand': 'a'}, {'brand': 'a'}, {'brand': ['b']}, {'other': 1}]
+    records = normalize_records(rows, {'brand': lambda value: brand(value) if isinstance(value, str) else value})
+    assert records == [{'brand': 'A'}, {'brand': 'A'}, {'brand': ['b']}, {'other': 1}]
+    assert calls == ['a']
+    assert rows[0] == {'brand': 'a'}
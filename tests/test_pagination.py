@@ -0,0 +1,39 @@
+import pytest
+
+from cutils.cancellation import CancellationToken, Cancelled, cancellation
+
+from helpers import HttpCrawler, LoginCrawler
+
+
+def test_fetch_many_logs_in_once(server):
+    crawler = LoginCrawler(server.netloc)
+    assert [product['description'] for product in crawler.fetch_many(['a', ('b', 1), 'c'])] == ['a', 'b', 'c']
+    assert crawler.logins == 1
+
+
+def test_fetch_many_stops_between_terms_once_cancelled(server):
+    token = CancellationToken()
+    fetched = list()
+    with cancellation(token), pytest.raises(Cancelled):
+        for product in LoginCrawler(server.netloc).fetch_many(['a', 'b']):
+            fetched.append(product['description'])
+            token.cancel()
+    assert fetched == ['a']
+
+
+def test_paginate_prefetches_only_needed_pages(server):
+    requested = list()
+
+    def page(number):
+        requested.append(number)
+        return number
+
+    def parse(number):
+        return [number] * (10 if number < 5 else 3)
+
+    crawler = HttpCrawler(server.netloc)
+    assert len(list(crawler.paginate(page, parse, 25, page_size=10))) == 25
+    assert sorted(requested) == [1, 2, 3]
+    requested.clear()
+    assert len(list(crawler.paginate(page, parse, 100))) == 43
+    assert requested == [1, 2, 3, 4, 5]
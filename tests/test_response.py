@@ -0,0 +1,121 @@
+import sys
+import subprocess
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import pytest
+
+from cutils.response import Response
+
+from helpers import PNG, HttpCrawler
+
+
+def paragraphs(html):
+    return [paragraph.get_text() for paragraph in html.find_all('p')]
+
+
+def response(body, content_type=None, hint=None, status_code=200):
+    headers = dict() if content_type is None else {'Content-Type': content_type}
+    return Response(HttpCrawler('example.com'), body, status_code, urlparse('http://example.com/?q=a'),
+                    headers=headers, reason='Reason', hint=hint)
+
+
+def test_sniffs_kind_from_content_type_and_body():
+    assert response(b'{"a": 1}', 'application/json').kind == 'json'
+    assert response(b'{"a": 1}', 'text/html').kind == 'json'
+    assert response(b'{"a": 1}', 'application/vnd.api+json').kind == 'json'
+    assert response(b'<p>a</p>', 'text/html; charset=utf-8').kind == 'html'
+    assert response(b'<p>a</p>').kind == 'html'
+    assert response(PNG).kind == 'image'
+    assert response(b'var a = 1;').kind == 'js'
+    assert response(b'var a = 1;', hint='json').kind == 'json'
+
+
+def test_decodes_lazily_and_once():
+    page = response(b'{"a": [1, 2]}')
+    assert page.content == {'a': [1, 2]}
+    assert page.content is page.json
+    assert response(PNG, 'image/png').content.startswith('data:image/png;base64,')
+
+
+def test_falls_back_to_html_on_mislabelled_content():
+    assert response(b'not json', 'application/json').content.get_text() == 'not json'
+
+
+def test_unpacks_like_a_tuple():
+    content, status_code, url, query = response(b'{"a": 1}')
+    assert (content, status_code, url.netloc, query) == ({'a': 1}, 200, 'example.com', {'q': ['a']})
+    assert response(b'x', status_code=404).content == 'Reason'
+    assert response(b'').content is None
+
+
+def test_rejects_unknown_hints():
+    with pytest.raises(ValueError):
+        response(b'x', hint='xml')
+
+
+def test_html_parser_and_strainer_are_configurable():
+    from bs4 import SoupStrainer
+    page = response(b'<div><p>a</p></div><span>b</span>', 'text/html')
+    page.parser, page.parse_only = 'html.parser', SoupStrainer('span')
+    assert page.html.get_text() == 'b'
+
+    # Html5lib always builds the whole document
+    page = response(b'<div><p>a</p></div><span>b</span>', 'text/html')
+    page.parser, page.parse_only = 'html5lib', SoupStrainer('span')
+    assert page.html.get_text() == 'ab'
+
+
+def test_rejects_unknown_html_parsers():
+    page = response(b'<p>a</p>', 'text/html')
+    page.parser = 'unknown'
+    with pytest.raises(ValueError):
+        page.html
+
+
+def test_offload_decodes_in_executor():
+    page = response(b'<p>a</p><p>b</p>', 'text/html')
+    assert page.offload(lambda html: len(html.find_all('p'))).result() == 2
+    page.crawler.executor = ThreadPoolExecutor(1)
+    try:
+        assert page.offload(lambda html: html.find('p').get_text()).result() == 'a'
+        with pytest.raises(ValueError):
+            page.offload(kind='js')
+    finally:
+        page.crawler.executor.shutdown()
+
+
+def test_offload_decodes_in_worker_processes():
+    page = response(b'<p>a</p><p>b</p>', 'text/html')
+    with ProcessPoolExecutor(1) as executor:
+        page.crawler.executor = executor
+        assert page.offload(paragraphs).result() == ['a', 'b']
+        with pytest.raises(ValueError):
+            page.offload(kind='json').result()
+
+
+def test_literals_fall_back_to_syntax_tree():
+    pytest.importorskip('calmjs.parse')
+    page = response(b'var a = [1, 2]; var b = {c: [a.length, 3]}["c"];', 'text/javascript')
+    assert page.literals('a') == {'a': [1, 2]}
+    assert page.literals('a', 'missing', fallback=False) == {'a': [1, 2]}
+
+
+def test_import_and_decoding_load_heavy_dependencies_lazily():
+    script = '''
+import sys
+import cutils
+from urllib.parse import urlparse
+from cutils.response import Response
+loaded = lambda: sorted(name for name in ('bs4', 'calmjs', 'dateparser') if name in sys.modules)
+print(loaded())
+from helpers import HttpCrawler
+Response(HttpCrawler('example.com'), b'{"a": 1}', 200, urlparse('http://example.com')).content
+print(loaded())
+Response(HttpCrawler('example.com'), b'<p>a</p>', 200, urlparse('http://example.com')).content
+print(loaded())
+'''
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True,
+                            env={'PYTHONPATH': ':'.join(sys.path)}).stdout.split('\n')
+    assert output[:3] == ['[]', '[]', "['bs4']"]
@@ -0,0 +1,86 @@
+import time
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from cutils.cancellation import CancellationToken, Cancelled
+from cutils.rate_limiter import RateLimiter
+from cutils.retry import MAX_DELAY, backoff, overloaded, retry_after
+
+
+def test_retry_after_parses_seconds_and_dates():
+    assert retry_after(None) is None
+    assert retry_after(' 3 ') == 3.0
+    assert retry_after('not a date') is None
+    date = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < retry_after(format_datetime(date)) <= 30
+    assert retry_after(format_datetime(datetime.now(timezone.utc) - timedelta(days=1))) == 0.0
+
+
+def test_retry_after_is_clamped():
+    assert retry_after('86400') == MAX_DELAY
+    assert retry_after('86400', 5.0) == 5.0
+    assert retry_after(format_datetime(datetime.now(timezone.utc) + timedelta(days=1))) == MAX_DELAY
+
+
+def test_backoff_honors_server_delay():
+    for attempt in range(5):
+        assert 0 <= backoff(attempt, 0.1) <= 0.1 * 2 ** attempt
+    assert backoff(0, 0.1, 2.0) == 2.0
+
+
+def test_overloaded_statuses():
+    assert overloaded(429) and overloaded(500) and overloaded(503)
+    assert not overloaded(200) and not overloaded(404)
+
+
+def test_limiter_spaces_requests():
+    limiter = RateLimiter(20)
+    started = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert 0.15 <= time.monotonic() - started < 1
+
+
+def test_limiter_adapts_rate():
+    limiter = RateLimiter(10, maximum=11, latency=1.0)
+    limiter.failure()
+    assert limiter.rate == 5
+    limiter.success()
+    assert limiter.rate == 5.1
+    limiter.success(2.0)
+    assert limiter.rate == 2.55
+    for _ in range(1000):
+        limiter.success()
+    assert limiter.rate == 11
+
+
+def test_limiter_pauses_on_server_delay():
+    limiter = RateLimiter(100, minimum=50)
+    limiter.failure(0.2)
+    assert limiter.acquire() >= 0.15
+
+
+def test_limiter_acquire_is_cancellable():
+    limiter = RateLimiter(100)
+    limiter.failure(10)
+    started = time.monotonic()
+    with pytest.raises(Cancelled):
+        limiter.acquire(CancellationToken(0.1))
+    assert time.monotonic() - started < 1
+
+
+def test_limiters_are_shared_per_netloc():
+    assert RateLimiter.for_netloc('shared.test', 5) is RateLimiter.for_netloc('shared.test', 50)
+    assert RateLimiter.for_netloc('shared.test', 5) is not RateLimiter.for_netloc('other.test', 5)
+
+
+def test_limiter_rejects_invalid_options():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+    with pytest.raises(ValueError):
+        RateLimiter(1, burst=0)
+    with pytest.raises(ValueError):
+        RateLimiter(1, decrease=1)
@@ -0,0 +1,86 @@
+import time
+import threading
+
+import pytest
+
+from cutils.scheduler import Scheduler
+
+
+def run(scheduler, tasks):
+    for key, task in tasks:
+        scheduler.submit(key, task)
+    scheduler.close()
+    scheduler.join()
+
+
+def tracked(key, running, peaks, lock, delay=0.02):
+
+    # Build task recording the peak concurrency of its key
+    def task():
+        with lock:
+            running[key] = running.get(key, 0) + 1
+            peaks[key] = max(peaks.get(key, 0), running[key])
+        time.sleep(delay)
+        with lock:
+            running[key] -= 1
+    return task
+
+
+def test_runs_every_task():
+    done = list[int]()
+    lock = threading.Lock()
+
+    def task(index):
+        with lock:
+            done.append(index)
+
+    run(Scheduler(3), [('key', lambda index=index: task(index)) for index in range(20)])
+    assert sorted(done) == list(range(20))
+
+
+def test_limits_concurrency_per_key():
+    running, peaks, lock = dict(), dict(), threading.Lock()
+    tasks = [(key, tracked(key, running, peaks, lock)) for key in ('a', 'b') for _ in range(6)]
+    run(Scheduler(8, 2), tasks)
+    assert peaks == {'a': 2, 'b': 2}
+
+
+def test_limits_workers():
+    running, peaks, lock = dict(), dict(), threading.Lock()
+    run(Scheduler(3), [('key', tracked('key', running, peaks, lock)) for _ in range(10)])
+    assert peaks['key'] <= 3
+
+
+def test_serves_keys_round_robin():
+    order = list[str]()
+    lock = threading.Lock()
+
+    def task(key):
+        with lock:
+            order.append(key)
+
+    # Submit every task of a before b (one worker runs them strictly in turn)
+    scheduler = Scheduler(1)
+    blocker = threading.Event()
+    scheduler.submit('blocker', blocker.wait)
+    for key in ('a', 'a', 'a', 'b', 'b', 'b'):
+        scheduler.submit(key, lambda key=key: task(key))
+    blocker.set()
+    scheduler.close()
+    scheduler.join()
+    assert order == ['a', 'b', 'a', 'b', 'a', 'b']
+
+
+def test_rejects_tasks_once_closed():
+    scheduler = Scheduler(1)
+    scheduler.close()
+    with pytest.raises(RuntimeError):
+        scheduler.submit('key', lambda: None)
+    scheduler.join()
+
+
+def test_rejects_invalid_options():
+    with pytest.raises(ValueError):
+        Scheduler(0)
+    with pytest.raises(ValueError):
+        Scheduler(1, 0)
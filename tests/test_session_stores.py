@@ -0,0 +1,50 @@
+import os
+import time
+
+import pytest
+
+from cutils import FileSessionStore, MemorySessionStore, SQLiteSessionStore
+
+from helpers import LoginCrawler
+
+# Define session key (crawler class, netloc, username)
+KEY = ('crawler.Crawler', 'example.com', 'user')
+
+
+@pytest.fixture(params=['memory', 'file', 'sqlite'])
+def store(request, tmp_path):
+    if request.param == 'memory':
+        return MemorySessionStore()
+    elif request.param == 'file':
+        return FileSessionStore(os.path.join(tmp_path, 'sessions'))
+    return SQLiteSessionStore(os.path.join(tmp_path, 'sessions.db'))
+
+
+def test_stores_sessions_until_they_expire(store):
+    assert store.get(KEY) is None
+    store.put(KEY, b'state', time.time() + 60)
+    assert store.get(KEY) == b'state'
+    assert store.get(('crawler.Crawler', 'example.com', 'other')) is None
+    store.put(KEY, b'expired', time.time() - 1)
+    assert store.get(KEY) is None
+
+
+def test_deletes_sessions(store):
+    store.put(KEY, b'state', time.time() + 60)
+    store.delete(KEY)
+    store.delete(KEY)
+    assert store.get(KEY) is None
+
+
+def test_crawlers_reuse_stored_sessions(server):
+    store = MemorySessionStore()
+    first, second = LoginCrawler(server.netloc), LoginCrawler(server.netloc)
+    first.store = second.store = store
+    assert list(first.fetch('a')) == [{'description': 'a'}]
+    assert list(second.fetch('b')) == [{'description': 'b'}]
+    assert (first.logins, second.logins) == (1, 0)
+
+    # Invalidated sessions log in again
+    second.invalidate()
+    list(second.fetch('c'))
+    assert second.logins == 1
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from cutils import TyreCrawler, TyreProducts
+
+
+class Supplier(TyreCrawler):
+    def __init__(self):
+        super().__init__('user', 'password', 'example.com')
+
+    def _fetch(self, term, quantity):
+        return iter(())
+
+
+class ShoutingSupplier(Supplier):
+    def parse_text(self, text):
+        text = super().parse_text(text)
+        return None if text is None else text.upper()
+
+
+def test_parse_methods_normalize_raw_values():
+    crawler = Supplier()
+    assert crawler.parse_brand(' michelin (pt) ') == 'Michelin'
+    assert crawler.parse_description(' tyre  205 ') == 'TYRE 205'
+    assert crawler.parse_price('1.234,56') == 1234.56
+    assert crawler.parse_stock('> 4 units') == ('>', 4, 'units')
+    assert crawler.parse_stock(2.0) == (None, 2, None)
+    assert crawler.parse_noise('b') == 2 and crawler.parse_decibels(0) is None
+    assert crawler.parse_image('/images/tyre.png') == ('https://example.com/images/tyre.png', 'tyre')
+
+
+def test_parse_text_overrides_are_honored():
+    crawler = ShoutingSupplier()
+    assert crawler.parse_stock('5 units') == (None, 5, 'UNITS')
+    assert crawler.parse_brand('michelin') == 'Michelin'
+
+    # Memoized results of the default parser are not reused by the override
+    assert Supplier().parse_stock('5 units') == (None, 5, 'units')
+    assert crawler.parse_stock('5 units') == (None, 5, 'UNITS')
+
+
+def test_normalizers_run_once_per_value():
+    calls = list()
+
+    class CountingSupplier(Supplier):
+        def parse_text(self, text):
+            calls.append(text)
+            return super().parse_text(text)
+
+    CountingSupplier().parse_stock('3 left')
+    assert len(calls) == 1
+
+
+def test_normalize_products_builds_batch():
+    rows = [{'description': 'a', 'brand': 'michelin', 'price': '10,00', 'stock': '+4', 'delivery': datetime(2024, 1, 1)},
+            {'description': 'b', 'brand': 'michelin', 'price': 5, 'url': 'u'}]
+    products = Supplier().normalize_products(rows)
+    assert isinstance(products, TyreProducts) and len(products) == 2
+    assert products[0].description == 'A' and products[0].stock == ('>', 4, None)
+    assert products[1].price == 5.0 and products[1]['url'] == 'u' and products[1].crawler == str(Supplier())
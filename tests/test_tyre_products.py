@@ -0,0 +1,52 @@
+import math
+
+from datetime import datetime
+
+import pytest
+
+from cutils.tyre_product import TyreProduct
+from cutils.tyre_products import TyreProducts
+
+
+def test_product_keeps_extra_fields():
+    product = TyreProduct.from_dict({'description': 'a', 'price': 1.0, 'url': 'u'}, crawler='c')
+    assert product.crawler == 'c' and product['url'] == 'u' and product.get('missing') is None
+    assert product.to_dict()['url'] == 'u'
+    with pytest.raises(KeyError):
+        product['missing']
+
+
+def test_batch_round_trips_products():
+    delivery = datetime(2024, 5, 20)
+    product = TyreProduct(crawler='c', description='a', brand='b', price=9.5, stock=('>', 20, 'units'),
+                          delivery=delivery, noise=2, decibels=71, grip='A', consumption='B', extra={'url': 'u'})
+    batch = TyreProducts([product, {'description': 'b'}])
+    assert len(batch) == 2
+    assert batch[0] == product
+    assert batch[1].price is None and batch[1].stock == (None, 0, None) and batch[1].delivery is None
+    assert list(batch.column('quantity')) == [20, 0]
+    assert math.isnan(batch.column('price')[1])
+    assert set(batch.columns()) >= {'price', 'description', 'extra'}
+    with pytest.raises(KeyError):
+        batch.column('missing')
+
+
+@pytest.mark.parametrize('stock, expected', [
+    (None, (None, 0, None)),
+    ('+ 20', ('>', 20, None)),
+    (7, (None, 7, None)),
+    (['<', None, 'x'], ('<', 0, 'x')),
+])
+def test_batch_normalizes_raw_stock(stock, expected):
+    assert TyreProducts([{'stock': stock}])[0].stock == expected
+
+
+def test_batch_rejects_unknown_stock():
+    with pytest.raises(TypeError):
+        TyreProducts([{'stock': object()}])
+
+
+def test_batch_exports_numpy_columns():
+    numpy = pytest.importorskip('numpy')
+    columns = TyreProducts([{'price': 1.5, 'description': 'a'}]).to_numpy()
+    assert columns['price'].dtype == numpy.float64 and columns['description'][0] == 'a'